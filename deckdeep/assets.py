@@ -1,94 +1,109 @@
 import pygame
-from typing import Tuple
-from deckdeep.config import (
-    SCREEN_WIDTH,
-    SCREEN_HEIGHT,
-    CARD_WIDTH,
-    CARD_HEIGHT,
-    ICON_SIZE,
-    PLAYER_SIZE,
-)
+from typing import Dict, Tuple
+from deckdeep.events import EVENT_REGISTRY
+from deckdeep.layout import get_layout
 
 
 class GameAssets:
+    # Decoded images at their source resolution, shared by every instance, so
+    # rescale() after a resolution switch never reads the disk again
+    _sources: Dict[str, pygame.Surface] = {}
+
     def __init__(self):
+        self.rescale()
+
+        # Misc
+        self.music_path: str = "./assets/music/"
+        self.sound_path: str = "./assets/sounds/"
+
+    def rescale(self):
+        """(Re)build every surface at the current layout's sizes."""
+        layout = get_layout()
+        screen_size = (layout.width, layout.height)
+        icon_size = (layout.icon_size, layout.icon_size)
+
         # background
         self.background_image: pygame.Surface = self.load_and_scale_background(
-            "./assets/images/backgrounds/background.png", (SCREEN_WIDTH, SCREEN_HEIGHT)
+            "./assets/images/backgrounds/background.png", screen_size
         )
         self.victory_image: pygame.Surface = self.load_and_scale_background(
-            "./assets/images/backgrounds/victory.png", (SCREEN_WIDTH, SCREEN_HEIGHT)
+            "./assets/images/backgrounds/victory.png", screen_size
         )
         self.start_screen_image: pygame.Surface = self.load_and_scale_background(
-            "./assets/images/backgrounds/deckdeep.png", (SCREEN_WIDTH, SCREEN_HEIGHT)
+            "./assets/images/backgrounds/deckdeep.png", screen_size
         )
         self.game_over_image: pygame.Surface = self.load_and_scale_background(
-            "./assets/images/backgrounds/youlost.png", (SCREEN_WIDTH, SCREEN_HEIGHT)
+            "./assets/images/backgrounds/youlost.png", screen_size
         )
 
         # ui elements
         self.parchment_texture: pygame.Surface = self.load_and_scale_ui(
             "./assets/images/ui_elements/parchment_texture.png",
-            (CARD_WIDTH, CARD_HEIGHT),
+            (layout.card_width, layout.card_height),
         )
 
         # icons
         self.attack_icon: pygame.Surface = self.load_and_scale_ui(
-            "./assets/images/icons/attack.png", (ICON_SIZE, ICON_SIZE)
+            "./assets/images/icons/attack.png", icon_size
         )
         self.shield_icon: pygame.Surface = self.load_and_scale_ui(
-            "./assets/images/icons/shield.png", (ICON_SIZE, ICON_SIZE)
+            "./assets/images/icons/shield.png", icon_size
         )
         self.heal_icon: pygame.Surface = self.load_and_scale_ui(
-            "./assets/images/icons/heal.png", (ICON_SIZE, ICON_SIZE)
+            "./assets/images/icons/heal.png", icon_size
         )
         self.energy_icon: pygame.Surface = self.load_and_scale_ui(
-            "./assets/images/icons/energy.png", (ICON_SIZE, ICON_SIZE)
+            "./assets/images/icons/energy.png", icon_size
         )
         self.dice_icon: pygame.Surface = self.load_and_scale_ui(
-            "./assets/images/icons/dice.png", (ICON_SIZE, ICON_SIZE)
+            "./assets/images/icons/dice.png", icon_size
         )
         self.draw_icon: pygame.Surface = self.load_and_scale_ui(
-            "./assets/images/icons/draw.png", (ICON_SIZE, ICON_SIZE)
+            "./assets/images/icons/draw.png", icon_size
         )
         self.health_cost: pygame.Surface = self.load_and_scale_ui(
-            "./assets/images/icons/health_cost.png", (ICON_SIZE, ICON_SIZE)
+            "./assets/images/icons/health_cost.png", icon_size
         )
         self.weakness_icon: pygame.Surface = self.load_and_scale_ui(
-            "./assets/images/icons/weakness.png", (ICON_SIZE, ICON_SIZE)
+            "./assets/images/icons/weakness.png", icon_size
         )
         self.bolster_icon: pygame.Surface = self.load_and_scale_ui(
-            "./assets/images/icons/bolster.png", (ICON_SIZE, ICON_SIZE)
+            "./assets/images/icons/bolster.png", icon_size
         )
         self.burn_icon: pygame.Surface = self.load_and_scale_ui(
-            "./assets/images/icons/burn.png", (ICON_SIZE, ICON_SIZE)
+            "./assets/images/icons/burn.png", icon_size
         )
         # New status effect icons
         self.bleed_icon: pygame.Surface = self.load_and_scale_ui(
-            "./assets/images/icons/bleed.png", (ICON_SIZE, ICON_SIZE)
+            "./assets/images/icons/bleed.png", icon_size
         )
         self.energy_bonus_icon: pygame.Surface = self.load_and_scale_ui(
-            "./assets/images/icons/energy_bonus.png", (ICON_SIZE, ICON_SIZE)
+            "./assets/images/icons/energy_bonus.png", icon_size
         )
         self.health_regain_icon: pygame.Surface = self.load_and_scale_ui(
-            "./assets/images/icons/health_regain.png", (ICON_SIZE, ICON_SIZE)
+            "./assets/images/icons/health_regain.png", icon_size
         )
         self.strength_icon: pygame.Surface = self.load_and_scale_ui(
-            "./assets/images/icons/strength.png", (ICON_SIZE, ICON_SIZE)
+            "./assets/images/icons/strength.png", icon_size
         )
 
         # Units
         self.player: pygame.Surface = self.load_and_scale_ui(
-            "./assets/images/characters/player.png", (PLAYER_SIZE, PLAYER_SIZE)
+            "./assets/images/characters/player.png",
+            (layout.unit_size, layout.unit_size),
         )
 
-        # Misc
-        self.music_path: str = "./assets/music/"
+    @classmethod
+    def source(cls, path: str) -> pygame.Surface:
+        """The image at ``path``, decoded once and kept unscaled."""
+        if path not in cls._sources:
+            cls._sources[path] = pygame.image.load(path)
+        return cls._sources[path]
 
     @staticmethod
     def load_and_scale_background(path: str, size: Tuple[int, int]) -> pygame.Surface:
         try:
-            image = pygame.image.load(path)
+            image = GameAssets.source(path)
             image_ratio = image.get_width() / image.get_height()
             screen_ratio = size[0] / size[1]
 
@@ -119,7 +134,7 @@ class GameAssets:
     @staticmethod
     def load_and_scale_ui(path: str, size: Tuple[int, int]) -> pygame.Surface:
         try:
-            image = pygame.image.load(path)
+            image = GameAssets.source(path)
             return pygame.transform.smoothscale(image, size)
         except:  # noqa: E722
             print(f"Unable to load image: {path}")
@@ -129,8 +144,9 @@ class GameAssets:
             )  # Semi-transparent red border as a placeholder
             return surface
 
-    def load_event_image(self, event_name: str) -> pygame.Surface:
-        path = f"./assets/images/events/{event_name.lower().replace(' ', '_')}.png"
+    def load_event_image(self, event_key: str) -> pygame.Surface:
+        path = f"./assets/images/events/{EVENT_REGISTRY[event_key].image}.png"
+        layout = get_layout()
         return self.load_and_scale_background(
-            path, (SCREEN_WIDTH, int(SCREEN_HEIGHT * 2 / 3))
+            path, (layout.width, int(layout.height * 2 / 3))
         )
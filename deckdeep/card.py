@@ -1,5 +1,6 @@
+import itertools
 import random
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
 from enum import Enum
 from deckdeep.custom_types import Energy
 
@@ -12,6 +13,28 @@ class Rarity(Enum):
     LEGENDARY = 0.5
 
 
+# Interned card definitions: cards with equal gameplay fields share one small int id,
+# which search, snapshots and caches use instead of Card objects
+_definition_ids: Dict[Tuple, int] = {}
+_definitions: List[Tuple] = []
+
+# Identity of each Card object, used by CardPile to index its cards
+_card_ids = itertools.count()
+
+
+def intern_definition(key: Tuple) -> int:
+    try:
+        return _definition_ids[key]
+    except KeyError:
+        _definitions.append(key)
+        index = _definition_ids[key] = len(_definitions) - 1
+        return index
+
+
+def card_definition(index: int) -> Tuple:
+    return _definitions[index]
+
+
 class Card:
     def __init__(
         self,
@@ -52,6 +75,8 @@ class Card:
         self.burn = burn
         self.cleanse = cleanse
         self.num_attacks = num_attacks
+        self._definition_id: Optional[int] = None
+        self._id = next(_card_ids)
 
         # Animation properties
         self.x = 0
@@ -59,6 +84,44 @@ class Card:
         self.opacity = 255
         self.is_animating = False
 
+    def definition_key(self) -> Tuple:
+        return (
+            self.name,
+            self.energy_cost.value,
+            self.rarity.value,
+            self.damage,
+            self.bonus_damage,
+            self.healing,
+            self.shield,
+            self.targets_all,
+            self.card_draw,
+            self.health_cost,
+            self.bleed,
+            self.energy_bonus,
+            self.health_regain,
+            self.weakness,
+            self.bolster,
+            self.burn,
+            self.cleanse,
+            self.num_attacks,
+        )
+
+    @property
+    def id(self) -> int:
+        return self._id
+
+    @property
+    def definition_id(self) -> int:
+        # Card fields are fixed after construction, so intern once per instance
+        if self._definition_id is None:
+            self._definition_id = intern_definition(self.definition_key())
+        return self._definition_id
+
+    @classmethod
+    def from_definition(cls, index: int) -> "Card":
+        name, energy_cost, rarity, *fields = card_definition(index)
+        return cls(name, energy_cost, Rarity(rarity), *fields)
+
     def start_animation(self, start_x: int, start_y: int):
         self.x = start_x
         self.y = start_y
@@ -180,9 +243,19 @@ class Card:
             Card("Triple Slash", 2, Rarity.RARE, damage=5, num_attacks=3),
             Card("Flurry of Blows", 1, Rarity.COMMON, damage=2, num_attacks=2),
         ]
-        return random.choices(
+        chosen = random.choices(
             card_pool, weights=[card.rarity.value for card in card_pool], k=num_cards
         )
+        # The same pool entry can come up twice; every card in a pile must be its
+        # own object
+        return [
+            (
+                card
+                if chosen.index(card) == i
+                else Card.from_definition(card.definition_id)
+            )
+            for i, card in enumerate(chosen)
+        ]
 
     def to_dict(self) -> Dict:
         return {
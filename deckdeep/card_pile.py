@@ -0,0 +1,105 @@
+import random
+from collections.abc import MutableSequence
+from typing import Dict, Iterable, Iterator, List
+
+from deckdeep.card import Card
+
+
+class CardPile(MutableSequence):
+    """An ordered pile of cards (draw pile, hand or discard pile).
+
+    Cards are stored in an insertion-ordered dict keyed by ``Card.id``, so
+    appending, popping the top card, removing a given card and membership tests
+    are O(1). Positional access walks the pile and is meant for the small hand.
+    ``version`` increases on every change, for caches keyed on pile contents.
+    """
+
+    def __init__(self, cards: Iterable[Card] = ()):
+        self._cards: Dict[int, Card] = {}
+        self.version = 0
+        self.extend(cards)
+
+    def __len__(self) -> int:
+        return len(self._cards)
+
+    def __iter__(self) -> Iterator[Card]:
+        return iter(self._cards.values())
+
+    def __reversed__(self) -> Iterator[Card]:
+        return reversed(self._cards.values())
+
+    def __contains__(self, card) -> bool:
+        return isinstance(card, Card) and self._cards.get(card.id) is card
+
+    def __getitem__(self, index):
+        if index == -1 and self._cards:
+            return next(reversed(self._cards.values()))
+        return list(self._cards.values())[index]
+
+    def __setitem__(self, index, value):
+        cards = list(self._cards.values())
+        cards[index] = value
+        self._replace(cards)
+
+    def __delitem__(self, index):
+        cards = list(self._cards.values())
+        del cards[index]
+        self._replace(cards)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (CardPile, list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __add__(self, other: Iterable[Card]) -> List[Card]:
+        return list(self) + list(other)
+
+    def __radd__(self, other: Iterable[Card]) -> List[Card]:
+        return list(other) + list(self)
+
+    def __repr__(self) -> str:
+        return f"CardPile({[card.name for card in self]})"
+
+    def _replace(self, cards: Iterable[Card]):
+        self._cards = {}
+        self.extend(cards)
+
+    def insert(self, index: int, value: Card):
+        if index >= len(self._cards):
+            self.append(value)
+            return
+        cards = list(self._cards.values())
+        cards.insert(index, value)
+        self._replace(cards)
+
+    def append(self, value: Card):
+        if value.id in self._cards:
+            raise ValueError(f"{value.name} is already in this pile")
+        self._cards[value.id] = value
+        self.version += 1
+
+    def remove(self, value: Card):
+        if value not in self:
+            raise ValueError(f"{value.name} is not in this pile")
+        del self._cards[value.id]
+        self.version += 1
+
+    def pop(self, index: int = -1) -> Card:
+        if not self._cards:
+            raise IndexError("pop from empty pile")
+        if index == -1:
+            card = self._cards.popitem()[1]
+            self.version += 1
+            return card
+        card = self[index]
+        self.remove(card)
+        return card
+
+    def clear(self):
+        self._cards.clear()
+        self.version += 1
+
+    def shuffle(self):
+        cards = list(self._cards.values())
+        random.shuffle(cards)
+        self._replace(cards)
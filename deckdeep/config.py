@@ -55,6 +55,10 @@ KEYBINDS = {
         "2": "View relics",
         "3": "View keybinds",
     },
+    "Display": {
+        "F11": "Toggle fullscreen",
+        "F10": "Cycle resolution",
+    },
     "Card Selection": {
         "Q, W, E, R, T, Y, U, I, O, P": "Select and play cards in your hand",
     },
@@ -64,6 +68,9 @@ KEYBINDS = {
     "Combat": {
         "H": "Select previous monster",
         "L": "Select next monster",
+        "F2": "Toggle practice mode",
+        "Z": "Rewind last action (practice mode)",
+        "D": "Toggle draw odds",
     },
     "Event": {
         "Q, W, E, R, T, Y, U, I, O, P": "Select event options",
@@ -0,0 +1,93 @@
+import itertools
+from bisect import bisect_left
+from typing import Dict, Iterable, List, NamedTuple, Tuple
+
+from deckdeep.card import Card
+
+# (energy cost, name, insertion sequence)
+SortKey = Tuple[int, str, int]
+
+
+def is_curse(card: Card) -> bool:
+    return "Curse" in card.name
+
+
+class DeckStats(NamedTuple):
+    size: int
+    mana_curve: Dict[int, int]  # energy cost -> number of cards
+    damage_per_energy: float
+    draw_density: float  # cards drawn per card played
+    curses: int
+
+
+class DeckIndex:
+    """The player's full deck (draw pile, hand and discard pile together), kept
+    sorted by (cost, name) along with running aggregates for a deck summary.
+
+    Cards moving between piles do not change the full deck, so only adding and
+    removing cards touches the index. Both are a bisect plus a list insert.
+    """
+
+    def __init__(self, cards: Iterable[Card] = ()):
+        self.rebuild(cards)
+
+    def rebuild(self, cards: Iterable[Card]):
+        self._sequence = itertools.count()
+        self._keys: List[SortKey] = []
+        self.cards: List[Card] = []
+        # Each card's sort key, by Card.id like CardPile, so removal is a bisect
+        self._card_keys: Dict[int, SortKey] = {}
+        self.mana_curve: Dict[int, int] = {}
+        self.damage = 0
+        self.energy = 0
+        self.card_draw = 0
+        self.curses = 0
+        for card in sorted(cards, key=lambda card: card.energy_cost.value):
+            self.add(card)
+
+    def __len__(self) -> int:
+        return len(self.cards)
+
+    def page(self, page: int, per_page: int) -> List[Card]:
+        return self.cards[page * per_page : (page + 1) * per_page]
+
+    def add(self, card: Card):
+        key = (card.energy_cost.value, card.name, next(self._sequence))
+        position = bisect_left(self._keys, key)
+        self._keys.insert(position, key)
+        self.cards.insert(position, card)
+        self._card_keys[card.id] = key
+        self._count(card, 1)
+
+    def remove(self, card: Card) -> bool:
+        key = self._card_keys.pop(card.id, None)
+        if key is None:
+            return False
+        position = bisect_left(self._keys, key)
+        del self._keys[position]
+        del self.cards[position]
+        self._count(card, -1)
+        return True
+
+    def _count(self, card: Card, sign: int):
+        if is_curse(card):
+            # Curses are unplayable; keep them out of the playable aggregates
+            self.curses += sign
+            return
+        cost = card.energy_cost.value
+        self.mana_curve[cost] = self.mana_curve.get(cost, 0) + sign
+        if not self.mana_curve[cost]:
+            del self.mana_curve[cost]
+        self.damage += sign * card.calculate_total_damage(0, 0)
+        self.energy += sign * cost
+        self.card_draw += sign * card.card_draw
+
+    def stats(self) -> DeckStats:
+        playable = len(self.cards) - self.curses
+        return DeckStats(
+            size=len(self.cards),
+            mana_curve=dict(sorted(self.mana_curve.items())),
+            damage_per_energy=self.damage / self.energy if self.energy else 0.0,
+            draw_density=self.card_draw / playable if playable else 0.0,
+            curses=self.curses,
+        )
@@ -0,0 +1,67 @@
+import time
+from typing import List, Optional, Tuple
+
+import pygame
+
+from deckdeep.assets import GameAssets
+from deckdeep.config import SCREEN_HEIGHT, SCREEN_WIDTH
+from deckdeep.layout import get_layout, set_resolution
+
+Size = Tuple[int, int]
+
+# Windowed resolutions cycled through at runtime, all at the default 3:2 ratio
+RESOLUTIONS: Tuple[Size, ...] = (
+    (1200, 800),
+    (SCREEN_WIDTH, SCREEN_HEIGHT),
+    (1650, 1100),
+    (1920, 1280),
+)
+
+
+class DisplayManager:
+    """Owns the display mode and switches resolution or fullscreen at runtime.
+
+    A resolution switch rebuilds the layout, which drops every cached text,
+    card face and sprite in one step, then rescales ``assets`` from their
+    decoded source images without touching the disk. A fullscreen toggle that
+    keeps the resolution keeps the caches too. Each switch's duration in
+    seconds is appended to ``switch_times``.
+    """
+
+    def __init__(self, size: Size = (SCREEN_WIDTH, SCREEN_HEIGHT), fullscreen=False):
+        self.size = size
+        self.fullscreen = fullscreen
+        self.assets: Optional[GameAssets] = None
+        self.switch_times: List[float] = []
+
+    def set_mode(
+        self, size: Optional[Size] = None, fullscreen: Optional[bool] = None
+    ) -> pygame.Surface:
+        start = time.perf_counter()
+        if size is not None:
+            self.size = size
+        if fullscreen is not None:
+            self.fullscreen = fullscreen
+        flags = pygame.FULLSCREEN if self.fullscreen else 0
+        screen = pygame.display.set_mode(self.size, flags)
+
+        # Fullscreen may not honour the requested size, so lay out for what we got
+        layout = get_layout()
+        if (layout.width, layout.height) != screen.get_size():
+            set_resolution(*screen.get_size())
+            if self.assets is not None:
+                self.assets.rescale()
+        self.switch_times.append(time.perf_counter() - start)
+        return screen
+
+    def toggle_fullscreen(self) -> pygame.Surface:
+        return self.set_mode(fullscreen=not self.fullscreen)
+
+    def cycle_resolution(self) -> pygame.Surface:
+        """Switch to the next entry of RESOLUTIONS (the first one if the current
+        size is not listed)."""
+        if self.size in RESOLUTIONS:
+            index = (RESOLUTIONS.index(self.size) + 1) % len(RESOLUTIONS)
+        else:
+            index = 0
+        return self.set_mode(RESOLUTIONS[index])
@@ -0,0 +1,146 @@
+from collections import Counter
+from functools import lru_cache
+from math import comb
+from typing import Dict, Hashable, List, NamedTuple, Optional, Sequence, Tuple
+
+from deckdeep.card import Card
+from deckdeep.card_pile import CardPile
+from deckdeep.deck_index import is_curse
+from deckdeep.player import Player
+
+
+def card_classes(card: Card) -> Tuple[str, ...]:
+    classes = []
+    if is_curse(card):
+        return ("Curse",)
+    if card.damage:
+        classes.append("Attack")
+    if card.shield or card.healing:
+        classes.append("Defense")
+    if card.card_draw or card.energy_bonus:
+        classes.append("Draw/Energy")
+    if card.bleed or card.burn or card.weakness:
+        classes.append("Debuff")
+    if card.bonus_damage or card.bolster or card.health_regain:
+        classes.append("Buff")
+    return tuple(classes)
+
+
+@lru_cache(maxsize=4096)
+def miss_probability(population: int, successes: int, draws: int) -> float:
+    """Hypergeometric chance that ``draws`` cards taken without replacement from
+    ``population`` include none of the ``successes`` marked ones."""
+    draws = min(draws, population)
+    return comb(population - successes, draws) / comb(population, draws)
+
+
+def hit_probability(
+    in_deck: int, deck_size: int, in_pool: int, pool_size: int, draws: int
+) -> float:
+    """Chance of drawing at least one marked card in ``draws`` draws.
+
+    Draws come from the deck first; once it runs out, the reshuffle pool becomes
+    the new deck, as in Player.shuffle_deck.
+    """
+    if draws <= deck_size:
+        return 1 - miss_probability(deck_size, in_deck, draws)
+    if in_deck:
+        return 1.0
+    return 1 - miss_probability(pool_size, in_pool, draws - deck_size)
+
+
+class DrawOdds(NamedTuple):
+    draws: int
+    reshuffle: bool  # the deck runs out and the discard pile is shuffled in
+    cards: Dict[str, float]  # card name -> chance to draw at least one
+    classes: Dict[str, float]
+    label: str = "Next turn"  # what the draws are for
+
+
+def _odds(
+    deck: Sequence[Card], pool: Sequence[Card], draws: int, key
+) -> Dict[str, float]:
+    in_deck: Counter = Counter()
+    in_pool: Counter = Counter()
+    for card in deck:
+        in_deck.update(key(card))
+    for card in pool:
+        in_pool.update(key(card))
+    odds = {
+        name: hit_probability(in_deck[name], len(deck), in_pool[name], len(pool), draws)
+        for name in in_deck.keys() | in_pool.keys()
+    }
+    return dict(sorted(odds.items(), key=lambda item: (-item[1], item[0])))
+
+
+def draw_odds(
+    deck: Sequence[Card], pool: Sequence[Card], draws: int, label: str = "Next turn"
+) -> DrawOdds:
+    """Exact odds for ``draws`` draws from ``deck`` with ``pool`` reshuffled in."""
+    draws = max(0, min(draws, len(deck) + len(pool)))
+    return DrawOdds(
+        draws,
+        draws > len(deck),
+        _odds(deck, pool, draws, lambda card: (card.name,)),
+        _odds(deck, pool, draws, card_classes),
+        label,
+    )
+
+
+def next_turn_odds(player: Player) -> DrawOdds:
+    """Odds for the draw at the start of the next turn. The hand is discarded
+    before drawing, so it joins the reshuffle pool."""
+    return draw_odds(
+        player.deck,
+        list(player.discard_pile) + list(player.hand),
+        min(player.cards_per_turn, player.hand_limit),
+    )
+
+
+def card_draw_odds(player: Player, card: Card) -> DrawOdds:
+    """Odds for the immediate draws of playing ``card`` from the hand. They stop
+    when the hand is full, and the card itself is discarded only afterwards."""
+    return draw_odds(
+        player.deck,
+        player.discard_pile,
+        min(card.card_draw, player.hand_limit - len(player.hand)),
+        card.name,
+    )
+
+
+class DrawOddsCache:
+    """Keeps the last odds until one of the player's piles or the card changes."""
+
+    def __init__(self):
+        self._piles: List[CardPile] = []
+        self._card: Optional[Card] = None
+        self._key: Optional[Hashable] = None
+        self._odds: Optional[DrawOdds] = None
+
+    def next_turn(self, player: Player) -> DrawOdds:
+        return self._cached(player, None)
+
+    def card_draw(self, player: Player, card: Card) -> DrawOdds:
+        """Odds for the draws of playing ``card``, or the next-turn odds if it
+        draws nothing."""
+        return self._cached(player, card if card.card_draw else None)
+
+    def _cached(self, player: Player, card: Optional[Card]) -> DrawOdds:
+        piles = [player.deck, player.hand, player.discard_pile]
+        key = (
+            tuple(pile.version for pile in piles),
+            player.cards_per_turn,
+            player.hand_limit,
+        )
+        same_piles = all(a is b for a, b in zip(piles, self._piles))
+        if (
+            self._odds is None
+            or not same_piles
+            or card is not self._card
+            or key != self._key
+        ):
+            self._piles, self._card, self._key = piles, card, key
+            self._odds = (
+                next_turn_odds(player) if card is None else card_draw_odds(player, card)
+            )
+        return self._odds
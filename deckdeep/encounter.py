@@ -0,0 +1,188 @@
+import math
+import random
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from deckdeep.monster import MonsterType, StatRoll, level_baseline
+
+# Number of power buckets between 0 and the top of the widest band a level can ask for
+POWER_BUCKETS = 100
+
+
+def expected_stats(level: int, monster_type: MonsterType) -> StatRoll:
+    """Stats of a monster rolled at the centre of its +/-10% variance."""
+    base_health, base_damage, base_spell_power = level_baseline(level)
+    return StatRoll(
+        round(base_health * monster_type.health_mult),
+        round(base_damage * monster_type.damage_mult),
+        round(base_spell_power * monster_type.spell_power_mult),
+    )
+
+
+class CompositionTable:
+    """Weights of every multiset of monster types, indexed by number of types
+    considered, group size and discretized power.
+
+    With ``draws`` set, a multiset with ``c_i`` monsters of each type weighs
+    ``prod(w_i**c_i / c_i!)``: proportional, among groups of the same size, to
+    the chance of rolling it one weighted monster at a time. Without it the
+    multiset weighs ``prod(w_i**c_i)``, so with unit weights every multiset
+    counts exactly once.
+
+    ``ways[i][k][b]`` is the total weight of the multisets that use only the first
+    ``i`` types, contain ``k`` monsters and land in power bucket ``b``. Buckets stop
+    at ``max_bucket``; heavier compositions are not tracked.
+    """
+
+    def __init__(
+        self,
+        powers: Sequence[float],
+        weights: Sequence[float],
+        max_monsters: int,
+        step: float,
+        draws: bool = True,
+    ):
+        self.step = step
+        self.max_monsters = max_monsters
+        self.buckets = [int(round(p / step)) for p in powers]
+        # Sums past the band top are never wanted; keep just enough room for the
+        # cheapest single monster so the closest-composition fallback always exists
+        self.max_bucket = max(POWER_BUCKETS, min(self.buckets, default=0))
+        self.terms = [
+            [
+                w**c / math.factorial(c) if draws else w**c
+                for c in range(max_monsters + 1)
+            ]
+            for w in weights
+        ]
+
+        size = self.max_bucket + 1
+        empty = [[0.0] * size for _ in range(max_monsters + 1)]
+        empty[0][0] = 1.0
+        self.ways: List[List[List[float]]] = [empty]
+        for bucket, terms in zip(self.buckets, self.terms):
+            prev = self.ways[-1]
+            layer = [[0.0] * size for _ in range(max_monsters + 1)]
+            for k in range(max_monsters + 1):
+                for b in range(size):
+                    total = 0.0
+                    for c in range(k + 1):
+                        rest = b - c * bucket
+                        if rest < 0:
+                            break
+                        total += prev[k - c][rest] * terms[c]
+                    layer[k][b] = total
+            self.ways.append(layer)
+
+        # Every reachable non-empty (size, bucket, weight) state. Leaving out the k!
+        # multinomial factor keeps larger groups from crowding out small ones.
+        final = self.ways[-1]
+        self.states: List[Tuple[int, int, float]] = [
+            (k, b, final[k][b])
+            for k in range(1, max_monsters + 1)
+            for b in range(size)
+            if final[k][b] > 0
+        ]
+
+    def sample(self, k: int, b: int, rng) -> List[int]:
+        """Counts per type for a random multiset in state (k, b), drawn by weight."""
+        counts = [0] * len(self.buckets)
+        for i in range(len(self.buckets), 0, -1):
+            bucket, terms, prev = (
+                self.buckets[i - 1],
+                self.terms[i - 1],
+                self.ways[i - 1],
+            )
+            options = []
+            for c in range(k + 1):
+                rest = b - c * bucket
+                if rest < 0:
+                    break
+                weight = prev[k - c][rest] * terms[c]
+                if weight > 0:
+                    options.append((c, weight))
+            c = rng.choices(
+                [c for c, _ in options], weights=[w for _, w in options], k=1
+            )[0]
+            counts[i - 1] = c
+            k -= c
+            b -= c * bucket
+        return counts
+
+
+class EncounterComposer:
+    """Picks a multiset of monster types whose expected power fits a target band.
+
+    One CompositionTable is built per level and reused, so composing a group costs
+    a weighted pick over the feasible states plus one backtrack through the table:
+    bounded work with no retry loops. When nothing lands in the band, the closest
+    reachable composition is used instead.
+
+    ``weighted`` groups are drawn as if each monster were rolled by rarity, so
+    common types show up often and in numbers. Otherwise every composition in
+    the band is equally likely.
+    """
+
+    def __init__(
+        self,
+        monster_types: Sequence[MonsterType],
+        max_monsters: int = 5,
+        weighted: bool = True,
+    ):
+        self.monster_types = list(monster_types)
+        self.max_monsters = max_monsters
+        self.weighted = weighted
+        self._tables: Dict[Tuple[int, float], CompositionTable] = {}
+
+    def clear(self):
+        """Drop cached tables, e.g. after monster type multipliers were retuned."""
+        self._tables.clear()
+
+    def expected_power(self, level: int, monster_type: MonsterType) -> float:
+        return monster_type.estimate_power(expected_stats(level, monster_type))
+
+    def table(self, level: int, max_power: float) -> CompositionTable:
+        step = max(max_power / POWER_BUCKETS, 1.0)
+        key = (level, step)
+        table = self._tables.get(key)
+        if table is None:
+            powers = [self.expected_power(level, mt) for mt in self.monster_types]
+            weights = [
+                1 / mt.rarity if self.weighted else 1.0 for mt in self.monster_types
+            ]
+            table = self._tables[key] = CompositionTable(
+                powers, weights, self.max_monsters, step, draws=self.weighted
+            )
+        return table
+
+    def compose(
+        self,
+        level: int,
+        min_power: float,
+        max_power: float,
+        band_top: Optional[float] = None,
+        rng=random,
+    ) -> List[MonsterType]:
+        """Monster types for one group with expected power in [min_power, max_power].
+
+        ``band_top`` fixes the bucket size for the level (pass the widest band the
+        caller will ever ask for) so the table is shared between calls.
+        """
+        table = self.table(level, band_top if band_top is not None else max_power)
+        lo = math.ceil(min_power / table.step - 1e-9)
+        hi = math.floor(max_power / table.step + 1e-9)
+
+        states = table.states
+        feasible = [s for s in states if lo <= s[1] <= hi]
+        if feasible:
+            k, b, _ = rng.choices(feasible, weights=[w for _, _, w in feasible], k=1)[0]
+        else:
+            k, b, _ = min(
+                states, key=lambda s: (max(lo - s[1], s[1] - hi), -s[2], s[0])
+            )
+
+        counts = table.sample(k, b, rng)
+        types = [
+            mt for mt, count in zip(self.monster_types, counts) for _ in range(count)
+        ]
+        rng.shuffle(types)
+        return types
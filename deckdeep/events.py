@@ -1,29 +1,84 @@
+import bisect
 import random
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple, Type, Union
 from deckdeep.card import Card
-from deckdeep.relic import get_relic_by_name
+from deckdeep.relic import Relic, get_relic_by_name
 from deckdeep.player import Player
-from deckdeep.render import handle_card_selection
 from deckdeep.card import Rarity
 from deckdeep.custom_types import Health
 
 
+class CardSelection:
+    """Returned by an event option that needs the player to pick a card.
+
+    The game opens a card selection screen over ``cards`` and passes the chosen
+    index (or None if cancelled) to ``on_select``, which returns the result text.
+    """
+
+    def __init__(self, cards: List[Card], on_select: Callable[[Optional[int]], str]):
+        self.cards = cards
+        self.on_select = on_select
+
+
 class Event:
     def __init__(self, name: str, description: str, options: list):
         self.name = name
         self.description = description
         self.options = options
 
-    def execute_option(self, option_method, player, assets):
-        method = getattr(self, option_method)
-        if "assets" in method.__code__.co_varnames:
-            return method(player, assets)
-        else:
-            return method(player)
+    def execute_option(self, option_method, player) -> Union[str, CardSelection]:
+        return getattr(self, option_method)(player)
+
+    @property
+    def info(self) -> "EventInfo":
+        return EVENT_REGISTRY[type(self).__name__]
+
+    def relic(self) -> Relic:
+        """A new copy of the relic listed for this event in EVENT_REGISTRY."""
+        (name,) = self.info.relics
+        return get_relic_by_name(name)
+
+
+class EventInfo(NamedTuple):
+    """Catalog entry for an event, readable without constructing it."""
+
+    key: str  # class name, as stored in node content and saves
+    name: str
+    weight: float
+    image: str  # file stem under assets/images/events
+    relics: Tuple[str, ...]  # relics the event can grant
+    event_class: type  # an Event subclass, constructed without arguments
+
 
+EVENT_REGISTRY: Dict[str, EventInfo] = {}
+# Parallel to the registry's insertion order, for bisecting a weighted pick
+_event_keys: List[str] = []
+_cumulative_weights: List[float] = []
 
+
+def register_event(
+    name: str, weight: float = 1.0, relics: Tuple[str, ...] = ()
+) -> Callable[[Type[Event]], Type[Event]]:
+    """Class decorator adding an Event subclass to EVENT_REGISTRY."""
+
+    def decorator(cls: Type[Event]) -> Type[Event]:
+        key = cls.__name__
+        if key in EVENT_REGISTRY:
+            raise ValueError(f"Event already registered: {key}")
+        image = name.lower().replace(" ", "_")
+        EVENT_REGISTRY[key] = EventInfo(key, name, weight, image, relics, cls)
+        _event_keys.append(key)
+        total = _cumulative_weights[-1] if _cumulative_weights else 0.0
+        _cumulative_weights.append(total + weight)
+        return cls
+
+    return decorator
+
+
+@register_event("Voodoo Doctor", relics=("Healing Charm",))
 class VoodooDoctor(Event):
     def __init__(self):
-        healing_charm = get_relic_by_name("Healing Charm")
+        healing_charm = self.relic()
         super().__init__(
             "Voodoo Doctor",
             f"A mysterious figure offers you various magical remedies. You can pay 10 HP and gain a curse to be granted a '{healing_charm.name}' relic, or accept a sketchy potion with unknown effects.",
@@ -38,9 +93,9 @@ class VoodooDoctor(Event):
         if player.health > 10:
             player.health -= 10
             curse = Card("Cursed Coin", 99, Rarity.UNCOMMON, health_cost=5)
-            player.deck.append(curse)
-            healing_charm = get_relic_by_name("Healing Charm")
-            player.relics.append(healing_charm)
+            player.add_card_to_deck(curse)
+            healing_charm = self.relic()
+            player.add_relic(healing_charm)
             return f"You gained the '{healing_charm.name}' relic. {healing_charm.description}"
         return "You don't have enough HP to pay for the Healing Charm."
 
@@ -59,9 +114,10 @@ class VoodooDoctor(Event):
         return "You leave the Voodoo Doctor's tent."
 
 
+@register_event("Medic", relics=("Hair of the Dog",))
 class Medic(Event):
     def __init__(self):
-        hair_of_dog = get_relic_by_name("Hair of the Dog")
+        hair_of_dog = self.relic()
         super().__init__(
             "Medic",
             f"You find a medic tent. You can pay 20 HP to gain a {hair_of_dog.name} or heal 50 HP.",
@@ -75,9 +131,8 @@ class Medic(Event):
     def grant_hair_of_the_dog(self, player):
         if player.health.value > 20:
             player.take_damage(20)
-            relic = get_relic_by_name("Hair of the Dog")
-            player.relics.append(relic)
-            relic.apply_effect(player, None)
+            relic = self.relic()
+            player.add_relic(relic)
             return f"You gained the '{relic.name}' relic. {relic.description}"
         return "You don't have enough HP to pay for the Vitality Boost."
 
@@ -89,6 +144,7 @@ class Medic(Event):
         return "You leave the Medic's tent."
 
 
+@register_event("Priest")
 class Priest(Event):
     def __init__(self):
         super().__init__(
@@ -113,6 +169,7 @@ class Priest(Event):
         return "You leave the Priest's temple."
 
 
+@register_event("Thrifter")
 class Thrifter(Event):
     def __init__(self):
         super().__init__(
@@ -124,28 +181,31 @@ class Thrifter(Event):
             ],
         )
 
-    def remove_card(self, player, assets):
+    def remove_card(self, player):
         cost = int(player.health.value * 0.25)
         if player.health.value > cost:
             player.take_damage(cost)
-            full_deck = player.get_sorted_full_deck()
-            chosen_index = handle_card_selection(full_deck, assets, player)
-            if chosen_index is not None:
-                removed_card = player.remove_card_from_deck(chosen_index)
-                if removed_card:
-                    return f"You paid {cost} HP to remove {removed_card.name} from your deck."
-                else:
-                    return "Invalid card index. No card was removed."
-            return "No card was selected."
+
+            def remove_chosen(chosen_index: Optional[int]) -> str:
+                if chosen_index is not None:
+                    removed_card = player.remove_card_from_deck(chosen_index)
+                    if removed_card:
+                        return f"You paid {cost} HP to remove {removed_card.name} from your deck."
+                    else:
+                        return "Invalid card index. No card was removed."
+                return "No card was selected."
+
+            return CardSelection(player.get_sorted_full_deck(), remove_chosen)
         return "You don't have enough HP to remove a card."
 
     def leave(self, player: Player):
         return "You leave the Thrifter's shop."
 
 
+@register_event("Cursed Well", relics=("Cursed Coin",))
 class CursedWell(Event):
     def __init__(self):
-        cursed_coin = get_relic_by_name("Cursed Coin")
+        cursed_coin = self.relic()
         super().__init__(
             "Cursed Well",
             f"A mysterious well emanates dark energy. You can add a curse to your deck and gain a '{cursed_coin.name}' relic.",
@@ -156,11 +216,11 @@ class CursedWell(Event):
         )
 
     def dark_power(self, player):
-        player.deck.append(
+        player.add_card_to_deck(
             Card("Cursed Coin", 99, Rarity.UNCOMMON, health_cost=5),
         )
-        player.deck.append(Card("Cursed Coin", 99, Rarity.UNCOMMON, health_cost=5))
-        relic = get_relic_by_name("Cursed Coin")
+        player.add_card_to_deck(Card("Cursed Coin", 99, Rarity.UNCOMMON, health_cost=5))
+        relic = self.relic()
         player.add_relic(relic)
         return f"You gained the '{relic.name}' relic ({relic.description}) and added a curse to your deck."
 
@@ -168,6 +228,7 @@ class CursedWell(Event):
         return "You back away from the Cursed Well."
 
 
+@register_event("Scribe")
 class Scribe(Event):
     def __init__(self):
         super().__init__(
@@ -183,19 +244,20 @@ class Scribe(Event):
             ],
         )
 
-    def duplicate_card(self, player, assets):
-        full_deck = player.get_sorted_full_deck()
-        chosen_index = handle_card_selection(full_deck, assets, player)
-        if chosen_index is not None:
-            duplicated_card = player.duplicate_card_in_deck(chosen_index)
-            if duplicated_card:
-                return (
-                    f"The scribe's quill dances across a blank parchment, creating an exact copy of your '{duplicated_card.name}'. "
-                    f"A duplicate has been added to your deck."
-                )
-            else:
-                return "The scribe frowns. Something went wrong, and no card was duplicated."
-        return "You decide not to duplicate any card."
+    def duplicate_card(self, player):
+        def duplicate_chosen(chosen_index: Optional[int]) -> str:
+            if chosen_index is not None:
+                duplicated_card = player.duplicate_card_in_deck(chosen_index)
+                if duplicated_card:
+                    return (
+                        f"The scribe's quill dances across a blank parchment, creating an exact copy of your '{duplicated_card.name}'. "
+                        f"A duplicate has been added to your deck."
+                    )
+                else:
+                    return "The scribe frowns. Something went wrong, and no card was duplicated."
+            return "You decide not to duplicate any card."
+
+        return CardSelection(player.get_sorted_full_deck(), duplicate_chosen)
 
     def leave(self, player: Player):
         return (
@@ -204,9 +266,10 @@ class Scribe(Event):
         )
 
 
+@register_event("Ancient Library", relics=("Paper Weight",))
 class AncientLibrary(Event):
     def __init__(self):
-        paper_weight = get_relic_by_name("Paper Weight")
+        paper_weight = self.relic()
         super().__init__(
             "Ancient Library",
             f"A vast library of ancient knowledge stands before you. You can offer a quarter of your health and 1 max energy to gain a '{paper_weight.name}' - {paper_weight.description}",
@@ -217,16 +280,17 @@ class AncientLibrary(Event):
         )
 
     def paper_weight(self, player):
-        player.relics.append(get_relic_by_name("Paper Weight"))
+        player.add_relic(self.relic())
         return "You gained the Paper Weight relic."
 
     def leave(self, player: Player):
         return "You leave the Ancient Library."
 
 
+@register_event("Forgotten Shrine", relics=("Energy Crystal",))
 class ForgottenShrine(Event):
     def __init__(self):
-        relic = get_relic_by_name("Energy Crystal")
+        relic = self.relic()
         super().__init__(
             "Forgotten Shrine",
             f"A shrine stands before you, covered in moss and vines. It seems to be calling out to you. You can offer half of your max health to gain the '{relic.name}' relic or cleanse the shrine to remove all curses from your deck.",
@@ -241,8 +305,8 @@ class ForgottenShrine(Event):
         cost = player.max_health.value // 2
         if player.health.value > cost:
             player.take_damage(cost)
-            energy_crystal = get_relic_by_name("Energy Crystal")
-            player.relics.append(energy_crystal)
+            energy_crystal = self.relic()
+            player.add_relic(energy_crystal)
             return f"You gained the '{energy_crystal.name}' relic. {energy_crystal.description}"
         return "You don't have enough HP to make the offering."
 
@@ -254,6 +318,7 @@ class ForgottenShrine(Event):
         return "You leave the Forgotten Shrine undisturbed."
 
 
+@register_event("Rest Site")
 class RestSite(Event):
     def __init__(self):
         self.heal_amount = 50
@@ -286,25 +351,27 @@ class RestSite(Event):
         player.bonus_damage += self.damage_gain
         return f"You meditate at the altar. Ancient wisdom flows through you, granting {self.energy_gain} energy and {self.damage_gain} bonus damage."
 
-    def remove_card(self, player, assets):
-        full_deck = player.get_sorted_full_deck()
-        chosen_index = handle_card_selection(full_deck, assets, player)
-        if chosen_index is not None:
-            removed_card = player.remove_card_from_deck(chosen_index)
-            if removed_card:
-                return f"You offer {removed_card.name} to the forest spirits. It dissolves into motes of light, forever leaving your deck."
-            else:
-                return "The spirits reject your offering. No card was removed."
-        return "You decide not to make an offering."
+    def remove_card(self, player):
+        def offer_chosen(chosen_index: Optional[int]) -> str:
+            if chosen_index is not None:
+                removed_card = player.remove_card_from_deck(chosen_index)
+                if removed_card:
+                    return f"You offer {removed_card.name} to the forest spirits. It dissolves into motes of light, forever leaving your deck."
+                else:
+                    return "The spirits reject your offering. No card was removed."
+            return "You decide not to make an offering."
+
+        return CardSelection(player.get_sorted_full_deck(), offer_chosen)
 
     def leave(self, player: Player):
         return "You leave the peaceful clearing, feeling refreshed and ready to face new challenges."
 
 
+@register_event("Defender", relics=("Shield Rune",))
 class Defender(Event):
     def __init__(self):
         self.damage_percentage = 20
-        self.shield_rune = get_relic_by_name("Shield Rune")
+        self.shield_rune = self.relic()
 
         super().__init__(
             "Defender",
@@ -321,24 +388,26 @@ class Defender(Event):
     def defend(self, player):
         damage = int(player.health.value * (self.damage_percentage / 100))
         player.health = Health(max(0, player.health.value - damage))
-        player.relics.append(self.shield_rune)
+        player.add_relic(self.shield_rune)
         return f"You bravely defended the caravan, taking {damage} damage. You gained the '{self.shield_rune.name}' relic. {self.shield_rune.description}"
 
-    def leave(self, player: Player, assets):
-        full_deck = player.get_sorted_full_deck()
-        chosen_index = handle_card_selection(full_deck, assets, player)
-        if chosen_index is not None:
-            removed_card = player.remove_card_from_deck(chosen_index)
-            if removed_card:
-                return f"You hastily flee the scene, abandoning your '{removed_card.name}' in the process. It's lost forever from your deck."
-            else:
-                return "Something went wrong. No card was removed."
-        return "You must abandon a card to leave. The event continues."
+    def leave(self, player: Player):
+        def abandon_chosen(chosen_index: Optional[int]) -> str:
+            if chosen_index is not None:
+                removed_card = player.remove_card_from_deck(chosen_index)
+                if removed_card:
+                    return f"You hastily flee the scene, abandoning your '{removed_card.name}' in the process. It's lost forever from your deck."
+                else:
+                    return "Something went wrong. No card was removed."
+            return "You must abandon a card to leave. The event continues."
+
+        return CardSelection(player.get_sorted_full_deck(), abandon_chosen)
 
 
+@register_event("Dark Merchant", relics=("Cursed Dagger",))
 class DarkMerchant(Event):
     def __init__(self):
-        cursed_dagger = get_relic_by_name("Cursed Dagger")
+        cursed_dagger = self.relic()
         super().__init__(
             "Dark Merchant",
             f"A shadowy figure appears offers you a mysterious dagger. A Do you can accept the '{cursed_dagger.name}' in exchange for 15 max HP?",
@@ -352,8 +421,8 @@ class DarkMerchant(Event):
         if player.max_health > 15:
             player.max_health -= 15
             player.health = Health(min(player.health.value, player.max_health.value))
-            cursed_dagger = get_relic_by_name("Cursed Dagger")
-            player.relics.append(cursed_dagger)
+            cursed_dagger = self.relic()
+            player.add_relic(cursed_dagger)
             return f"You accepted the '{cursed_dagger.name}'. Your max HP decreased by 15, but you gained a powerful relic. {cursed_dagger.description}"
         return "You don't have enough max HP to make the exchange."
 
@@ -361,18 +430,15 @@ class DarkMerchant(Event):
         return "You decline the mysterious offer and walk away."
 
 
-def get_random_event():
-    events = [
-        Medic(),
-        VoodooDoctor(),
-        Thrifter(),
-        CursedWell(),
-        Scribe(),
-        ForgottenShrine(),
-        RestSite(),
-        Defender(),
-        DarkMerchant(),
-        Priest(),
-        AncientLibrary(),
-    ]
-    return random.choice(events)
+def random_event_key() -> str:
+    """A registered event key, picked by weight without constructing anything."""
+    roll = random.random() * _cumulative_weights[-1]
+    return _event_keys[bisect.bisect(_cumulative_weights, roll)]
+
+
+def create_event(key: str) -> Event:
+    return EVENT_REGISTRY[key].event_class()
+
+
+def get_random_event() -> Event:
+    return create_event(random_event_key())
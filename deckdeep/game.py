@@ -2,8 +2,7 @@ import json
 import os
 import random
 import sys
-import time
-from typing import List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import pygame
 from pygame.surface import Surface
@@ -13,49 +12,53 @@ from deckdeep.card import Card
 from deckdeep.config import (
     BUTTON_HEIGHT,
     BUTTON_WIDTH,
-    CARD_HEIGHT,
-    CARD_SPACING,
-    CARD_WIDTH,
     END_TURN_BUTTON_X,
     END_TURN_BUTTON_Y,
     KEYBINDS,
-    SCREEN_HEIGHT,
-    SCREEN_WIDTH,
     VIEW_DECK_BUTTON_X,
     VIEW_DECK_BUTTON_Y,
-    scale,
 )
+from deckdeep.display import DisplayManager
+from deckdeep.draw_odds import DrawOdds, DrawOddsCache
 from deckdeep.events import (
-    AncientLibrary,
-    CursedWell,
-    DarkMerchant,
-    Defender,
-    ForgottenShrine,
-    Medic,
-    Priest,
-    RestSite,
-    Scribe,
-    Thrifter,
-    VoodooDoctor,
-    get_random_event,
+    EVENT_REGISTRY,
+    CardSelection,
+    Event,
+    create_event,
+    random_event_key,
 )
 from deckdeep.json_encoder import CustomJSONEncoder
+from deckdeep.layout import get_layout
 from deckdeep.logger import GameLogger
 from deckdeep.monster_group import MonsterGroup
 from deckdeep.music_manager import BackgroundMusicManager
+from deckdeep.particles import ParticleSystem
 from deckdeep.player import Player
 from deckdeep.relic import Relic, TriggerWhen
 from deckdeep.render import (
     render_combat_state,
     render_deck_view,
     render_menu,
-    render_node_selection,
-    render_relic_selection,
     render_relic_view,
     render_start_screen,
     render_text_event,
-    render_victory_state,
-    render_keybinds,
+)
+from deckdeep.render_cache import render_cache
+from deckdeep.renderer import get_renderer
+from deckdeep.simulation import CombatResult, Policy, greedy_policy, simulate_combat
+from deckdeep.sound_bank import SoundBank
+from deckdeep.snapshot import Checkpoint, CombatSnapshot, RewindBuffer
+from deckdeep.screens import (
+    CardRewardScreen,
+    CardSelectionScreen,
+    CombatIntroScreen,
+    FrameScheduler,
+    GameOverScreen,
+    KeybindsScreen,
+    NodeSelectionScreen,
+    RelicSelectionScreen,
+    ScreenManager,
+    VictorySequenceScreen,
 )
 from deckdeep.status_effect import TriggerType
 
@@ -65,34 +68,37 @@ def get_key_name(key: int) -> str:
 
 
 class VictorySequence:
+    COLORS = (
+        (255, 215, 0),  # Gold
+        (255, 255, 255),  # White
+        (255, 165, 0),  # Orange
+    )
+
     def __init__(self, screen: Surface, assets: GameAssets):
         self.screen = screen
         self.assets = assets
         self.duration = 2000  # Duration in milliseconds
         self.start_time = 0
-        self.particles: List[
-            Tuple[int, int, int, Tuple[int, int, int], float, float]
-        ] = []
+        self.last_update = 0
+        self.particles = ParticleSystem()
 
     def start(self):
-        self.start_time = pygame.time.get_ticks()
+        self.start_time = self.last_update = pygame.time.get_ticks()
         self.generate_particles()
 
-    def generate_particles(self):
-        for _ in range(50):
-            x = random.randint(0, SCREEN_WIDTH)
-            y = random.randint(0, SCREEN_HEIGHT)
-            size = random.randint(5, 15)
-            color = random.choice(
-                [
-                    (255, 215, 0),  # Gold
-                    (255, 255, 255),  # White
-                    (255, 165, 0),  # Orange
-                ]
-            )
-            speed_x = random.uniform(-1, 1)
-            speed_y = random.uniform(-1, 1)
-            self.particles.append((x, y, size, color, speed_x, speed_y))
+    def generate_particles(self, count: int = 50):
+        layout = get_layout()
+        self.particles.emit(
+            count,
+            0,
+            0,
+            layout.width,
+            layout.height,
+            speed=120,
+            sizes=(5, 15),
+            lifetime=self.duration / 1000,
+            colors=self.COLORS,
+        )
 
     def update(self):
         current_time = pygame.time.get_ticks()
@@ -101,33 +107,24 @@ class VictorySequence:
         if progress >= 1:
             return False
 
-        for i, (x, y, size, color, speed_x, speed_y) in enumerate(self.particles):
-            new_x = x + speed_x * 2
-            new_y = y + speed_y * 2
-            new_size = int(size * (1 - progress))
-            self.particles[i] = (
-                int(new_x),
-                int(new_y),
-                new_size,
-                color,
-                speed_x,
-                speed_y,
-            )
-
+        self.particles.update((current_time - self.last_update) / 1000)
+        self.last_update = current_time
         return True
 
     def render(self):
-        victory_text = pygame.font.Font(None, scale(100)).render(
-            "Victory!", True, (255, 255, 255)
+        layout = get_layout()
+        size = layout.scale(100)
+        victory_font = render_cache.get(
+            ("font", size), lambda: pygame.font.Font(None, size)
         )
+        r = get_renderer()
+        victory_text = r.text(victory_font, "Victory!", True, (255, 255, 255))
         text_rect = victory_text.get_rect(
-            center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
+            center=(layout.width // 2, layout.height // 2)
         )
 
-        self.screen.blit(victory_text, text_rect)
-
-        for x, y, size, color, _, _ in self.particles:
-            pygame.draw.circle(self.screen, color, (int(x), int(y)), size)
+        r.blit(self.screen, victory_text, text_rect)
+        self.particles.render(self.screen)
 
 
 class Node:
@@ -152,13 +149,20 @@ class Node:
     def add_child(self, child: "Node"):
         self.children.append(child)
 
+    def get_event(self) -> Optional[Event]:
+        """The node's event, constructed from its registry key on first access."""
+        event = self.content.get("event")
+        if isinstance(event, str):
+            event = self.content["event"] = create_event(event)
+        return event
+
     def to_dict(self):
         content_dict = self.content.copy()
         if "monsters" in content_dict and isinstance(
             content_dict["monsters"], MonsterGroup
         ):
             content_dict["monsters"] = content_dict["monsters"].to_dict()
-        if "event" in content_dict:
+        if isinstance(content_dict.get("event"), Event):
             content_dict["event"] = content_dict["event"].__class__.__name__
         return {
             "node_type": self.node_type,
@@ -180,19 +184,26 @@ class Node:
         )
         if "monsters" in node.content and isinstance(node.content["monsters"], dict):
             node.content["monsters"] = MonsterGroup.from_dict(node.content["monsters"])
-        if "event" in node.content and isinstance(node.content["event"], str):
-            event_class = globals()[node.content["event"]]
-            node.content["event"] = event_class()
+        if "event" in node.content and node.content["event"] not in EVENT_REGISTRY:
+            raise KeyError(f"Unknown event: {node.content['event']}")
         for child_data in data["children"]:
             node.add_child(cls.from_dict(child_data))
         return node
 
 
 class Game:
-    def __init__(self, screen: pygame.Surface, logger: GameLogger):
+    def __init__(
+        self,
+        screen: pygame.Surface,
+        logger: GameLogger,
+        display: Optional[DisplayManager] = None,
+    ):
         self.screen = screen
         self.logger = logger
         self.assets = GameAssets()
+        self.display = display or DisplayManager(screen.get_size())
+        self.display.assets = self.assets
+        self.sounds = SoundBank(self.assets.sound_path)
         self.player = Player.create("Hero", 100, "@")
         self.monster_group = MonsterGroup.generate(1)[0]
         self.current_node: Optional[Node] = None
@@ -202,7 +213,8 @@ class Game:
         self.selected_card = -1
         self.player_turn = True
         self.running = True
-        self.clock = pygame.time.Clock()
+        self.run_finished = False
+        self.screens = ScreenManager(FrameScheduler(60), render_cache)
         self.menu_active = False
         self.menu_options = [
             "Resume",
@@ -218,15 +230,21 @@ class Game:
         self.game_over = False
         self.text_event_selection = 0
         self.deck_scroll = 0
-        self.current_event = None
+        self.current_event: Optional[Event] = None
         self.viewing_deck = False
         self.current_page = 0
         self.cards_per_page = 15
         self.viewing_relics = False
         self.monster_intentions: List[str] = []
         self.played_cards: List[Card] = []
+        self.rewind = RewindBuffer()
+        self.practice_mode = False
+        self.show_draw_odds = False
+        self.draw_odds = DrawOddsCache()
 
     def run(self):
+        # One manager for every run, so the next track is already decoded
+        music_manager = BackgroundMusicManager(self.assets.music_path)
         while True:
             if not self.start_screen():
                 return
@@ -236,23 +254,37 @@ class Game:
             else:
                 self.new_game()
 
-            with BackgroundMusicManager(self.assets.music_path) as music_manager:
-                while self.running and not self.game_over:
+            self.run_finished = False
+            with music_manager:
+                while self.running and not self.run_finished:
                     self.handle_events(music_manager)
                     if not self.running:
                         return
-                    self.render()
-                    self.update()
-                    self.clock.tick(60)
-
-            if self.game_over:
-                self.game_over_screen()
-                # Reset game state after game over
-                self.reset_game_state()
+                    music_manager.update()
+                    self.step()
 
             if not self.running:
                 return
 
+    def step(self):
+        """Advance one frame without blocking: the top modal screen if one is open,
+        otherwise the run itself (combat or event)."""
+        screen = self.screens.top
+        with self.screens.frame(screen.name if screen else "run"):
+            if screen is not None:
+                screen.render(self.screen)
+                self.screens.update()
+            else:
+                self.render()
+                self.update()
+                if self.game_over and not self.screens:
+                    self.game_over_screen()
+
+    def end_run(self):
+        # Reset game state after game over and return to the start screen
+        self.reset_game_state()
+        self.run_finished = True
+
     def reset_game_state(self):
         self.game_over = False
         self.player = Player.create("Hero", 100, "@")
@@ -269,10 +301,14 @@ class Game:
                 if event.type == pygame.QUIT:
                     return False
                 if event.type == pygame.KEYDOWN:
-                    waiting = False
+                    if self.handle_display_key(event.key):
+                        render_start_screen(self.screen, self.assets)
+                    else:
+                        waiting = False
         return True
 
     def new_game(self):
+        self.screens.clear()
         self.player = Player.create("Hero", 100, "@")
         self.stage = 1
         self.score = 0
@@ -335,13 +371,14 @@ class Game:
                             monster_group, target_power, actual_power = (
                                 MonsterGroup.generate(true_level)
                             )
-                            content = {"monsters": monster_group}
+                            content: Dict[str, Any] = {"monsters": monster_group}
                             self.logger.info(
                                 f"Generated combat node monster group: Level {true_level}, Target power: {target_power:.2f}, Actual power: {actual_power:.2f} , Delta: {round(actual_power - target_power)}",
                                 category="SYSTEM",
                             )
                         else:
-                            content = {"event": get_random_event()}
+                            # Built only when the player enters the node
+                            content = {"event": random_event_key()}
                         child = Node(node_type, self.stage, level, true_level, content)
                     parent.add_child(child)
                     next_level.append(child)
@@ -352,41 +389,59 @@ class Game:
 
     def handle_events(self, music_manager: BackgroundMusicManager):
         for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                self.running = False
+            self.dispatch_event(event)
+            if not self.running:
                 return  # Exit the method immediately
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                self.handle_mouse_click(event.pos)
-            elif event.type == pygame.KEYDOWN:
-                if self.viewing_deck:
-                    self.handle_deck_view_key_press(event.key)
-                elif self.viewing_relics:
-                    self.handle_relic_view_key_press(event.key)
-                elif self.menu_active:
-                    self.handle_menu_key_press(event.key)
-                elif self.current_node and self.current_node.node_type == "event":
-                    self.handle_event_key_press(event.key)
-                else:
-                    self.handle_key_press(event.key)
             music_manager.handle_event(event)
 
+    def dispatch_event(self, event: pygame.event.Event):
+        if event.type == pygame.QUIT:
+            self.running = False
+        elif event.type == pygame.KEYDOWN and self.handle_display_key(event.key):
+            return
+        elif self.screens:
+            self.screens.handle_event(event)
+        elif event.type == pygame.MOUSEBUTTONDOWN:
+            self.handle_mouse_click(event.pos)
+        elif event.type == pygame.KEYDOWN:
+            if self.viewing_deck:
+                self.handle_deck_view_key_press(event.key)
+            elif self.viewing_relics:
+                self.handle_relic_view_key_press(event.key)
+            elif self.menu_active:
+                self.handle_menu_key_press(event.key)
+            elif self.current_node and self.current_node.node_type == "event":
+                self.handle_event_key_press(event.key)
+            else:
+                self.handle_key_press(event.key)
+
+    def handle_display_key(self, key) -> bool:
+        """Resolution and fullscreen switches, available on every screen."""
+        action = KEYBINDS["Display"].get(get_key_name(key))
+        if action == "Toggle fullscreen":
+            self.screen = self.display.toggle_fullscreen()
+        elif action == "Cycle resolution":
+            self.screen = self.display.cycle_resolution()
+        else:
+            return False
+        width, height = self.display.size
+        self.logger.info(
+            f"Display set to {width}x{height}"
+            f"{' fullscreen' if self.display.fullscreen else ''} "
+            f"in {self.display.switch_times[-1] * 1000:.1f} ms",
+            category="SYSTEM",
+        )
+        return True
+
     def handle_mouse_click(self, pos):
         if not self.menu_active and not self.viewing_deck and not self.viewing_relics:
             mouse_x, mouse_y = pos
             self.select_card(mouse_x, mouse_y)
 
     def select_card(self, mouse_x: int, mouse_y: int):
-        card_start_x = (
-            SCREEN_WIDTH
-            - (len(self.player.hand) * (CARD_WIDTH + CARD_SPACING) - CARD_SPACING)
-        ) // 2
-        for i in range(len(self.player.hand)):
-            card_rect = pygame.Rect(
-                card_start_x + i * (CARD_WIDTH + CARD_SPACING),
-                SCREEN_HEIGHT - CARD_HEIGHT - 20,
-                CARD_WIDTH,
-                CARD_HEIGHT,
-            )
+        layout = get_layout()
+        for i, (x, y) in enumerate(layout.card_slots(len(self.player.hand))):
+            card_rect = pygame.Rect(x, y, layout.card_width, layout.card_height)
             if card_rect.collidepoint(mouse_x, mouse_y):
                 self.selected_card = i
                 self.logger.debug(f"Card {i} selected", category="PLAYER")
@@ -421,6 +476,16 @@ class Game:
                             self.monster_group.select_previous()
                         elif action == "Select next monster":
                             self.monster_group.select_next()
+                        elif action == "Toggle practice mode":
+                            self.practice_mode = not self.practice_mode
+                            self.logger.info(
+                                f"Practice mode {'on' if self.practice_mode else 'off'}",
+                                category="SYSTEM",
+                            )
+                        elif action == "Rewind last action (practice mode)":
+                            self.rewind_last_action()
+                        elif action == "Toggle draw odds":
+                            self.show_draw_odds = not self.show_draw_odds
 
                     self.logger.debug(f"Action performed: {action}", category="PLAYER")
                     return
@@ -456,7 +521,7 @@ class Game:
                 elif action == "Next page":
                     if self.player:
                         max_page = (
-                            len(self.player.get_sorted_full_deck()) - 1
+                            len(self.player.deck_index) - 1
                         ) // self.cards_per_page
                         self.current_page = min(max_page, self.current_page + 1)
                 elif action == "Close deck view":
@@ -499,15 +564,26 @@ class Game:
         option_text, option_method = self.current_event.options[
             self.text_event_selection
         ]
-        result = self.current_event.execute_option(
-            option_method, self.player, self.assets
-        )
+        result = self.current_event.execute_option(option_method, self.player)
+        if isinstance(result, CardSelection):
+            selection = result
+            self.screens.push(
+                CardSelectionScreen(
+                    self,
+                    selection.cards,
+                    lambda index: self.finish_event(
+                        option_text, selection.on_select(index)
+                    ),
+                )
+            )
+            return
+        self.finish_event(option_text, result)
 
-        for relic in self.player.relics:
+    def finish_event(self, option_text: str, result: str):
+        for relic in self.player.relics_for(TriggerWhen.PERMANENT):
             self.logger.debug(f"{relic.name}:{str(relic)}", category="PLAYER")
-            if relic.trigger_when == TriggerWhen.PERMANENT:
-                msg = relic.apply_effect(self.player, self)
-                self.logger.debug(msg, category="PLAYER")
+            msg = relic.apply_effect(self.player, self)
+            self.logger.debug(msg, category="PLAYER")
         self.logger.info(f"Event option selected: {option_text}", category="EVENT")
         self.logger.info(f"Event result: {result}", category="EVENT")
         if self.current_node is not None:
@@ -568,18 +644,7 @@ class Game:
             sys.exit()
 
     def view_keybinds(self):
-        # This method will be implemented in render.py
-        render_keybinds(self.screen, self.assets)
-        waiting = True
-        while waiting:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.running = False
-                    waiting = False
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
-                        waiting = False
-            self.clock.tick(30)
+        self.screens.push(KeybindsScreen(self))
 
     def play_card(self):
         if self.selected_card >= 0 and self.selected_card < len(self.player.hand):
@@ -597,7 +662,12 @@ class Game:
                 )
                 return
 
+            played = self.player.can_play_card(card)
+            if played:
+                self.checkpoint(f"play {card.name}")
             self.score += self.player.play_card(card, self.monster_group)
+            if played:
+                self.play_card_sounds(card)
             self.logger.info(
                 f"Player played card: {card.name} on {target_monster.name}",
                 category="COMBAT",
@@ -605,6 +675,25 @@ class Game:
             self.selected_card = -1
             self.update_combat()
 
+    def current_draw_odds(self) -> DrawOdds:
+        """Odds for the selected card's draws, or for next turn's hand."""
+        if 0 <= self.selected_card < len(self.player.hand):
+            card = self.player.hand[self.selected_card]
+            return self.draw_odds.card_draw(self.player, card)
+        return self.draw_odds.next_turn(self.player)
+
+    def play_card_sounds(self, card: Card):
+        self.sounds.play("card")
+        if card.damage:
+            targets = len(self.monster_group.monsters) if card.targets_all else 1
+            # One trigger per hit; the bank's throttle folds a volley into one
+            for _ in range(targets * card.num_attacks):
+                self.sounds.play("hit")
+        if card.shield:
+            self.sounds.play("block")
+        if card.healing:
+            self.sounds.play("heal")
+
     def update(self):
         if self.player and self.player.health.value <= 0:
             self.apply_relic_effects(TriggerWhen.ON_DEATH)
@@ -624,6 +713,7 @@ class Game:
         assert self.monster_group is not None, "Monster group is None in update_combat"
 
         if not self.player_turn:
+            self.checkpoint("end turn")
             self.apply_relic_effects(TriggerWhen.END_OF_TURN)
             self.monster_group.remove_dead_monsters()
 
@@ -632,7 +722,7 @@ class Game:
                     monster is not None
                 ), f"Encountered None monster in group: {self.monster_group.monsters}"
                 monster.status_effects.trigger_effects(TriggerType.TURN_START, monster)
-                self.monster_group.remove_dead_monsters()
+            self.monster_group.remove_dead_monsters()
 
             # Execute previous intentions
             for i, monster in enumerate(self.monster_group.monsters):
@@ -675,11 +765,13 @@ class Game:
 
         # Remove dead monsters after death animation
         current_time = pygame.time.get_ticks()
-        self.monster_group.monsters = [
+        remaining = [
             m
             for m in self.monster_group.monsters
             if not (m.is_dying and current_time - m.death_start_time > 1000)
         ]
+        if len(remaining) != len(self.monster_group.monsters):
+            self.monster_group.monsters = remaining
 
         if not self.monster_group.monsters:
             self.player.end_turn()
@@ -713,25 +805,16 @@ class Game:
         )
         self.player.increase_max_energy(1, self.current_node.level)
 
-        victory_sequence = VictorySequence(self.screen, self.assets)
-        victory_sequence.start()
-
-        running = True
-        while running:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.running = False
-                    return
-                elif event.type == pygame.KEYDOWN:
-                    running = False
-
-            self.render()  # Render the current game state
-            running = victory_sequence.update()
-            victory_sequence.render()
-            pygame.display.flip()
-            self.clock.tick(60)
+        self.screens.push(
+            VictorySequenceScreen(
+                self,
+                VictorySequence(self.screen, self.assets),
+                on_done=lambda: self.victory_screen(self.assets),
+            )
+        )
 
-        new_card = self.victory_screen(self.assets)
+    def finish_combat_victory(self, new_card: Optional[Card]):
+        assert self.current_node is not None, "Current node is None in combat_victory"
         if new_card:
             self.player.add_card_to_deck(new_card)
             self.logger.info(
@@ -752,7 +835,7 @@ class Game:
             and self.current_node is not None
             and self.current_node.content is not None
         ):
-            self.current_event = self.current_node.content.get("event")
+            self.current_event = self.current_node.get_event()
             self.text_event_selection = 0
             if self.current_event:
                 self.logger.info(
@@ -761,7 +844,9 @@ class Game:
 
     def next_stage(self):
         self.stage += 1
-        new_relic = self.relic_selection_screen(self.assets)
+        self.relic_selection_screen(self.assets)
+
+    def enter_next_stage(self, new_relic: Optional[Relic]):
         if new_relic:
             assert self.player is not None, "Player is None in next_stage"
             self.logger.info(self.player.add_relic(new_relic), category="PLAYER")
@@ -787,16 +872,16 @@ class Game:
         if self.menu_active:
             render_menu(self.screen, self.menu_options, self.menu_selected, self.assets)
         elif self.viewing_deck:
-            total_pages = (
-                len(self.player.get_sorted_full_deck()) - 1
-            ) // self.cards_per_page + 1
+            deck_index = self.player.deck_index
+            total_pages = (len(deck_index) - 1) // self.cards_per_page + 1
             self.current_page = render_deck_view(
                 self.screen,
-                self.player.get_sorted_full_deck(),
+                deck_index.cards,
                 self.current_page,
                 total_pages,
                 self.assets,
                 self.player,
+                deck_index.stats(),
             )
         elif self.viewing_relics:
             render_relic_view(self.screen, self.player.relics, self.assets)
@@ -813,12 +898,13 @@ class Game:
                 self.selected_card,
                 self.assets,
                 self.played_cards,
+                draw_odds=self.current_draw_odds() if self.show_draw_odds else None,
             )
         elif self.current_node.node_type == "event":
             if self.current_event:
                 render_text_event(
                     self.screen,
-                    self.current_event.name,
+                    self.current_event.info.key,
                     self.current_event.description,
                     [option[0] for option in self.current_event.options],
                     self.assets,
@@ -845,6 +931,7 @@ class Game:
         ), "Monster group is None in initialize_combat"
 
         self.player_turn = True
+        self.rewind.clear()
         self.player.reset_hand()
         self.monster_intentions = self.monster_group.decide_action(self.player)
         self.logger.debug(
@@ -853,26 +940,48 @@ class Game:
         self.apply_relic_effects(TriggerWhen.START_OF_COMBAT)
         self.animate_combat_start()
 
-    def animate_combat_start(self):
-        animation_duration = 1.0  # seconds
-        start_time = time.time()
-
-        while True:
-            current_time = time.time()
-            elapsed_time = current_time - start_time
-            progress = min(elapsed_time / animation_duration, 1.0)
+    def checkpoint(self, label: str):
+        """Record the combat state before an action so it can be rewound."""
+        self.rewind.record(label, self.player, self.monster_group, self.score)
 
-            self.render_combat_with_animation(progress)
+    def rewind_last_action(self) -> bool:
+        """Undo the last card play or end of turn. Only allowed in practice mode."""
+        if not self.practice_mode:
+            self.logger.debug("Rewind needs practice mode", category="PLAYER")
+            return False
+        checkpoint = self.rewind.pop()
+        if checkpoint is None:
+            self.logger.debug("Nothing to rewind", category="PLAYER")
+            return False
 
-            if progress >= 1.0:
-                break
+        checkpoint.combat.restore(self.player, self.monster_group)
+        self.score = checkpoint.score
+        # Checkpoints are only taken on the player's side of the turn
+        self.player_turn = True
+        self.selected_card = -1
+        self.played_cards.clear()
+        self.monster_intentions = [
+            type(m.intention).__name__
+            for m in self.monster_group.monsters
+            if m.intention is not None
+        ]
+        self.logger.info(f"Rewound: {checkpoint.label}", category="COMBAT")
+        return True
 
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.running = False
-                    return
+    def what_if(
+        self, checkpoint: Optional[Checkpoint] = None, policy: Policy = greedy_policy
+    ) -> CombatResult:
+        """Play the combat out with ``policy`` from ``checkpoint`` (by default the
+        current state) on a fork, leaving the live combat untouched."""
+        if checkpoint is None:
+            snapshot = CombatSnapshot.capture(self.player, self.monster_group)
+        else:
+            snapshot = checkpoint.combat
+        player, monster_group = snapshot.fork(self.player)
+        return simulate_combat(player, monster_group, policy, start_of_combat=False)
 
-            self.clock.tick(60)
+    def animate_combat_start(self):
+        self.screens.push(CombatIntroScreen(self, duration=1000))
 
     def render_combat_with_animation(self, progress):
         assert (
@@ -889,13 +998,20 @@ class Game:
             self.played_cards,
             animation_progress=progress,
         )
-        pygame.display.flip()
+        get_renderer().present()
 
     def select_next_node(self):
         assert self.current_node is not None, "Current node is None in select_next_node"
 
         if self.current_node.children:
-            selected = self.node_selection_screen()
+            self.node_selection_screen()
+        else:
+            self.next_stage()
+
+    def enter_node(self, selected: int):
+        assert self.current_node is not None, "Current node is None in enter_node"
+
+        if selected < len(self.current_node.children):
             self.current_node = self.current_node.children[selected]
             self.logger.info(
                 f"Selected node type: {self.current_node.node_type}", category="SYSTEM"
@@ -909,145 +1025,30 @@ class Game:
                 )
                 self.initialize_combat()
             elif self.current_node.node_type == "event":
-                self.current_event = self.current_node.content["event"]
+                self.current_event = self.current_node.get_event()
                 self.text_event_selection = 0
-        else:
-            self.next_stage()
 
-    def node_selection_screen(self) -> int:
+    def node_selection_screen(self):
         assert (
             self.current_node is not None
         ), "Current node is None in node_selection_screen"
+        self.screens.push(NodeSelectionScreen(self, on_done=self.enter_node))
 
-        selected = -1
-        running = True
-
-        while running:
-            render_node_selection(
-                self.screen, self.current_node.children, selected, self.assets
-            )
-
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.running = False
-                    return 0
-                elif event.type == pygame.KEYDOWN:
-                    key_name = pygame.key.name(event.key).upper()
-                    for keys, action in KEYBINDS["Node Selection"].items():
-                        if key_name in keys.split(", "):
-                            index = keys.split(", ").index(key_name)
-                            if index < len(self.current_node.children):
-                                self.logger.info(
-                                    f"Selected node {index}", category="PLAYER"
-                                )
-                                return index
-
-            pygame.time.wait(100)
-        raise ValueError("No node selected")
-
-    def victory_screen(self, assets: GameAssets) -> Optional[Card]:
+    def victory_screen(self, assets: GameAssets):
         new_cards = Card.generate_card_pool(3)
-        selected_card = -1
-        running = True
-
-        while running:
-            render_victory_state(
-                self.screen,
-                self.score,
-                new_cards,
-                selected_card,
-                assets,
-                player=self.player,
-            )
-
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    return None
-                elif event.type == pygame.KEYDOWN:
-                    victory_keys = next(iter(KEYBINDS["Victory Screen"].keys()))
-                    num_keys = [
-                        pygame.key.key_code(k) for k in victory_keys.split(", ")
-                    ]
-                    for i, num_key in enumerate(num_keys):
-                        if event.key == num_key:
-                            if i < 3:
-                                self.logger.info(
-                                    f"Selected victory card: {new_cards[i].name}",
-                                    category="PLAYER",
-                                )
-                                return new_cards[i]
-                            elif i == 3:
-                                self.player.increase_max_health(
-                                    self.player.health_gain_on_skip
-                                )
-                                self.logger.info(
-                                    f"Skipped card selection, increased max health by {self.player.health_gain_on_skip}",
-                                    category="PLAYER",
-                                )
-                                return None
-
-            pygame.time.wait(100)
-        return None
+        self.screens.push(
+            CardRewardScreen(self, new_cards, on_done=self.finish_combat_victory)
+        )
 
-    def relic_selection_screen(self, assets: GameAssets) -> Optional[Relic]:
+    def relic_selection_screen(self, assets: GameAssets):
         new_relics: List[Relic] = Relic.generate_relic_pool(3)
-        selected_relic: int = -1
-        running: bool = True
-
-        while running:
-            render_relic_selection(self.screen, new_relics, selected_relic, assets)
-
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    return None
-                elif event.type == pygame.KEYDOWN:
-                    num_keys = [pygame.K_q, pygame.K_w, pygame.K_e, pygame.K_r]
-                    for i, num_key in enumerate(num_keys):
-                        if event.key == num_key:
-                            if i < 3:
-                                self.logger.info(
-                                    f"Selected relic: {new_relics[i].name}",
-                                    category="PLAYER",
-                                )
-                                return new_relics[i]
-                            elif i == 3:
-                                self.player.increase_max_health(
-                                    self.player.health_gain_on_skip
-                                )
-                                self.logger.info(
-                                    f"Skipped relic selection, increased max health by {self.player.health_gain_on_skip}",
-                                    category="PLAYER",
-                                )
-                                return None
-
-            pygame.time.wait(100)
-
-        return None
+        self.screens.push(
+            RelicSelectionScreen(self, new_relics, on_done=self.enter_next_stage)
+        )
 
     def game_over_screen(self):
         self.logger.info("Displaying game over screen", category="SYSTEM")
-        game_over_image = pygame.transform.scale(
-            self.assets.game_over_image, (SCREEN_WIDTH, SCREEN_HEIGHT)
-        )
-        # game_over_image.set_alpha(128)
-        self.screen.blit(game_over_image, (0, 0))
-
-        # text = game_over_font.render("Game Over", True, (255, 0, 0))
-        # text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
-
-        while True:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.running = False
-                    return
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_RETURN:
-                        return  # Return to main menu
-
-            # self.screen.fill((0, 0, 0))
-            # self.screen.blit(text, text_rect)
-            pygame.display.flip()
-            self.clock.tick(60)
+        self.screens.push(GameOverScreen(self, on_done=self.end_run))
 
     def save_game(self):
         if self.node_tree is None or self.current_node is None:
@@ -1125,7 +1126,7 @@ class Game:
                     if self.current_node.node_type in ["combat", "boss"]:
                         self.monster_group = self.current_node.content["monsters"]
                     elif self.current_node.node_type == "event":
-                        self.current_event = self.current_node.content["event"]
+                        self.current_event = self.current_node.get_event()
                     self.logger.info("Game loaded successfully", category="SYSTEM")
                 else:
                     self.logger.error("Failed to load node tree", category="SYSTEM")
@@ -1163,19 +1164,8 @@ class Game:
         msg = self.player.apply_relic_effects(trigger)
         if msg:
             self.logger.debug(msg, category="PLAYER")
-        for relic in self.player.relics:
-            if isinstance(relic, dict):
-                relic_obj = Relic.from_dict(relic)
-            elif isinstance(relic, Relic):
-                relic_obj = relic
-            else:
-                self.logger.warning(
-                    f"Invalid relic type: {type(relic)}", category="SYSTEM"
-                )
-                continue
-
-            if relic_obj.trigger_when == trigger:
-                effect_msg = relic_obj.apply_effect(self.player, self)
-                self.logger.debug(
-                    f"Applied relic effect: {effect_msg}", category="PLAYER"
-                )
+        # Each relic fires a second time here, now with the game (Cursed Dagger
+        # needs it for a target)
+        for relic in self.player.relics_for(trigger):
+            effect_msg = relic.apply_effect(self.player, self)
+            self.logger.debug(f"Applied relic effect: {effect_msg}", category="PLAYER")
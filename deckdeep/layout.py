@@ -0,0 +1,154 @@
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import NamedTuple, Optional, Tuple
+
+import pygame
+
+from deckdeep.config import CALIBRATED_WIDTH, SCREEN_HEIGHT, SCREEN_WIDTH
+from deckdeep.render_cache import card_face_cache, render_cache, sprite_cache
+
+MONSTERS_PER_ROW = 3
+
+Point = Tuple[int, int]
+
+
+class MonsterSlot(NamedTuple):
+    x: int  # resting position, once the entrance animation is over
+    y: int
+    row_start: int  # resting x of the first monster in the row
+    row_offset: int  # x relative to the row start
+
+
+class MonsterGrid(NamedTuple):
+    slots: Tuple[MonsterSlot, ...]
+    center_y: int  # the player is drawn level with this
+
+
+@dataclass(frozen=True)
+class Layout:
+    """Pixel positions and sizes for one screen resolution.
+
+    Everything is computed once in ``for_resolution`` so the render functions
+    read plain ints instead of calling ``scale`` per element and per frame. The
+    fonts are sized for the resolution too.
+    Slot positions that depend on a count (cards in hand, monsters) are cached
+    per count.
+    """
+
+    width: int
+    height: int
+    card_width: int
+    card_height: int
+    card_spacing: int
+    icon_size: int
+    unit_size: int  # player and monster sprites
+
+    header_height: int
+    header_text: Point  # score, top left
+    header_text_y: int  # level, centred
+    hand_y: int
+    hand_panel_height: int
+
+    bar_height: int
+    bar_gap: int  # between a unit and its health bar
+    energy_bar_gap: int  # between the player and the energy bar
+    player_x: int
+    player_status_rise: int
+    monster_status_rise: int
+    monster_spacing: int
+    monster_margin: int
+    frame_padding: int
+    damage_badge_offset: int
+    intention_rise: int
+
+    font: pygame.font.Font = field(compare=False)
+    small_font: pygame.font.Font = field(compare=False)
+    card_font: pygame.font.Font = field(compare=False)
+
+    def scale(self, original_pixel_weight: int) -> int:
+        """config.scale for this resolution, for screens drawn rarely enough
+        not to need a precomputed field."""
+        return round(original_pixel_weight / CALIBRATED_WIDTH * self.width)
+
+    @classmethod
+    def for_resolution(cls, width: int, height: int) -> "Layout":
+        def scale(px: int) -> int:
+            return round(px / CALIBRATED_WIDTH * width)
+
+        card_height = scale(240)
+        icon_size = scale(36)
+        return cls(
+            width=width,
+            height=height,
+            card_width=scale(160),
+            card_height=card_height,
+            card_spacing=scale(10),
+            icon_size=icon_size,
+            unit_size=scale(130),
+            header_height=scale(50),
+            header_text=(scale(10), scale(15)),
+            header_text_y=scale(15),
+            hand_y=height - card_height - scale(20),
+            hand_panel_height=card_height + scale(40),
+            bar_height=scale(20),
+            bar_gap=scale(10),
+            energy_bar_gap=scale(35),
+            player_x=scale(120),
+            player_status_rise=scale(50),
+            monster_status_rise=scale(30),
+            monster_spacing=scale(50),
+            monster_margin=scale(120),
+            frame_padding=scale(5),
+            damage_badge_offset=scale(12),
+            intention_rise=icon_size + scale(5),
+            font=pygame.font.Font(None, scale(26)),
+            small_font=pygame.font.Font(None, scale(23)),
+            card_font=pygame.font.Font(None, scale(30)),
+        )
+
+    @lru_cache(maxsize=16)
+    def card_slots(self, count: int) -> Tuple[Point, ...]:
+        """Top-left corners of ``count`` cards centred along the bottom."""
+        step = self.card_width + self.card_spacing
+        start_x = (self.width - (count * step - self.card_spacing)) // 2
+        return tuple((start_x + i * step, self.hand_y) for i in range(count))
+
+    @lru_cache(maxsize=16)
+    def monster_grid(self, count: int) -> MonsterGrid:
+        """Rows of up to MONSTERS_PER_ROW monsters, right-aligned and centred
+        vertically just above the middle of the screen."""
+        size, spacing = self.unit_size, self.monster_spacing
+        rows = (count + MONSTERS_PER_ROW - 1) // MONSTERS_PER_ROW
+        total_height = rows * (size + spacing) - spacing
+        start_y = (self.height - total_height) // 2 - size
+        slots = []
+        for index in range(count):
+            row, column = divmod(index, MONSTERS_PER_ROW)
+            in_row = min(MONSTERS_PER_ROW, count - row * MONSTERS_PER_ROW)
+            row_width = in_row * size + (in_row - 1) * spacing
+            row_start = self.width - self.monster_margin - row_width
+            offset = column * (size + spacing)
+            y = start_y + row * (size + spacing)
+            slots.append(MonsterSlot(row_start + offset, y, row_start, offset))
+        return MonsterGrid(tuple(slots), start_y + total_height // 2)
+
+
+_current: Optional[Layout] = None
+
+
+def get_layout() -> Layout:
+    global _current
+    if _current is None:
+        _current = Layout.for_resolution(SCREEN_WIDTH, SCREEN_HEIGHT)
+    return _current
+
+
+def set_resolution(width: int, height: int) -> Layout:
+    """Rebuild the layout for a new resolution and drop every cached surface
+    that was drawn for the old one."""
+    global _current
+    _current = Layout.for_resolution(width, height)
+    render_cache.clear()
+    sprite_cache.clear()
+    card_face_cache.clear()
+    return _current
@@ -1,6 +1,6 @@
 import pygame
 from deckdeep.game import Game
-from deckdeep.config import SCREEN_WIDTH, SCREEN_HEIGHT
+from deckdeep.display import DisplayManager
 from deckdeep.logger import setup_game_logger
 
 
@@ -10,10 +10,11 @@ def main():
     logger.info("Starting Deckdeep Deckbuilder", category="SYSTEM")
 
     pygame.init()
-    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    display = DisplayManager()
+    screen = display.set_mode()
     pygame.display.set_caption("Deckdeep Deckbuilder")
 
-    game = Game(screen, logger)
+    game = Game(screen, logger, display)
     game.run()
 
     logger.info("Shutting down Deckdeep Deckbuilder", category="SYSTEM")
@@ -1,7 +1,20 @@
-from typing import List, Dict, Optional, TYPE_CHECKING, Union
+from typing import (
+    Callable,
+    List,
+    Dict,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    TYPE_CHECKING,
+    Union,
+)
 import random
 import math
+import numpy as np
 from abc import ABC, abstractmethod
+from functools import lru_cache
+from itertools import accumulate
 from deckdeep.status_effect import (
     StatusEffectManager,
     Bleed,
@@ -14,6 +27,7 @@ from enum import Enum
 from deckdeep.custom_types import Health
 
 if TYPE_CHECKING:
+    from deckdeep.monster_group import MonsterGroup
     from deckdeep.player import Player
 
 
@@ -46,8 +60,15 @@ class Ability(ABC):
         pass
 
     @abstractmethod
+    def power(self, max_health, damage, spell_power):
+        """Power contribution with the given stats.
+
+        Written with numpy ufuncs (``np.rint`` rounds half to even like
+        ``round``), so the stats may be scalars or equally shaped arrays.
+        """
+
     def calculate_power_contribution(self, user: "Monster") -> float:
-        pass
+        return self.power(float(user.max_health), user.damage, user.spell_power)
 
     @property
     def power_contribution(self):
@@ -85,8 +106,8 @@ class BasicAttack(Ability):
             total_damage += damage
         return f"{user.name} attacks {self.num_attacks} times for a total of {total_damage} damage!"
 
-    def calculate_power_contribution(self, user: "Monster") -> float:
-        return float(user.damage) * self.num_attacks
+    def power(self, max_health, damage, spell_power):
+        return damage * self.num_attacks
 
 
 class SneakAttack(Ability):
@@ -98,8 +119,8 @@ class SneakAttack(Ability):
         target.take_damage(damage)
         return f"{user.name} performs a Sneak Attack for {damage} damage!"
 
-    def calculate_power_contribution(self, user: "Monster") -> float:
-        return round(float(user.damage) * 1.5)
+    def power(self, max_health, damage, spell_power):
+        return np.rint(damage * 1.5)
 
 
 class InfectiousBite(Ability):
@@ -114,8 +135,8 @@ class InfectiousBite(Ability):
         target.status_effects.add_effect(bleed)
         return f"{user.name} inflicts an Infectious Bite, causing {bleed_damage} Bleed!"
 
-    def calculate_power_contribution(self, user: "Monster") -> float:
-        return max(round(float(user.damage) * 0.25), 1)
+    def power(self, max_health, damage, spell_power):
+        return np.maximum(np.rint(damage * 0.25), 1)
 
 
 class Rage(Ability):
@@ -127,8 +148,8 @@ class Rage(Ability):
         user.damage = round(user.damage * 1.2)
         return f"{user.name} enters a Rage, increasing damage from {old_damage} to {user.damage}!"
 
-    def calculate_power_contribution(self, user: "Monster") -> float:
-        return round(float(user.damage) * 0.2)
+    def power(self, max_health, damage, spell_power):
+        return np.rint(damage * 0.2)
 
 
 class BattleCry(Ability):
@@ -140,8 +161,8 @@ class BattleCry(Ability):
         user.heal(heal_amount)
         return f"{user.name} uses Battle Cry, healing for {heal_amount}!"
 
-    def calculate_power_contribution(self, user):
-        return round(user.spell_power * 0.5)
+    def power(self, max_health, damage, spell_power):
+        return np.rint(spell_power * 0.5)
 
 
 class ShieldUp(Ability):
@@ -153,8 +174,8 @@ class ShieldUp(Ability):
         user.grant_shields(shield_amount)
         return f"{user.name} uses Shield Up, gaining {shield_amount} shields!"
 
-    def calculate_power_contribution(self, user: "Monster") -> float:
-        return round(float(user.max_health) * 0.3)
+    def power(self, max_health, damage, spell_power):
+        return np.rint(max_health * 0.3)
 
 
 class Regenerate(Ability):
@@ -166,8 +187,8 @@ class Regenerate(Ability):
         user.heal(heal_amount)
         return f"{user.name} Regenerates, healing for {heal_amount}!"
 
-    def calculate_power_contribution(self, user: "Monster") -> float:
-        return round(float(user.max_health) * 0.25)
+    def power(self, max_health, damage, spell_power):
+        return np.rint(max_health * 0.25)
 
 
 class Fortify(Ability):
@@ -179,8 +200,8 @@ class Fortify(Ability):
         user.grant_shields(shield_amount)
         return f"{user.name} Fortifies, gaining {shield_amount} shields!"
 
-    def calculate_power_contribution(self, user: "Monster") -> float:
-        return round(float(user.max_health) * 0.2)
+    def power(self, max_health, damage, spell_power):
+        return np.rint(max_health * 0.2)
 
 
 class PowerOverTime(Ability):
@@ -194,8 +215,8 @@ class PowerOverTime(Ability):
         target.take_damage(damage_dealt)
         return f"{user.name}'s power increases from {old_damage} to {user.damage} and deals {damage_dealt} damage!"
 
-    def calculate_power_contribution(self, user: "Monster") -> float:
-        return round(float(user.damage) * 0.2) + user.damage
+    def power(self, max_health, damage, spell_power):
+        return np.rint(damage * 0.2) + damage
 
 
 class Curse(Ability):
@@ -208,8 +229,8 @@ class Curse(Ability):
         target.status_effects.add_effect(bleed)
         return f"{user.name} Curses the target, causing {bleed_damage} Bleed!"
 
-    def calculate_power_contribution(self, user: "Monster") -> float:
-        return max(round(user.spell_power * 0.2), 1)
+    def power(self, max_health, damage, spell_power):
+        return np.maximum(np.rint(spell_power * 0.2), 1)
 
 
 class MagicMissile(Ability):
@@ -222,8 +243,8 @@ class MagicMissile(Ability):
         target.take_damage(damage)
         return f"{user.name} casts Magic Missile for {damage} damage!"
 
-    def calculate_power_contribution(self, user: "Monster") -> float:
-        return round(user.spell_power + round(user.spell_power * 0.4))
+    def power(self, max_health, damage, spell_power):
+        return np.rint(spell_power + np.rint(spell_power * 0.4))
 
 
 class TrollRegeneration(Ability):
@@ -238,8 +259,8 @@ class TrollRegeneration(Ability):
         user.status_effects.add_effect(regen)
         return f"{user.name} uses Troll Regeneration, healing for {heal_amount} and gaining {regen_amount} Health Regeneration!"
 
-    def calculate_power_contribution(self, user: "Monster") -> float:
-        return round(float(user.max_health) * 0.1) + round(user.spell_power * 0.3)
+    def power(self, max_health, damage, spell_power):
+        return np.rint(max_health * 0.1) + np.rint(spell_power * 0.3)
 
 
 class FireBreath(Ability):
@@ -253,9 +274,9 @@ class FireBreath(Ability):
         target.status_effects.add_effect(bleed)
         return f"{user.name} breathes fire for {damage} damage and inflicts {v} Bleed!"
 
-    def calculate_power_contribution(self, user):
-        damage = round(user.spell_power * 1.5)
-        return damage + round(damage * 0.1)
+    def power(self, max_health, damage, spell_power):
+        damage = np.rint(spell_power * 1.5)
+        return damage + np.rint(damage * 0.1)
 
 
 class Corruption(Ability):
@@ -269,8 +290,8 @@ class Corruption(Ability):
         target.status_effects.add_effect(bleed)
         return f"{user.name} corrupts the target, causing {bleed_damage} Bleed!"
 
-    def calculate_power_contribution(self, user):
-        return round(user.spell_power * 0.3)
+    def power(self, max_health, damage, spell_power):
+        return np.rint(spell_power * 0.3)
 
 
 class HolyLight(Ability):
@@ -282,8 +303,8 @@ class HolyLight(Ability):
         user.heal(heal_amount)
         return f"{user.name} uses Holy Light, healing for {heal_amount}!"
 
-    def calculate_power_contribution(self, user):
-        return round(float(user.max_health) * 0.3)
+    def power(self, max_health, damage, spell_power):
+        return np.rint(max_health * 0.3)
 
 
 class DivineShield(Ability):
@@ -295,8 +316,8 @@ class DivineShield(Ability):
         user.grant_shields(shield_amount)
         return f"{user.name} gains a Divine Shield of {shield_amount}!"
 
-    def calculate_power_contribution(self, user: "Monster") -> float:
-        return round(float(user.max_health) * 0.4)
+    def power(self, max_health, damage, spell_power):
+        return np.rint(max_health * 0.4)
 
 
 class PoisonDart(Ability):
@@ -308,8 +329,8 @@ class PoisonDart(Ability):
         target.take_damage(damage)
         return f"{user.name} fires a Poison Dart for {damage} damage!"
 
-    def calculate_power_contribution(self, user: "Monster") -> float:
-        return round(user.spell_power * 0.5)
+    def power(self, max_health, damage, spell_power):
+        return np.rint(spell_power * 0.5)
 
 
 class ThunderClap(Ability):
@@ -325,8 +346,9 @@ class ThunderClap(Ability):
             f"{user.name} uses Thunder Clap for {damage} damage and applies 1 Weakness!"
         )
 
-    def calculate_power_contribution(self, user):
-        return round(user.damage * 0.8 * 1.25)  # Estimating the value of Weakness
+    def power(self, max_health, damage, spell_power):
+        # Estimating the value of Weakness
+        return np.rint(damage * 0.8 * 1.25)
 
 
 class LifeDrain(Ability):
@@ -340,9 +362,9 @@ class LifeDrain(Ability):
         user.heal(heal)
         return f"{user.name} uses Life Drain, dealing {damage} damage and healing for {heal}!"
 
-    def calculate_power_contribution(self, user):
-        damage = round(user.spell_power * 0.7)
-        return damage + round(damage * 0.5)
+    def power(self, max_health, damage, spell_power):
+        damage = np.rint(spell_power * 0.7)
+        return damage + np.rint(damage * 0.5)
 
 
 class Enfeeblement(Ability):
@@ -353,8 +375,28 @@ class Enfeeblement(Ability):
         target.status_effects.add_effect(Weakness(v := max(1, user.spell_power // 5)))
         return f"{user.name} Enfeebles the target, causing {v} Weakness!"
 
-    def calculate_power_contribution(self, user):
-        return max(1, user.spell_power // 5) * 3
+    def power(self, max_health, damage, spell_power):
+        return np.maximum(1, spell_power // 5) * 3
+
+
+class StatRoll(NamedTuple):
+    """Rolled stats for a monster candidate, rated without building a Monster."""
+
+    max_health: int
+    damage: int
+    spell_power: int
+
+
+@lru_cache(maxsize=None)
+def level_baseline(level: int) -> Tuple[float, float, float]:
+    """Unrounded base (health, damage, spell power) for a level, before type multipliers."""
+    growth = math.log(level + 1, 3)
+    return 12 + growth * 8, 6 + growth * 3, 6 + growth * 3
+
+
+@lru_cache(maxsize=None)
+def cumulative_rarity_weights(monster_types: Sequence["MonsterType"]) -> List[float]:
+    return list(accumulate(1 / mt.rarity for mt in monster_types))
 
 
 class MonsterType:
@@ -376,6 +418,40 @@ class MonsterType:
         self.rarity = rarity
         self.abilities = abilities
 
+        # Bound once, so a rating is one call per ability
+        self.power_terms: List[Tuple[Callable, float]] = [
+            (ability.power, ability.probability) for ability in abilities
+        ]
+        # Ratings only depend on the stats, which take few distinct values
+        self._ratings: Dict[Tuple[float, int, int], float] = {}
+
+    def power_rating(self, max_health, damage, spell_power):
+        """Power rating for the given stats.
+
+        Scalar stats are memoized. Equally shaped numpy arrays are accepted too,
+        so a whole batch of candidate stat rolls is scored in one call.
+        """
+        key = (max_health, damage, spell_power)
+        try:
+            return self._ratings[key]
+        except KeyError:
+            rating = self._ratings[key] = float(self._rate(*key))
+            return rating
+        except TypeError:  # unhashable arrays
+            return self._rate(max_health, damage, spell_power)
+
+    def _rate(self, max_health, damage, spell_power):
+        ability_power = sum(
+            power(max_health, damage, spell_power) * probability
+            for power, probability in self.power_terms
+        )
+        # Assuming the player deals ~6 damage per round
+        return max_health / 6 * ability_power
+
+    def estimate_power(self, stats: StatRoll) -> float:
+        """Power rating a monster of this type would get with ``stats``."""
+        return self.power_rating(stats.max_health, stats.damage, stats.spell_power)
+
 
 class Monster:
     monster_types: List[MonsterType] = [
@@ -531,12 +607,33 @@ class Monster:
         ),
     ]
 
+    @classmethod
+    def choose_type(cls, is_boss: bool = False) -> MonsterType:
+        types = cls.boss_types if is_boss else cls.monster_types
+        return random.choices(
+            types, cum_weights=cumulative_rarity_weights(tuple(types)), k=1
+        )[0]
+
+    @staticmethod
+    def roll_stats(level: int, monster_type: MonsterType) -> StatRoll:
+        base_health, base_damage, base_spell_power = level_baseline(level)
+        return StatRoll(
+            round(base_health * monster_type.health_mult * random.uniform(0.9, 1.1)),
+            round(base_damage * monster_type.damage_mult * random.uniform(0.9, 1.1)),
+            round(
+                base_spell_power
+                * monster_type.spell_power_mult
+                * random.uniform(0.9, 1.1)
+            ),
+        )
+
     @classmethod
     def generate(
         cls,
         level: int,
         is_boss: bool = False,
         monster_type: Optional[Union[str, MonsterType]] = None,
+        stats: Optional[StatRoll] = None,
     ) -> "Monster":
         if isinstance(monster_type, str):
             # Find the MonsterType object that matches the given name
@@ -552,35 +649,15 @@ class Monster:
                 raise ValueError(f"No monster type found with name: {monster_type}")
         else:
             if is_boss:
-                selected_monster_type = random.choices(
-                    cls.boss_types,
-                    weights=[1 / mt.rarity for mt in cls.boss_types],
-                    k=1,
-                )[0]
+                selected_monster_type = cls.choose_type(is_boss=True)
             else:
                 if monster_type:
                     selected_monster_type = monster_type
                 else:
-                    selected_monster_type = random.choices(
-                        cls.monster_types,
-                        weights=[1 / mt.rarity for mt in cls.monster_types],
-                        k=1,
-                    )[0]
-
-        base_health = 12 + math.log(level + 1, 3) * 8
-        base_damage = 6 + math.log(level + 1, 3) * 3
-        base_spell_power = 6 + math.log(level + 1, 3) * 3
-
-        health = round(
-            base_health * selected_monster_type.health_mult * random.uniform(0.9, 1.1)
-        )
-        damage = round(
-            base_damage * selected_monster_type.damage_mult * random.uniform(0.9, 1.1)
-        )
-        spell_power = round(
-            base_spell_power
-            * selected_monster_type.spell_power_mult
-            * random.uniform(0.9, 1.1)
+                    selected_monster_type = cls.choose_type()
+
+        health, damage, spell_power = stats or cls.roll_stats(
+            level, selected_monster_type
         )
 
         image_path = f"./assets/images/characters/{selected_monster_type.name.lower().replace(' ', '_')}.png"
@@ -614,7 +691,9 @@ class Monster:
         level: int = 1,
     ):
         self.name: str = name
-        self.health: Health = Health(health)
+        # Group to notify when this monster dies or comes back; set by MonsterGroup
+        self.group: Optional["MonsterGroup"] = None
+        self.health = Health(health)
         self.max_health: Health = Health(health)
         self.damage: int = damage
         self.spell_power: int = spell_power
@@ -636,19 +715,35 @@ class Monster:
         self.is_dying = False
         self.death_start_time = 0
 
+    @property
+    def health(self) -> Health:
+        return self._health
+
+    @health.setter
+    def health(self, health: Health):
+        previous = self.__dict__.get("_health")
+        self._health = health
+        crossed_zero = previous is None or (previous.value > 0) != (health.value > 0)
+        if crossed_zero and self.group is not None:
+            self.group.invalidate()
+
+    @property
+    def is_dying(self) -> bool:
+        return self._is_dying
+
+    @is_dying.setter
+    def is_dying(self, is_dying: bool):
+        changed = self.__dict__.get("_is_dying") != is_dying
+        self._is_dying = is_dying
+        if changed and self.group is not None:
+            self.group.invalidate()
+
     def calculate_power_rating(self) -> float:
-        base_survivability = (
-            float(self.max_health) / 6
-        )  # Assuming the player deals ~6 damage per round
-        ability_power = (
-            sum(
-                self.calculate_ability_power(ability)
-                for ability in self.monster_type.abilities
-            )
-            if self.monster_type
-            else 0
+        if not self.monster_type:
+            return 0
+        return self.monster_type.power_rating(
+            float(self.max_health), self.damage, self.spell_power
         )
-        return base_survivability * ability_power
 
     def calculate_ability_power(self, ability: Ability) -> float:
         # Calculate the power contribution without applying effects
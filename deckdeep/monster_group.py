@@ -1,35 +1,76 @@
 from typing import List, Tuple, Optional
 from deckdeep.monster import Monster
+from deckdeep.encounter import EncounterComposer
 import random
 from typing import Dict
 import math
 
+encounter_composer = EncounterComposer(Monster.monster_types, max_monsters=5)
+
 
 class MonsterGroup:
+    # Power budget of a level-0 encounter; tune.py fits this against simulations
+    base_power: float = 15
+
     def __init__(self, monsters: Optional[List[Monster]] = None):
-        self.monsters: List[Monster] = monsters if monsters is not None else []
+        self._alive: Optional[List[Monster]] = None
+        self._alive_version = 0
+        self._selection: Optional[Tuple[int, int]] = None
+        self.monsters = monsters if monsters is not None else []
         self.selected_index = 0
 
     def __str__(self):
         return ", ".join([str(monster) for monster in self.monsters])
 
+    @property
+    def monsters(self) -> List[Monster]:
+        return self._monsters
+
+    @monsters.setter
+    def monsters(self, monsters: List[Monster]):
+        self._monsters = monsters
+        for monster in monsters:
+            monster.group = self
+        self.invalidate()
+
+    def invalidate(self):
+        """Called by monsters whose health crosses zero or whose death animation
+        starts, so the alive index is rebuilt on next use."""
+        self._alive = None
+
+    @property
+    def alive_monsters(self) -> List[Monster]:
+        """Monsters that can be targeted, in group order."""
+        if self._alive is None:
+            self._alive = [m for m in self._monsters if m.is_alive() and not m.is_dying]
+            self._alive_version += 1
+        return self._alive
+
     def add_monster(self, monster: Monster):
-        self.monsters.append(monster)
-        if len(self.monsters) == 1:
+        self._monsters.append(monster)
+        monster.group = self
+        self.invalidate()
+        if len(self._monsters) == 1:
             monster.selected = True
 
     def _update_selection(self):
-        alive_monsters = [m for m in self.monsters if m.is_alive() and not m.is_dying]
+        alive_monsters = self.alive_monsters
         if not alive_monsters:
             self.selected_index = 0
             return
 
         self.selected_index = self.selected_index % len(alive_monsters)
-        for _, monster in enumerate(self.monsters):
-            monster.selected = monster == alive_monsters[self.selected_index]
+        # Selection flags only change with the alive set or the index
+        selection = (self._alive_version, self.selected_index)
+        if selection == self._selection:
+            return
+        self._selection = selection
+        selected = alive_monsters[self.selected_index]
+        for monster in self._monsters:
+            monster.selected = monster is selected
 
     def select_next(self):
-        alive_monsters = [m for m in self.monsters if m.is_alive() and not m.is_dying]
+        alive_monsters = self.alive_monsters
         if not alive_monsters:
             return
         selected_monster = self.get_selected_monster()
@@ -50,7 +91,7 @@ class MonsterGroup:
         return int(sum(monster.calculate_power_rating() for monster in self.monsters))
 
     def select_previous(self):
-        alive_monsters = [m for m in self.monsters if m.is_alive() and not m.is_dying]
+        alive_monsters = self.alive_monsters
         if not alive_monsters:
             return
         selected_monster = self.get_selected_monster()
@@ -62,14 +103,16 @@ class MonsterGroup:
         self._update_selection()
 
     def get_selected_monster(self) -> Optional[Monster]:
-        alive_monsters = [m for m in self.monsters if m.is_alive() and not m.is_dying]
+        alive_monsters = self.alive_monsters
         if not alive_monsters:
             return None
         self._update_selection()
         return alive_monsters[self.selected_index]
 
     def remove_dead_monsters(self):
-        self.monsters = [monster for monster in self.monsters if monster.is_alive()]
+        alive = [monster for monster in self._monsters if monster.is_alive()]
+        if len(alive) != len(self._monsters):
+            self.monsters = alive
         self._update_selection()
 
     def attack(self, player):
@@ -97,13 +140,10 @@ class MonsterGroup:
         def scaling_factor(lvl):
             return 1 + math.log(lvl + 1, 2)  # Logarithmic scaling
 
-        base_power = 15
+        base_power = cls.base_power
         target_power = int(base_power * scaling_factor(level))
         target_power = int(target_power * random.uniform(0.9, 1.1))
 
-        current_power = 0
-        max_monsters = 5
-
         boss_groups = {
             "corrupted_paladin": ["Guardian_1", "Guardian_1"],
             "troll_king": ["goblin_1", "goblin_1"],
@@ -118,19 +158,16 @@ class MonsterGroup:
                 minion = Monster.generate(max(level - 10, 2), monster_type=minion_type)
                 monster_group.add_monster(minion)
         else:
-            attempts = 0
-            while (
-                current_power < target_power
-                and len(monster_group.monsters) < max_monsters
+            # Widest band any roll of target_power can ask for at this level, so
+            # every call shares one composition table per level
+            band_top = int(base_power * scaling_factor(level)) * 1.1 * 1.2
+            for monster_type in encounter_composer.compose(
+                level, target_power, target_power * 1.2, band_top=band_top
             ):
-                new_monster = Monster.generate(level)
-                if (
-                    current_power + new_monster.power_rating > target_power * 1.2
-                    and attempts < 5
-                ):
-                    continue
-                monster_group.add_monster(new_monster)
-                current_power += int(new_monster.power_rating)
+                stats = Monster.roll_stats(level, monster_type)
+                monster_group.add_monster(
+                    Monster.generate(level, monster_type=monster_type, stats=stats)
+                )
 
         actual_power = monster_group.get_power_rating()
         assert monster_group.monsters, "Generated MonsterGroup is empty"
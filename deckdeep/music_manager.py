@@ -1,41 +1,144 @@
 import pygame
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 import random
+from typing import Optional, Tuple
 
+MUSIC_EXTENSIONS = (".mp3", ".ogg", ".wav")
+MUSIC_CHANNELS = 2  # reserved, so sound effects never take them
 
-class BackgroundMusicManager:
-    def __init__(self, music_directory: str, volume: float = 0.20):
-        self.music_files = [
+
+@lru_cache(maxsize=None)
+def scan_music(music_directory: str) -> Tuple[str, ...]:
+    """Playable files in ``music_directory``, listed once per process."""
+    return tuple(
+        sorted(
             str(f)
             for f in Path(music_directory).iterdir()
-            if f.suffix in [".mp3", ".ogg", ".wav"]
-        ]
+            if f.suffix in MUSIC_EXTENSIONS
+        )
+    )
+
+
+class BackgroundMusicManager:
+    """Shuffled background music, decoded ahead of time and crossfaded.
+
+    The next track is decoded into a ``pygame.mixer.Sound`` on a worker thread
+    while the current one plays, so changing tracks never loads a file on the
+    main thread. A decoded track is raw PCM (about 30 MB for a 4 MB MP3), so
+    decoding only starts ``decode_margin_ms`` before the crossfade; for most of
+    a track just the current one is resident. Tracks alternate between two
+    reserved channels so one can fade out while the next fades in. Call
+    ``update`` once per frame to start the decode and the crossfade;
+    ``handle_event`` covers a track that ends before that.
+
+    One manager can be entered for every run: a next track decoded before the
+    run ended is kept for the next one, and the directory is only scanned once.
+    """
+
+    def __init__(
+        self,
+        music_directory: str,
+        volume: float = 0.20,
+        crossfade_ms: int = 3000,
+        decode_margin_ms: int = 5000,
+    ):
+        self.music_files = list(scan_music(music_directory))
         random.shuffle(self.music_files)
         self.current_track_index = 0
         self.volume = max(0.0, min(1.0, volume))
+        self.crossfade_ms = crossfade_ms
+        self.decode_margin_ms = decode_margin_ms
+        self._loader = ThreadPoolExecutor(max_workers=1, thread_name_prefix="music")
+        self._next: Optional[Future] = None
+        self._next_index = 0
+        self._channels: Tuple[pygame.mixer.Channel, ...] = ()
+        self._active = 0  # index into _channels of the current track
+        self._current: Optional[pygame.mixer.Sound] = None
+        self._started_at = 0  # pygame ticks
+        self._length_ms = 0
 
     def __enter__(self):
         if not self.music_files:
             print("No music files found.")
             return self
-        pygame.mixer.music.load(self.music_files[self.current_track_index])
-        pygame.mixer.music.set_volume(self.volume)
-        pygame.mixer.music.play()
-        pygame.mixer.music.set_endevent(pygame.USEREVENT)
+        if not self._channels:
+            pygame.mixer.set_reserved(MUSIC_CHANNELS)
+            self._channels = tuple(
+                pygame.mixer.Channel(i) for i in range(MUSIC_CHANNELS)
+            )
+            for channel in self._channels:
+                channel.set_endevent(pygame.USEREVENT)
+        if self._next is None:
+            self._prefetch(self._next_index)
+        # Only the very first track is waited for; later runs find it decoded
+        self._start_next(fade_ms=0, wait=True)
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        pygame.mixer.music.stop()
+        for channel in self._channels:
+            channel.stop()
+        self._current = None
+
+    def _prefetch(self, index: int):
+        self._next_index = index
+        self._next = self._loader.submit(pygame.mixer.Sound, self.music_files[index])
+
+    def _start_next(self, fade_ms: int, wait: bool = False) -> bool:
+        """Crossfade to the prefetched track, unless it is still decoding."""
+        if self._next is None or not (wait or self._next.done()):
+            return False
+        try:
+            sound = self._next.result()
+        except Exception:
+            print(f"Unable to load music: {self.music_files[self._next_index]}")
+            sound = None
+        self.current_track_index = self._next_index
+        # Decoded once the track nears its end, see update
+        self._next = None
+        self._next_index = random.randint(0, len(self.music_files) - 1)
+        if sound is None:
+            return False
+
+        if fade_ms:
+            self._channels[self._active].fadeout(fade_ms)
+        else:
+            self._channels[self._active].stop()
+        self._active = (self._active + 1) % len(self._channels)
+        sound.set_volume(self.volume)
+        self._channels[self._active].play(sound, fade_ms=fade_ms)
+        self._current = sound
+        self._started_at = pygame.time.get_ticks()
+        self._length_ms = int(sound.get_length() * 1000)
+        return True
+
+    def update(self):
+        """Start decoding the next track, then the crossfade, as the current
+        track nears its end."""
+        if self._current is None:
+            return
+        remaining = self._length_ms - (pygame.time.get_ticks() - self._started_at)
+        if (
+            self._next is None
+            and remaining <= self.crossfade_ms + self.decode_margin_ms
+        ):
+            self._prefetch(self._next_index)
+        if remaining <= self.crossfade_ms:
+            self._start_next(self.crossfade_ms)
 
     def handle_event(self, event):
-        if event.type == pygame.USEREVENT:
-            self.current_track_index = random.randint(0, len(self.music_files) - 1)
-            pygame.mixer.music.load(self.music_files[self.current_track_index])
-            pygame.mixer.music.set_volume(
-                self.volume
-            )  # Set the volume for the new track
-            pygame.mixer.music.play()
+        # Also fired by the channel that just faded out, which is not the current
+        if (
+            event.type == pygame.USEREVENT
+            and self._current is not None
+            and not self._channels[self._active].get_busy()
+        ):
+            if self._next is None:
+                self._prefetch(self._next_index)
+            self._start_next(fade_ms=0)
 
     def set_volume(self, volume: float):
         self.volume = max(0.0, min(1.0, volume))  # Ensure volume is between 0.0 and 1.0
-        pygame.mixer.music.set_volume(self.volume)
+        if self._current is not None:
+            self._current.set_volume(self.volume)
@@ -0,0 +1,125 @@
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pygame
+
+from deckdeep.render_cache import sprite_cache
+from deckdeep.renderer import get_renderer
+
+Color = Tuple[int, int, int]
+
+
+def particle_sprite(color: Color, radius: int) -> pygame.Surface:
+    """A filled circle on a transparent square, drawn once per colour and size."""
+
+    def build() -> pygame.Surface:
+        # Opaque with a colour key rather than per-pixel alpha: RLE-accelerated
+        # colour-keyed blits are several times cheaper
+        key = (0, 0, 0) if color != (0, 0, 0) else (255, 0, 255)
+        sprite = pygame.Surface((radius * 2, radius * 2))
+        if pygame.display.get_surface():
+            sprite = sprite.convert()
+        sprite.fill(key)
+        pygame.draw.circle(sprite, color, (radius, radius), radius)
+        sprite.set_colorkey(key, pygame.RLEACCEL)
+        return sprite
+
+    return sprite_cache.get(("particle", color, radius), build)
+
+
+class ParticleSystem:
+    """Circle particles stored as parallel NumPy arrays (one row per particle).
+
+    Particles move with constant velocity plus ``gravity`` and shrink linearly
+    from their start size to nothing over their lifetime. Expired particles are
+    culled with a mask on every update. Speeds are in pixels per second and times
+    in seconds.
+    """
+
+    def __init__(self, capacity: int = 10_000, gravity: float = 0.0):
+        self.capacity = capacity
+        self.gravity = gravity
+        self.palette: List[Color] = []
+        self._palette_index: Dict[Color, int] = {}
+        self.clear()
+
+    def clear(self):
+        self.positions = np.empty((0, 2))
+        self.velocities = np.empty((0, 2))
+        self.ages = np.empty(0)
+        self.lifetimes = np.empty(0)
+        self.base_sizes = np.empty(0)
+        self.colors = np.empty(0, dtype=np.intp)  # index into palette
+
+    def __len__(self) -> int:
+        return len(self.ages)
+
+    def _color_index(self, color: Color) -> int:
+        if color not in self._palette_index:
+            self._palette_index[color] = len(self.palette)
+            self.palette.append(color)
+        return self._palette_index[color]
+
+    def emit(
+        self,
+        count: int,
+        x: float,
+        y: float,
+        width: float = 0,
+        height: float = 0,
+        speed: float = 60.0,
+        sizes: Tuple[int, int] = (5, 15),
+        lifetime: float = 1.0,
+        colors: Tuple[Color, ...] = ((255, 255, 255),),
+    ):
+        """Add up to ``count`` particles spread over the given rectangle, with
+        velocities drawn uniformly from [-speed, speed] on each axis."""
+        count = min(count, self.capacity - len(self))
+        if count <= 0:
+            return
+        positions = np.random.uniform((x, y), (x + width, y + height), (count, 2))
+        velocities = np.random.uniform(-speed, speed, (count, 2))
+        palette = np.array([self._color_index(color) for color in colors])
+
+        self.positions = np.concatenate([self.positions, positions])
+        self.velocities = np.concatenate([self.velocities, velocities])
+        self.ages = np.concatenate([self.ages, np.zeros(count)])
+        self.lifetimes = np.concatenate([self.lifetimes, np.full(count, lifetime)])
+        self.base_sizes = np.concatenate(
+            [self.base_sizes, np.random.randint(sizes[0], sizes[1] + 1, count)]
+        )
+        self.colors = np.concatenate([self.colors, np.random.choice(palette, count)])
+
+    def update(self, dt: float):
+        self.ages += dt
+        alive = self.ages < self.lifetimes
+        if not alive.all():
+            self.positions = self.positions[alive]
+            self.velocities = self.velocities[alive]
+            self.ages = self.ages[alive]
+            self.lifetimes = self.lifetimes[alive]
+            self.base_sizes = self.base_sizes[alive]
+            self.colors = self.colors[alive]
+        if self.gravity:
+            self.velocities[:, 1] += self.gravity * dt
+        self.positions += self.velocities * dt
+
+    def sizes(self) -> np.ndarray:
+        return (self.base_sizes * (1 - self.ages / self.lifetimes)).astype(int)
+
+    def render(self, screen: pygame.Surface):
+        sizes = self.sizes()
+        visible = sizes > 0
+        sizes = sizes[visible]
+        corners = (self.positions[visible] - sizes[:, None]).astype(int)
+        # Look each (colour, size) sprite up once rather than once per particle
+        keys = self.colors[visible] * 65536 + sizes
+        unique, inverse = np.unique(keys, return_inverse=True)
+        sprites = np.empty(len(unique), dtype=object)
+        sprites[:] = [
+            particle_sprite(self.palette[key // 65536], key % 65536)
+            for key in unique.tolist()
+        ]
+        get_renderer().blits(
+            screen, list(zip(sprites[inverse].tolist(), corners.tolist()))
+        )
@@ -1,6 +1,8 @@
-from typing import List, Set
+from typing import TYPE_CHECKING, Callable, Iterable, List, NamedTuple, Set, Tuple
 import random
 from deckdeep.card import Card, get_player_starting_deck
+from deckdeep.card_pile import CardPile
+from deckdeep.deck_index import DeckIndex, is_curse
 from typing import Dict, Optional
 from deckdeep.status_effect import (
     StatusEffectManager,
@@ -10,12 +12,61 @@ from deckdeep.status_effect import (
     Burn,
     HealthRegain,
     EnergyBonus,
+    StatusEffect,
     TriggerType,
 )
 from deckdeep.relic import Relic
 from deckdeep.relic import TriggerWhen
 from deckdeep.custom_types import Health, Energy
 
+if TYPE_CHECKING:
+    from deckdeep.monster import Monster
+
+# (effect constructor, value per hit, whether repeated applications stack)
+PlannedEffect = Tuple[Callable[[int], StatusEffect], int, bool]
+
+
+class EffectPlan(NamedTuple):
+    """The status effects one hit of a card applies, resolved once per definition."""
+
+    on_target: Tuple[PlannedEffect, ...]
+    on_self: Tuple[PlannedEffect, ...]
+
+
+def _plan(pairs) -> Tuple[PlannedEffect, ...]:
+    return tuple(
+        (effect_type, value, effect_type(value).stack)
+        for effect_type, value in pairs
+        if value > 0
+    )
+
+
+_effect_plans: Dict[int, EffectPlan] = {}
+
+
+def effect_plan(card: Card) -> EffectPlan:
+    plan = _effect_plans.get(card.definition_id)
+    if plan is None:
+        plan = _effect_plans[card.definition_id] = EffectPlan(
+            _plan([(Bleed, card.bleed), (Weakness, card.weakness), (Burn, card.burn)]),
+            _plan(
+                [
+                    (Bolster, card.bolster),
+                    (HealthRegain, card.health_regain),
+                    (EnergyBonus, card.energy_bonus),
+                ]
+            ),
+        )
+    return plan
+
+
+def apply_planned(
+    manager: StatusEffectManager, effects: Tuple[PlannedEffect, ...], hits: int
+):
+    """Same result as adding each effect ``hits`` times, in a single add."""
+    for effect_type, value, stack in effects:
+        manager.add_effect(effect_type(value * hits if stack else value))
+
 
 class Player:
     @classmethod
@@ -33,16 +84,17 @@ class Player:
         self.bonus_energy = 0
         self.symbol = symbol
         self.hand_limit = 7
-        self.deck: List[Card] = get_player_starting_deck()
-        self.hand: List[Card] = []
-        self.discard_pile: List[Card] = []
+        self.deck = CardPile(get_player_starting_deck())
+        self.hand = CardPile()
+        self.discard_pile = CardPile()
+        self._deck_index = DeckIndex()
         self.size = 100
         self.shake = 0
         self.health_gain_on_skip = 5
         self.cards_drawn_per_turn = 5
         self.hp_regain_per_level = 2
         self.status_effects = StatusEffectManager()
-        self.relics: List[Relic] = []
+        self.relics = []
         self.strength = 0
         self.dodge_chance = 0
         self.cards_per_turn = 5
@@ -52,6 +104,64 @@ class Player:
         self.is_dying = False
         self.death_start_time = 0
 
+    # The piles accept plain lists (loading, snapshots, tests) and store CardPiles
+
+    @property
+    def relics(self) -> List[Relic]:
+        return self._relics
+
+    @relics.setter
+    def relics(self, relics: Iterable[Relic]):
+        self._relics = list(relics)
+        self._relic_triggers: Dict[TriggerWhen, List[Relic]] = {}
+        self._indexed_relics = 0
+
+    def relics_for(self, trigger: TriggerWhen) -> List[Relic]:
+        """The relics fired by ``trigger``, in the order they were gained.
+
+        Kept as one list per trigger and extended as relics are added, so a
+        trigger doesn't scan every relic. Relics appended to ``relics``
+        directly are picked up on the next call.
+        """
+        for relic in self._relics[self._indexed_relics :]:
+            self._relic_triggers.setdefault(relic.trigger_when, []).append(relic)
+        self._indexed_relics = len(self._relics)
+        return self._relic_triggers.get(trigger, [])
+
+    @property
+    def deck(self) -> CardPile:
+        return self._deck
+
+    @deck.setter
+    def deck(self, cards: Iterable[Card]):
+        self._deck = cards if isinstance(cards, CardPile) else CardPile(cards)
+        self._deck_index_stale = True
+
+    @property
+    def hand(self) -> CardPile:
+        return self._hand
+
+    @hand.setter
+    def hand(self, cards: Iterable[Card]):
+        self._hand = cards if isinstance(cards, CardPile) else CardPile(cards)
+        self._deck_index_stale = True
+
+    @property
+    def discard_pile(self) -> CardPile:
+        return self._discard_pile
+
+    @discard_pile.setter
+    def discard_pile(self, cards: Iterable[Card]):
+        self._discard_pile = cards if isinstance(cards, CardPile) else CardPile(cards)
+        self._deck_index_stale = True
+
+    def pile_of(self, card: Card) -> Optional[CardPile]:
+        """The pile holding ``card``, or None if it is not in the deck."""
+        for pile in (self.deck, self.hand, self.discard_pile):
+            if card in pile:
+                return pile
+        return None
+
     def add_applied_permanent_effect(self, effect_name: str, relic_id: str):
         if effect_name not in self.applied_permanent_effects:
             self.applied_permanent_effects[effect_name] = set()
@@ -79,11 +189,9 @@ class Player:
         return msg
 
     def apply_relic_effects(self, trigger: TriggerWhen) -> str:
-        msg = ""
-        for relic in self.relics:
-            if relic.trigger_when == trigger:
-                msg += relic.apply_effect(self, None) + " "
-        return msg.strip()
+        return " ".join(
+            relic.apply_effect(self, None) for relic in self.relics_for(trigger)
+        )
 
     def draw_card(self):
         if not self.deck:
@@ -96,7 +204,7 @@ class Player:
     def shuffle_deck(self):
         self.deck.extend(self.discard_pile)
         self.discard_pile.clear()
-        random.shuffle(self.deck)
+        self.deck.shuffle()
 
     def can_play_card(self, card: Card) -> bool:
         return self.energy.value >= card.energy_cost.value
@@ -106,22 +214,33 @@ class Player:
         if self.can_play_card(card):
             self.bonus_damage += card.bonus_damage
             total_damage = card.calculate_total_damage(self.bonus_damage, self.strength)
-
-            for _ in range(card.num_attacks):
-                if card.targets_all:
-                    score += monster_group.receive_damage(
-                        total_damage // card.num_attacks
-                    )
-                    for monster in monster_group.monsters:
-                        self.apply_card_effects(card, monster)
-                else:
-                    target_monster = monster_group.get_selected_monster()
-                    if target_monster is None:
-                        continue
-                    score += target_monster.receive_damage(
-                        total_damage // card.num_attacks
-                    )
-                    self.apply_card_effects(card, target_monster)
+            per_hit = total_damage // card.num_attacks
+
+            # Damage is dealt hit by hit (shields and the score depend on the
+            # order); status effects are summed per target and added once
+            hits: List[Tuple["Monster", int]] = []
+            if card.targets_all:
+                monsters = list(monster_group.monsters)
+                for _ in range(card.num_attacks):
+                    for monster in monsters:
+                        score += monster.receive_damage(per_hit)
+                hits = [(monster, card.num_attacks) for monster in monsters]
+            else:
+                target = None
+                count = 0
+                for _ in range(card.num_attacks):
+                    if target is None or not target.is_alive():
+                        # The selection moves on once the target dies
+                        if target is not None:
+                            hits.append((target, count))
+                        target, count = monster_group.get_selected_monster(), 0
+                        if target is None:
+                            break
+                    score += target.receive_damage(per_hit)
+                    count += 1
+                if target is not None and count:
+                    hits.append((target, count))
+            self._apply_hits(card, hits)
 
             self.heal(round(card.healing))
             self.health = Health(self.health.value - card.health_cost)
@@ -136,18 +255,18 @@ class Player:
         return score
 
     def apply_card_effects(self, card: Card, monster):
-        if hasattr(card, "bleed") and card.bleed > 0:
-            monster.status_effects.add_effect(Bleed(card.bleed))
-        if hasattr(card, "weakness") and card.weakness > 0:
-            monster.status_effects.add_effect(Weakness(card.weakness))
-        if hasattr(card, "burn") and card.burn > 0:
-            monster.status_effects.add_effect(Burn(card.burn))
-        if hasattr(card, "bolster") and card.bolster > 0:
-            self.status_effects.add_effect(Bolster(card.bolster))
-        if hasattr(card, "health_regain") and card.health_regain > 0:
-            self.status_effects.add_effect(HealthRegain(card.health_regain))
-        if hasattr(card, "energy_bonus") and card.energy_bonus > 0:
-            self.status_effects.add_effect(EnergyBonus(card.energy_bonus))
+        self._apply_hits(card, [(monster, 1)])
+
+    def _apply_hits(self, card: Card, hits: List[Tuple["Monster", int]]):
+        """Apply ``card``'s status effects for every (monster, number of hits)."""
+        plan = effect_plan(card)
+        if plan.on_target:
+            for monster, count in hits:
+                apply_planned(monster.status_effects, plan.on_target, count)
+        if plan.on_self:
+            total = sum(count for _, count in hits)
+            if total:
+                apply_planned(self.status_effects, plan.on_self, total)
 
     def heal(self, amount: int):
         self.health = Health(min(self.max_health.value, self.health.value + amount))
@@ -159,12 +278,10 @@ class Player:
         """
         -1 is for all curses to be removed
         """
-        for card in self.deck:
-            if "Curse" in card.name:
-                self.deck.remove(card)
-                amount -= 1
-            if amount == 0:
-                break
+        curses = [card for card in self.deck if is_curse(card)]
+        for card in curses if amount < 0 else curses[:amount]:
+            self.deck_index.remove(card)
+            self.deck.remove(card)
 
     def take_damage(self, damage: int) -> int:
         if random.random() < self.dodge_chance:
@@ -250,8 +367,22 @@ class Player:
         self.strength += amount
 
     def add_card_to_deck(self, card: Card):
+        self.deck_index.add(card)
         self.deck.append(card)
 
+    @property
+    def deck_index(self) -> DeckIndex:
+        # Replacing a pile marks the index stale and it is rebuilt on next use,
+        # so update the index before the piles when adding or removing a card
+        if self._deck_index_stale:
+            self.sync_deck_index()
+        return self._deck_index
+
+    def sync_deck_index(self):
+        """Rebuild the deck index from the current piles."""
+        self._deck_index.rebuild(self.deck + self.hand + self.discard_pile)
+        self._deck_index_stale = False
+
     def reset_hand(self):
         self.discard_pile.extend(self.hand)
         self.hand.clear()
@@ -329,24 +460,21 @@ class Player:
         return player
 
     def get_sorted_full_deck(self) -> List[Card]:
-        full_deck = self.deck + self.hand + self.discard_pile
-        return sorted(full_deck, key=lambda card: card.energy_cost.value)
+        return list(self.deck_index.cards)
 
     def remove_card_from_deck(self, card_index: int) -> Optional[Card]:
-        full_deck = self.get_sorted_full_deck()
+        full_deck = self.deck_index.cards
         if 0 <= card_index < len(full_deck):
             card_to_remove = full_deck[card_index]
-            if card_to_remove in self.deck:
-                self.deck.remove(card_to_remove)
-            elif card_to_remove in self.hand:
-                self.hand.remove(card_to_remove)
-            elif card_to_remove in self.discard_pile:
-                self.discard_pile.remove(card_to_remove)
+            self.deck_index.remove(card_to_remove)
+            pile = self.pile_of(card_to_remove)
+            if pile is not None:
+                pile.remove(card_to_remove)
             return card_to_remove
         return None
 
     def duplicate_card_in_deck(self, card_index: int) -> Optional[Card]:
-        full_deck = self.get_sorted_full_deck()
+        full_deck = self.deck_index.cards
         if 0 <= card_index < len(full_deck):
             card_to_duplicate = full_deck[card_index]
             new_card = Card(
@@ -365,12 +493,10 @@ class Player:
                 health_regain=card_to_duplicate.health_regain,
             )
             # Add the new card to the same pile as the original card
-            if card_to_duplicate in self.deck:
-                self.deck.append(new_card)
-            elif card_to_duplicate in self.hand:
-                self.hand.append(new_card)
-            elif card_to_duplicate in self.discard_pile:
-                self.discard_pile.append(new_card)
+            pile = self.pile_of(card_to_duplicate)
+            if pile is not None:
+                self.deck_index.add(new_card)
+                pile.append(new_card)
             return new_card
         return None
 
@@ -0,0 +1,366 @@
+import time
+from collections import OrderedDict
+from typing import Dict, Hashable, List, NamedTuple, Optional, Tuple
+
+from deckdeep.card import Card
+from deckdeep.monster import Monster
+from deckdeep.monster_group import MonsterGroup
+from deckdeep.player import Player
+from deckdeep.status_effect import Bleed, Burn, Weakness
+
+# Heuristic weights, in "points of monster health" per unit
+KILL_BONUS = 10.0
+THREAT_PER_DAMAGE = 2.0
+BLEED_VALUE = 1.5
+BURN_VALUE = 1.0
+BURN_TRIGGER = 3
+WEAKNESS_VALUE = 1.0
+EXCESS_SHIELD_VALUE = 0.25
+SELF_BUFF_VALUE = 1.0
+DRAW_VALUE = 3.0
+ENERGY_BONUS_VALUE = 3.0
+
+
+class CardModel(NamedTuple):
+    cost: int
+    damage: int
+    bonus_damage: int
+    num_attacks: int
+    targets_all: bool
+    healing: int
+    health_cost: int
+    shield: int
+    card_draw: int
+    bleed: int
+    weakness: int
+    burn: int
+    # bolster + health_regain + energy_bonus-weighted: applied to the player per hit
+    self_buff: float
+
+    @classmethod
+    def from_card(cls, card: Card) -> "CardModel":
+        return cls(
+            card.energy_cost.value,
+            card.damage,
+            card.bonus_damage,
+            card.num_attacks,
+            card.targets_all,
+            card.healing,
+            card.health_cost,
+            card.shield,
+            card.card_draw,
+            card.bleed,
+            card.weakness,
+            card.burn,
+            (card.bolster + card.health_regain) * SELF_BUFF_VALUE
+            + card.energy_bonus * ENERGY_BONUS_VALUE,
+        )
+
+    def total_damage(self, bonus_damage: int, strength: int) -> int:
+        # Same arithmetic as Card.calculate_total_damage
+        if self.damage == 0:
+            return 0
+        return (self.damage + self.bonus_damage + strength + bonus_damage) * (
+            self.num_attacks
+        )
+
+
+_models: Dict[int, CardModel] = {}
+
+
+def card_model(card: Card) -> Tuple[int, CardModel]:
+    definition_id = card.definition_id
+    model = _models.get(definition_id)
+    if model is None:
+        model = _models[definition_id] = CardModel.from_card(card)
+    return definition_id, model
+
+
+class MonsterState(NamedTuple):
+    health: int
+    shields: int
+    bleed: int
+    weakness: int
+    burn: int
+
+
+class TurnState(NamedTuple):
+    """Everything a card play can change during the player's turn."""
+
+    energy: int
+    bonus_damage: int
+    health: int
+    shield: int
+    hand: Tuple[int, ...]  # sorted card definition ids
+    monsters: Tuple[MonsterState, ...]
+    self_buff: float
+    draws: int
+
+
+class TurnContext(NamedTuple):
+    """Values that stay fixed while searching one decision."""
+
+    strength: int
+    max_health: int
+    attack: Tuple[int, ...]  # per monster damage before weakness
+
+
+# (card definition id, target index into TurnState.monsters)
+Action = Tuple[int, int]
+
+
+class TranspositionTable:
+    """LRU-bounded map from (context, position) to its evaluation."""
+
+    def __init__(self, capacity: int = 50_000):
+        self.capacity = capacity
+        self.entries: "OrderedDict[Hashable, float]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[float]:
+        value = self.entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return value
+
+    def put(self, key: Hashable, value: float):
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.capacity:
+            self.entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+
+def _effect_value(monster: Monster, effect_type) -> int:
+    for effect in monster.status_effects.effects:
+        if isinstance(effect, effect_type):
+            return effect.value
+    return 0
+
+
+def capture(player: Player, monsters: List[Monster]) -> Tuple[TurnState, TurnContext]:
+    hand = tuple(sorted(card_model(card)[0] for card in player.hand))
+    state = TurnState(
+        energy=player.energy.value,
+        bonus_damage=player.bonus_damage,
+        health=player.health.value,
+        shield=player.shield,
+        hand=hand,
+        monsters=tuple(
+            MonsterState(
+                m.health.value,
+                m.shields,
+                _effect_value(m, Bleed),
+                _effect_value(m, Weakness),
+                _effect_value(m, Burn),
+            )
+            for m in monsters
+        ),
+        self_buff=0.0,
+        draws=0,
+    )
+    context = TurnContext(
+        player.strength,
+        player.max_health.value,
+        tuple(m.damage for m in monsters),
+    )
+    return state, context
+
+
+def _hit(monster: MonsterState, damage: int) -> MonsterState:
+    # Same shield/health arithmetic as Monster.receive_damage
+    health, shields = monster.health, monster.shields
+    if shields > 0:
+        if damage > shields:
+            damage -= shields
+            shields = 0
+        else:
+            return monster._replace(shields=shields - damage)
+    return monster._replace(health=max(0, health - damage), shields=shields)
+
+
+def _debuff(monster: MonsterState, model: CardModel) -> MonsterState:
+    if not (model.bleed or model.weakness or model.burn):
+        return monster
+    return monster._replace(
+        bleed=monster.bleed + model.bleed,
+        weakness=monster.weakness + model.weakness,
+        burn=monster.burn + model.burn,
+    )
+
+
+def play(
+    state: TurnState,
+    definition_id: int,
+    model: CardModel,
+    target: int,
+    context: TurnContext,
+) -> Optional[TurnState]:
+    """The state after playing one card, mirroring Player.play_card.
+
+    Returns None when the play is not possible.
+    """
+    if model.cost > state.energy or model.health_cost >= state.health:
+        return None
+
+    bonus_damage = state.bonus_damage + model.bonus_damage
+    per_hit = model.total_damage(bonus_damage, context.strength) // model.num_attacks
+    monsters = list(state.monsters)
+    self_buff = state.self_buff
+    # MonsterGroup.selected_index: the target's position among living monsters
+    selection = sum(1 for m in monsters[:target] if m.health > 0)
+    for _ in range(model.num_attacks):
+        if model.targets_all:
+            for i, monster in enumerate(monsters):
+                monsters[i] = _debuff(_hit(monster, per_hit), model)
+                self_buff += model.self_buff
+        else:
+            if monsters[target].health <= 0:
+                # The game keeps the index, wrapped, into the shrunken alive list
+                alive = [i for i, m in enumerate(monsters) if m.health > 0]
+                if not alive:
+                    break
+                selection %= len(alive)
+                target = alive[selection]
+            monsters[target] = _debuff(_hit(monsters[target], per_hit), model)
+            self_buff += model.self_buff
+
+    hand = list(state.hand)
+    hand.remove(definition_id)
+    return TurnState(
+        energy=state.energy - model.cost,
+        bonus_damage=bonus_damage,
+        health=min(context.max_health, state.health + model.healing)
+        - model.health_cost,
+        shield=state.shield + model.shield,
+        hand=tuple(hand),
+        monsters=tuple(monsters),
+        self_buff=self_buff,
+        draws=state.draws + model.card_draw,
+    )
+
+
+def evaluate_position(state: TurnState, context: TurnContext) -> float:
+    """Heuristic value of ending the turn in ``state``, ignoring the per-turn
+    accumulators (self buffs, draws), so equal positions share one table entry."""
+    score = float(state.health)
+    incoming = 0
+    for monster, attack in zip(state.monsters, context.attack):
+        if monster.health <= 0:
+            score += KILL_BONUS + THREAT_PER_DAMAGE * attack
+            continue
+        score -= monster.health
+        incoming += max(0, attack - monster.weakness)
+        score += monster.bleed * BLEED_VALUE + monster.weakness * WEAKNESS_VALUE
+        burn = monster.burn * 4 if monster.burn >= BURN_TRIGGER else monster.burn
+        score += burn * BURN_VALUE
+
+    blocked = min(state.shield, incoming)
+    score += blocked + (state.shield - blocked) * EXCESS_SHIELD_VALUE
+    score -= incoming - blocked
+    return score
+
+
+class SearchResult(NamedTuple):
+    plan: List[Action]
+    score: float
+    nodes: int
+    elapsed: float
+    complete: bool
+
+
+class BeamSearchPolicy:
+    """Plans the rest of the turn with a beam search over card play orders.
+
+    Each decision stops expanding once ``time_budget`` seconds have passed and
+    returns the best plan found so far. Evaluations are memoized in a bounded
+    transposition table shared across decisions.
+    """
+
+    def __init__(
+        self,
+        beam_width: int = 8,
+        time_budget: float = 0.02,
+        table_size: int = 50_000,
+    ):
+        self.beam_width = beam_width
+        self.time_budget = time_budget
+        self.table = TranspositionTable(table_size)
+        self.nodes = 0
+
+    def _score(self, state: TurnState, context: TurnContext) -> float:
+        key = (context, state[:6])
+        position = self.table.get(key)
+        if position is None:
+            position = evaluate_position(state, context)
+            self.table.put(key, position)
+        return position + state.self_buff + state.draws * DRAW_VALUE
+
+    def search(self, player: Player, monsters: List[Monster]) -> SearchResult:
+        start = time.perf_counter()
+        deadline = start + self.time_budget
+        root, context = capture(player, monsters)
+        models = {d: m for d, m in map(card_model, player.hand)}
+
+        best_plan: List[Action] = []
+        best_score = self._score(root, context)
+        frontier: List[Tuple[float, TurnState, List[Action]]] = [(best_score, root, [])]
+        seen = {root}
+        nodes = 0
+        complete = True
+
+        while frontier and complete:
+            children: List[Tuple[float, TurnState, List[Action]]] = []
+            for _, state, plan in frontier:
+                for definition_id in sorted(set(state.hand)):
+                    model = models[definition_id]
+                    if model.targets_all or not (
+                        model.damage or model.bleed or model.weakness or model.burn
+                    ):
+                        targets = [0]
+                    else:
+                        targets = [
+                            i for i, m in enumerate(state.monsters) if m.health > 0
+                        ]
+                    for target in targets:
+                        child = play(state, definition_id, model, target, context)
+                        if child is None or child in seen:
+                            continue
+                        seen.add(child)
+                        nodes += 1
+                        score = self._score(child, context)
+                        child_plan = plan + [(definition_id, target)]
+                        children.append((score, child, child_plan))
+                        if score > best_score:
+                            best_score, best_plan = score, child_plan
+                    if time.perf_counter() > deadline:
+                        complete = False
+                        break
+                if not complete:
+                    break
+            children.sort(key=lambda child: child[0], reverse=True)
+            frontier = children[: self.beam_width]
+
+        self.nodes += nodes
+        return SearchResult(
+            best_plan, best_score, nodes, time.perf_counter() - start, complete
+        )
+
+    def __call__(self, player: Player, monster_group: MonsterGroup) -> Optional[Card]:
+        """Policy interface for deckdeep.simulation: select the target and return
+        the first card of the best plan, or None to end the turn."""
+        alive = monster_group.alive_monsters
+        if not alive:
+            return None
+        result = self.search(player, alive)
+        if not result.plan:
+            return None
+        definition_id, target = result.plan[0]
+        monster_group.selected_index = target
+        return next(card for card in player.hand if card.definition_id == definition_id)
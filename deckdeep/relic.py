@@ -1,6 +1,6 @@
 import random
 from enum import Enum
-from typing import Dict
+from typing import Any, Callable, Dict
 from copy import deepcopy
 import uuid
 
@@ -40,6 +40,7 @@ class Relic:
             "id": self.id,  # Add this line
             "name": self.name,
             "description": self.description,
+            "effect": self.effect.__name__,
             "trigger_when": self.trigger_when.value,
             "has_been_applied": self.has_been_applied,
         }
@@ -53,9 +54,10 @@ class Relic:
             name=data["name"],
             data={
                 "description": data["description"],
-                "effect": ALL_RELICS[data["name"]][
-                    "effect"
-                ],  # Get effect from ALL_RELICS
+                # Saves from before effects were named only have the relic name
+                "effect": RELIC_EFFECTS.get(
+                    data.get("effect", ""), ALL_RELICS[data["name"]]["effect"]
+                ),
                 "trigger_when": TriggerWhen(data["trigger_when"]),
             },
         )
@@ -71,67 +73,131 @@ class Relic:
         return [Relic(name, deepcopy(relic)) for name, relic in selected_relics]
 
 
+# Relic effects are named module-level functions rather than lambdas, so relics
+# (and the players holding them) pickle and can be sent to worker processes.
+# Each takes the player and the game (None outside of a running game).
+RELIC_EFFECTS: Dict[str, Callable[[Any, Any], Any]] = {}
+
+
+def relic_effect(effect: Callable[[Any, Any], Any]) -> Callable[[Any, Any], Any]:
+    """Register ``effect`` in RELIC_EFFECTS under its function name."""
+    RELIC_EFFECTS[effect.__name__] = effect
+    return effect
+
+
+@relic_effect
+def gain_max_health(p, g):
+    return p.increase_max_health(10)
+
+
+@relic_effect
+def gain_strength(p, g):
+    return p.increase_strength(1)
+
+
+@relic_effect
+def heal_at_combat_start(p, g):
+    return p.heal(5)
+
+
+@relic_effect
+def gain_combat_energy(p, g):
+    return p.grant_temporary_energy(1)
+
+
+@relic_effect
+def gain_turn_block(p, g):
+    return p.add_block(3)
+
+
+@relic_effect
+def gain_dodge_chance(p, g):
+    return setattr(p, "dodge_chance", p.dodge_chance + 0.1)
+
+
+@relic_effect
+def trade_energy_for_draw(p, _):
+    return (
+        p.increase_cards_per_turn(1),
+        p.increase_max_energy(-1, force=True),
+    )
+
+
+@relic_effect
+def arm_phoenix_feather(p, _):
+    return setattr(p, "phoenix_feather_active", True)
+
+
+@relic_effect
+def stab_random_monster(_, g):
+    return (
+        g
+        and g.monster_group
+        and g.monster_group.random_monster()
+        and g.monster_group.random_monster().take_damage(10)
+        or "No valid target for Cursed Dagger"
+    )
+
+
+@relic_effect
+def gain_extra_turn_chance(p, _):
+    return setattr(p, "extra_turn_chance", 0.12)
+
+
 ALL_RELICS = {
     "Hair of the Dog": {
         "description": "+10 max HP.",
-        "effect": lambda p, g: p.increase_max_health(10),
+        "effect": gain_max_health,
         "trigger_when": TriggerWhen.PERMANENT,
     },
     "Cursed Coin": {
         "description": "Your attacks deal 1 additional damage.",
-        "effect": lambda p, g: p.increase_strength(1),
+        "effect": gain_strength,
         "trigger_when": TriggerWhen.PERMANENT,
     },
     "Healing Charm": {
         "description": "Heal 5 HP at the start of each combat.",
-        "effect": lambda p, g: p.heal(5),
+        "effect": heal_at_combat_start,
         "trigger_when": TriggerWhen.START_OF_COMBAT,
     },
     "Energy Crystal": {
         "description": "Start each combat with 1 additional energy.",
-        "effect": lambda p, g: p.grant_temporary_energy(1),
+        "effect": gain_combat_energy,
         "trigger_when": TriggerWhen.START_OF_COMBAT,
     },
     "Strength Amulet": {
         "description": "Your attacks deal 1 additional damage.",
-        "effect": lambda p, g: p.increase_strength(1),
+        "effect": gain_strength,
         "trigger_when": TriggerWhen.PERMANENT,
     },
     "Shield Rune": {
         "description": "Gain 3 block at the start of each turn.",
-        "effect": lambda p, g: p.add_block(3),
+        "effect": gain_turn_block,
         "trigger_when": TriggerWhen.START_OF_TURN,
     },
     "Lucky Coin": {
         "description": "10% chance to dodge enemy attacks.",
-        "effect": lambda p, g: setattr(p, "dodge_chance", p.dodge_chance + 0.1),
+        "effect": gain_dodge_chance,
         "trigger_when": TriggerWhen.PERMANENT,
     },
     "Paper Weight": {
         "description": "Draw 1 additional card at the start of each turn. At the cost of permanent energy.",
-        "effect": lambda p, _: (
-            p.increase_cards_per_turn(1),
-            p.increase_max_energy(-1, force=True),
-        ),
+        "effect": trade_energy_for_draw,
         "trigger_when": TriggerWhen.PERMANENT,
     },
     "Phoenix Feather": {
         "description": "Once, survive a fatal blow with 1 HP.",
-        "effect": lambda p, _: setattr(p, "phoenix_feather_active", True),
+        "effect": arm_phoenix_feather,
         "trigger_when": TriggerWhen.PERMANENT,
     },
     "Cursed Dagger": {
         "description": "Deal 10 damage to a random enemy at the start of each turn.",
-        "effect": lambda _, g: g
-        and g.monster_group
-        and g.monster_group.random_monster()
-        and g.monster_group.random_monster().take_damage(10)
-        or "No valid target for Cursed Dagger",
+        "effect": stab_random_monster,
         "trigger_when": TriggerWhen.START_OF_TURN,
     },
     "Time Warp": {
         "description": "12% chance to take an extra turn after your turn ends.",
-        "effect": lambda p, _: setattr(p, "extra_turn_chance", 0.12),
+        "effect": gain_extra_turn_chance,
         "trigger_when": TriggerWhen.PERMANENT,
     },
 }
@@ -2,7 +2,7 @@ import pygame
 import pygame.gfxdraw
 import random
 from collections import Counter
-from typing import List, TYPE_CHECKING
+from typing import Callable, Hashable, List, Optional, Tuple, TYPE_CHECKING
 
 from deckdeep.assets import GameAssets
 from deckdeep.card import Card
@@ -10,29 +10,23 @@ from deckdeep.config import (
     BEIGE,
     BLACK,
     BLUE,
-    CARD_FONT,
-    CARD_HEIGHT,
-    CARD_SPACING,
-    CARD_WIDTH,
-    FONT,
     GRAY,
     GREEN,
-    ICON_SIZE,
     KEYBINDS,
-    PLAYER_SIZE,
     PURPLE,
     RED,
-    SCREEN_HEIGHT,
-    SCREEN_WIDTH,
-    SMALL_FONT,
     WHITE,
     YELLOW,
-    scale,
 )
+from deckdeep.deck_index import DeckStats
+from deckdeep.draw_odds import DrawOdds
+from deckdeep.layout import get_layout
 from deckdeep.monster import IconType
 from deckdeep.monster_group import MonsterGroup
 from deckdeep.player import Player
 from deckdeep.relic import Relic
+from deckdeep.render_cache import card_face_cache, render_cache, sprite_cache
+from deckdeep.renderer import composing, get_renderer
 
 # Imports only for type checking to avoid circular imports
 if TYPE_CHECKING:
@@ -43,21 +37,79 @@ def get_key_name(key: int) -> str:
     return pygame.key.name(key).upper()
 
 
+def static_layer(
+    name: str,
+    assets: GameAssets,
+    compose: Callable[..., None],
+    *args: Hashable,
+) -> pygame.Surface:
+    """Full-screen backdrop drawn once by ``compose(layer, assets, *args)`` and
+    reused until the screen size changes, so it costs a single blit per frame.
+
+    Layers live in the shared render cache under the "layer" namespace. Only the
+    latest variant of each ``name`` is kept (one event backdrop, not one per
+    event seen), since each is a full-screen surface.
+    """
+
+    def build() -> pygame.Surface:
+        render_cache.invalidate("layer", name)
+        with composing() as r:
+            layer = r.surface((layout.width, layout.height))
+            compose(layer, assets, *args)
+        return layer
+
+    layout = get_layout()
+    key = ("layer", name, assets, *args, layout.width, layout.height)
+    return render_cache.get(key, build)
+
+
+def _compose_header(layer: pygame.Surface, assets: GameAssets):
+    layout = get_layout()
+    layer.blit(assets.background_image, (0, 0))
+    header = pygame.transform.scale(
+        assets.parchment_texture, (layout.width, layout.header_height)
+    )
+    layer.blit(header, (0, 0))
+
+
+def _compose_combat(layer: pygame.Surface, assets: GameAssets):
+    layout = get_layout()
+    _compose_header(layer, assets)
+    panel = pygame.Surface((layout.width, layout.hand_panel_height))
+    panel.set_alpha(128)
+    panel.fill((100, 100, 100))
+    layer.blit(panel, (0, layout.height - layout.hand_panel_height))
+
+
+def _compose_event(layer: pygame.Surface, assets: GameAssets, event_key: str):
+    layout = get_layout()
+    width, height = layer.get_size()
+    layer.blit(assets.load_event_image(event_key), (0, 0))
+    size = (width // 2 - layout.scale(20), height // 3 - layout.scale(20))
+    panel = pygame.transform.scale(assets.parchment_texture, size)
+    panel_y = height * 2 // 3 + layout.scale(10)
+    layer.blit(panel, (layout.scale(10), panel_y))
+    layer.blit(panel, (width // 2 + layout.scale(10), panel_y))
+
+
 def render_text(
     screen: pygame.Surface,
     text: str,
     x: int,
     y: int,
     color=BLACK,
-    font=FONT,
+    font=None,
     circle=False,
     outline=False,
     outline_color=BLACK,
     shadow=False,
     shadow_color=(50, 50, 50, 128),
 ):
+    r = get_renderer()
+    layout = get_layout()
+    font = font or layout.font
     if shadow:
-        shadow_offset = scale(1)
+        shadow_offset = layout.scale(1)
         render_text(
             screen,
             text,
@@ -80,37 +132,41 @@ def render_text(
                 outline=False,
             )
 
-    text_surface = font.render(text, True, color)
+    text_surface = r.text(font, text, True, color)
     if circle:
         text_rect = text_surface.get_rect()
         circle_radius = max(text_rect.width, text_rect.height) * 1.3 // 2
         circle_center = (x + text_rect.width // 2, y + text_rect.height // 2)
-        circle_surface = pygame.Surface(
+        circle_surface = r.surface(
             (circle_radius * 2, circle_radius * 2), pygame.SRCALPHA
         )
-        pygame.draw.circle(
+        r.circle(
             circle_surface,
             (255, 255, 255, 128),
             (circle_radius, circle_radius),
             circle_radius,
         )
-        screen.blit(
+        r.blit(
+            screen,
             circle_surface,
             (circle_center[0] - circle_radius, circle_center[1] - circle_radius),
         )
-    screen.blit(text_surface, (x, y))
+    r.blit(screen, text_surface, (x, y))
 
 
 def render_text_in_icon(
-    screen: pygame.Surface, text: str, x: int, y: int, icon, color=BLACK, font=FONT
+    screen: pygame.Surface, text: str, x: int, y: int, icon, color=BLACK, font=None
 ):
-    screen.blit(icon, (x, y))
+    r = get_renderer()
+    layout = get_layout()
+    font = font or layout.font
+    r.blit(screen, icon, (x, y))
 
     render_text(
         screen,
         text,
-        x + ICON_SIZE - scale(23),
-        y + scale(7),
+        x + layout.icon_size - layout.scale(23),
+        y + layout.scale(7),
         color=color,
         font=font,
         outline=True,
@@ -128,6 +184,7 @@ def render_text_with_background(
     background_color=WHITE,
     max_width=None,
 ):
+    r = get_renderer()
     words = text.split()
     lines = []
     current_line: List[str] = []
@@ -145,12 +202,32 @@ def render_text_with_background(
         lines.append(" ".join(current_line))
 
     for i, line in enumerate(lines):
-        text_surface = font.render(line, True, text_color)
+        text_surface = r.text(font, line, True, text_color)
         if background_color:
-            background_surface = pygame.Surface(text_surface.get_size())
+            background_surface = r.surface(text_surface.get_size())
             background_surface.fill(background_color)
-            screen.blit(background_surface, (x, y + i * font.get_linesize()))
-        screen.blit(text_surface, (x, y + i * font.get_linesize()))
+            r.blit(screen, background_surface, (x, y + i * font.get_linesize()))
+        r.blit(screen, text_surface, (x, y + i * font.get_linesize()))
+
+
+# Card attributes shown on the face, besides the damage which depends on the player
+CARD_FACE_ATTRS = (
+    "name",
+    "damage",
+    "targets_all",
+    "num_attacks",
+    "bonus_damage",
+    "healing",
+    "shield",
+    "card_draw",
+    "health_cost",
+    "bleed",
+    "energy_bonus",
+    "health_regain",
+    "weakness",
+    "bolster",
+    "burn",
+)
 
 
 def render_card(
@@ -167,146 +244,172 @@ def render_card(
     hotkey=None,
     opacity=255,
 ):
-    x_offset = ICON_SIZE + scale(16)
-    x_anchor = scale(15)
-    y_offset = ICON_SIZE + scale(3)
-    y_text_offset = scale(5)
-
-    # Create a new surface for the card
-    card_surface = pygame.Surface((CARD_WIDTH, CARD_HEIGHT), pygame.SRCALPHA)
-
-    # 1. Bottom layer: Parchment texture
-    card_surface.blit(assets.parchment_texture, (0, 0))
-
-    # # 2. Middle layer: Rarity hue
-    # rarity_colors = {
-    #     Rarity.COMMON: None,
-    #     Rarity.UNCOMMON: (0, 255, 0, 40),
-    #     Rarity.RARE: (0, 0, 255, 40),
-    #     Rarity.UNIQUE: (128, 0, 128, 40),
-    #     Rarity.LEGENDARY: (255, 0, 0, 40),
-    # }
-
-    # if card.rarity in rarity_colors and rarity_colors[card.rarity] is not None:
-    #     color_surface = pygame.Surface((CARD_WIDTH, CARD_HEIGHT), pygame.SRCALPHA)
-    #     color_surface.fill(rarity_colors[card.rarity])
-    #     card_surface.blit(color_surface, (0, 0))
-
-    # 3. Top layer: Card content (name, icons, text)
-    name_surface = CARD_FONT.render(card.name, True, BLACK)
-    name_x = (CARD_WIDTH - name_surface.get_width()) // 2
-    card_surface.blit(name_surface, (name_x, scale(10)))
-    current_y = y_offset + scale(15)
-
-    icon_map = {
-        "damage": (
-            assets.attack_icon,
-            f"{card.calculate_total_damage(player_bonus_damage, player_strength)}{' (AOE)' if card.targets_all else ''}",
-        ),
-        "bonus_damage": (assets.dice_icon, f"{card.bonus_damage}"),
-        "healing": (assets.heal_icon, f"{card.healing}"),
-        "shield": (assets.shield_icon, f"{card.shield}"),
-        "card_draw": (assets.draw_icon, f"{card.card_draw}"),
-        "health_cost": (assets.health_cost, f"-{card.health_cost}"),
-        "bleed": (assets.bleed_icon, f"{card.bleed}"),
-        "energy_bonus": (assets.energy_bonus_icon, f"+{card.energy_bonus}"),
-        "health_regain": (assets.health_regain_icon, f"+{card.health_regain}"),
-        "weakness": (assets.weakness_icon, f"{card.weakness}"),
-        "bolster": (assets.bolster_icon, f"{card.bolster}"),
-        "burn": (assets.burn_icon, f"{card.burn}"),
-    }
+    r = get_renderer()
+    layout = get_layout()
+    damage = card.calculate_total_damage(player_bonus_damage, player_strength)
+    energy_color = GREEN if player_energy >= card.energy_cost.value else RED
+    key = (
+        tuple(getattr(card, attr) for attr in CARD_FACE_ATTRS),
+        card.energy_cost.value,
+        damage,
+        energy_color,
+        hotkey,
+        assets,
+    )
+    face = card_face_cache.get(
+        key, lambda: _card_face(card, damage, energy_color, hotkey, assets)
+    )
+    r.blit(screen, faded(face, opacity), (x, y))
 
-    for attr, (icon, text) in icon_map.items():
-        if getattr(card, attr, 0) > 0:
-            icon_surface = icon.copy()
-            icon_y = current_y
-
-            if attr == "damage" and card.num_attacks > 1:
-                # Render multiple attack icons
-                overlap = ICON_SIZE // 3  # Reduced overlap for better visibility
-                total_width = x_anchor + (card.num_attacks - 1) * overlap + ICON_SIZE
-                for i in range(card.num_attacks):
-                    card_surface.blit(icon_surface, (x_anchor + i * overlap, icon_y))
-
-                # Dynamically calculate text position
-                text_width = CARD_FONT.size(text)[0]
-                text_x = max(
-                    x_offset, total_width + scale(5)
-                )  # Ensure minimum x_offset
-                if text_x + text_width > CARD_WIDTH - scale(10):
-                    text_x = (
-                        CARD_WIDTH - text_width - scale(10)
-                    )  # Adjust if text would overflow
-
-                render_text(
-                    card_surface,
-                    str(int(text) // card.num_attacks),
-                    text_x,
-                    icon_y + y_text_offset,
-                    font=CARD_FONT,
-                    color=BLACK,
-                )
-            else:
-                card_surface.blit(icon_surface, (x_anchor, icon_y))
-                render_text(
-                    card_surface,
-                    text,
-                    x_offset,
-                    icon_y + y_text_offset,
-                    font=CARD_FONT,
-                    color=BLACK,
-                )
-            current_y += y_offset
+    # Draw border
+    border_color = YELLOW if is_selected else BLACK
+    r.rect(screen, border_color, (x, y, layout.card_width, layout.card_height), 2)
 
-    energy_x = CARD_WIDTH - round(1.25 * ICON_SIZE)
-    energy_y = CARD_HEIGHT - round(1.25 * ICON_SIZE)
+    return x, y
 
-    if player_energy >= card.energy_cost.value:
-        energy_color = GREEN
-    elif player_max_energy >= card.energy_cost.value:
-        energy_color = RED
-    else:
-        energy_color = RED
-
-    render_text_in_icon(
-        card_surface,
-        f"{card.energy_cost.value}",
-        energy_x,
-        energy_y,
-        assets.energy_icon,
-        color=energy_color,
-        font=CARD_FONT,
-    )
 
-    if hotkey is not None:
-        render_text(
-            card_surface,
-            f"{get_key_name(hotkey)}",
-            x_anchor,
-            CARD_HEIGHT - x_offset,
-            font=CARD_FONT,
-            color=BLACK,
+def _card_face(
+    card: Card,
+    damage: int,
+    energy_color,
+    hotkey,
+    assets: GameAssets,
+) -> pygame.Surface:
+    layout = get_layout()
+    with composing() as r:
+        x_offset = layout.icon_size + layout.scale(16)
+        x_anchor = layout.scale(15)
+        y_offset = layout.icon_size + layout.scale(3)
+        y_text_offset = layout.scale(5)
+
+        # Create a new surface for the card
+        card_surface = r.surface(
+            (layout.card_width, layout.card_height), pygame.SRCALPHA
         )
 
-    # Apply opacity to the entire card surface
-    card_surface.set_alpha(opacity)
+        # 1. Bottom layer: Parchment texture
+        r.blit(card_surface, assets.parchment_texture, (0, 0))
+
+        # # 2. Middle layer: Rarity hue
+        # rarity_colors = {
+        #     Rarity.COMMON: None,
+        #     Rarity.UNCOMMON: (0, 255, 0, 40),
+        #     Rarity.RARE: (0, 0, 255, 40),
+        #     Rarity.UNIQUE: (128, 0, 128, 40),
+        #     Rarity.LEGENDARY: (255, 0, 0, 40),
+        # }
+
+        # if card.rarity in rarity_colors and rarity_colors[card.rarity] is not None:
+        #     color_surface = pygame.Surface((layout.card_width, layout.card_height), pygame.SRCALPHA)
+        #     color_surface.fill(rarity_colors[card.rarity])
+        #     card_surface.blit(color_surface, (0, 0))
+
+        # 3. Top layer: Card content (name, icons, text)
+        name_surface = r.text(layout.card_font, card.name, True, BLACK)
+        name_x = (layout.card_width - name_surface.get_width()) // 2
+        r.blit(card_surface, name_surface, (name_x, layout.scale(10)))
+        current_y = y_offset + layout.scale(15)
+
+        icon_map = {
+            "damage": (
+                assets.attack_icon,
+                f"{damage}{' (AOE)' if card.targets_all else ''}",
+            ),
+            "bonus_damage": (assets.dice_icon, f"{card.bonus_damage}"),
+            "healing": (assets.heal_icon, f"{card.healing}"),
+            "shield": (assets.shield_icon, f"{card.shield}"),
+            "card_draw": (assets.draw_icon, f"{card.card_draw}"),
+            "health_cost": (assets.health_cost, f"-{card.health_cost}"),
+            "bleed": (assets.bleed_icon, f"{card.bleed}"),
+            "energy_bonus": (assets.energy_bonus_icon, f"+{card.energy_bonus}"),
+            "health_regain": (assets.health_regain_icon, f"+{card.health_regain}"),
+            "weakness": (assets.weakness_icon, f"{card.weakness}"),
+            "bolster": (assets.bolster_icon, f"{card.bolster}"),
+            "burn": (assets.burn_icon, f"{card.burn}"),
+        }
+
+        for attr, (icon, text) in icon_map.items():
+            if getattr(card, attr, 0) > 0:
+                icon_surface = icon
+                icon_y = current_y
+
+                if attr == "damage" and card.num_attacks > 1:
+                    # Render multiple attack icons
+                    overlap = (
+                        layout.icon_size // 3
+                    )  # Reduced overlap for better visibility
+                    total_width = (
+                        x_anchor + (card.num_attacks - 1) * overlap + layout.icon_size
+                    )
+                    for i in range(card.num_attacks):
+                        r.blit(
+                            card_surface, icon_surface, (x_anchor + i * overlap, icon_y)
+                        )
+
+                    # Dynamically calculate text position
+                    text_width = layout.card_font.size(text)[0]
+                    text_x = max(
+                        x_offset, total_width + layout.scale(5)
+                    )  # Ensure minimum x_offset
+                    if text_x + text_width > layout.card_width - layout.scale(10):
+                        text_x = (
+                            layout.card_width - text_width - layout.scale(10)
+                        )  # Adjust if text would overflow
+
+                    render_text(
+                        card_surface,
+                        str(int(text) // card.num_attacks),
+                        text_x,
+                        icon_y + y_text_offset,
+                        font=layout.card_font,
+                        color=BLACK,
+                    )
+                else:
+                    r.blit(card_surface, icon_surface, (x_anchor, icon_y))
+                    render_text(
+                        card_surface,
+                        text,
+                        x_offset,
+                        icon_y + y_text_offset,
+                        font=layout.card_font,
+                        color=BLACK,
+                    )
+                current_y += y_offset
 
-    # Blit the card surface to the screen
-    screen.blit(card_surface, (x, y))
+        energy_x = layout.card_width - round(1.25 * layout.icon_size)
+        energy_y = layout.card_height - round(1.25 * layout.icon_size)
 
-    # Draw border
-    border_color = YELLOW if is_selected else BLACK
-    pygame.draw.rect(screen, border_color, (x, y, CARD_WIDTH, CARD_HEIGHT), 2)
+        render_text_in_icon(
+            card_surface,
+            f"{card.energy_cost.value}",
+            energy_x,
+            energy_y,
+            assets.energy_icon,
+            color=energy_color,
+            font=layout.card_font,
+        )
 
-    return x, y
+        if hotkey is not None:
+            render_text(
+                card_surface,
+                f"{get_key_name(hotkey)}",
+                x_anchor,
+                layout.card_height - x_offset,
+                font=layout.card_font,
+                color=BLACK,
+            )
+
+    return card_surface
 
 
 def render_button(
     screen: pygame.Surface, text: str, x: int, y: int, width: int, height: int
 ):
-    pygame.draw.rect(screen, GRAY, (x, y, width, height))
-    pygame.draw.rect(screen, BLACK, (x, y, width, height), 2)
-    render_text(screen, text, x + scale(10), y + scale(10))
+    r = get_renderer()
+    layout = get_layout()
+    r.rect(screen, GRAY, (x, y, width, height))
+    r.rect(screen, BLACK, (x, y, width, height), 2)
+    render_text(screen, text, x + layout.scale(10), y + layout.scale(10))
 
 
 def render_health_bar(
@@ -323,87 +426,149 @@ def render_health_bar(
 ):
     current_value = current.value if hasattr(current, "value") else current
     maximum_value = maximum.value if hasattr(maximum, "value") else maximum
+    key = ("health_bar", width, height, current_value, maximum_value, color, shield)
+    sprite, dx, dy = sprite_cache.get(
+        key + (assets,),
+        lambda: _health_bar_sprite(
+            width, height, current_value, maximum_value, color, assets, shield
+        ),
+    )
+    get_renderer().blit(screen, sprite, (x - dx, y - dy))
+
+
+def _health_bar_sprite(
+    width: int,
+    height: int,
+    current_value: int,
+    maximum_value: int,
+    color,
+    assets: GameAssets,
+    shield: int,
+) -> Tuple[pygame.Surface, int, int]:
+    """The bar with its border and centred value, plus where the bar itself sits
+    inside the sprite (the border and the text can stick out of it)."""
+    layout = get_layout()
+    health_text = str(current_value)
+    if shield > 0:
+        health_text += f" (+{shield})"
+    text_width, text_height = layout.small_font.size(health_text)
+    # The outline is drawn 1px around the text
+    dx = max(layout.scale(1), (text_width + 2 - width) // 2 + 1)
+    dy = layout.scale(1)
+    bottom = max(layout.scale(1), layout.scale(2) + text_height + 1 - height)
     current_width = int(width * (current_value / maximum_value))
 
-    # Draw rounded rectangle for the border
-    pygame.draw.rect(
-        screen,
-        BLACK,
-        (x - scale(1), y - scale(1), width + scale(2), height + scale(2)),
-        border_radius=scale(5),
-    )
+    with composing() as r:
+        sprite = r.surface((width + 2 * dx, height + dy + bottom), pygame.SRCALPHA)
+        # Draw rounded rectangle for the border
+        r.rect(
+            sprite,
+            BLACK,
+            (
+                dx - layout.scale(1),
+                dy - layout.scale(1),
+                width + layout.scale(2),
+                height + layout.scale(2),
+            ),
+            border_radius=layout.scale(5),
+        )
 
-    # Draw rounded rectangle for the background
-    pygame.draw.rect(screen, GRAY, (x, y, width, height), border_radius=scale(5))
+        # Draw rounded rectangle for the background
+        r.rect(sprite, GRAY, (dx, dy, width, height), border_radius=layout.scale(5))
 
-    # Draw rounded rectangle for the current health/energy
-    pygame.draw.rect(
-        screen, color, (x, y, current_width, height), border_radius=scale(5)
-    )
+        # Draw rounded rectangle for the current health/energy
+        r.rect(
+            sprite,
+            color,
+            (dx, dy, current_width, height),
+            border_radius=layout.scale(5),
+        )
 
-    # Draw parchment texture overlay
-    if assets:
-        parchment = assets.parchment_texture
-        scaled_parchment = pygame.transform.scale(parchment, (width, height))
-        screen.blit(scaled_parchment, (x, y), special_flags=pygame.BLEND_MULT)
+        # Draw parchment texture overlay
+        if assets:
+            parchment = r.scale(assets.parchment_texture, (width, height))
+            r.blit(sprite, parchment, (dx, dy), special_flags=pygame.BLEND_MULT)
 
-    # Draw ticks every 10%
-    for i in range(1, 10):
-        tick_x = x + (width * i // 10)
-        pygame.draw.line(screen, BLACK, (tick_x, y), (tick_x, y + height), 1)
+        # Draw ticks every 10%
+        for i in range(1, 10):
+            tick_x = dx + (width * i // 10)
+            r.line(sprite, BLACK, (tick_x, dy), (tick_x, dy + height), 1)
 
-    if shield > 0:
-        shield_width = int(width * (shield / maximum_value))
-        s = pygame.Surface((shield_width, height))
-        s.set_alpha(128)
-        s.fill(BLUE)
-        screen.blit(s, (x + current_width - shield_width, y))
+        if shield > 0:
+            shield_width = int(width * (shield / maximum_value))
+            s = r.surface((shield_width, height))
+            s.set_alpha(128)
+            s.fill(BLUE)
+            r.blit(sprite, s, (dx + current_width - shield_width, dy))
 
-    # health_text = f"{current}/{maximum}"
-    health_text = str(current_value)
-    if shield > 0:
-        health_text += f" (+{shield})"
-    text_x = x + (width - SMALL_FONT.size(health_text)[0]) // 2
-    render_text(
-        screen,
-        health_text,
-        text_x,
-        y + scale(2),
-        color=WHITE,
-        font=SMALL_FONT,
-        outline=True,
-    )
+        render_text(
+            sprite,
+            health_text,
+            dx + (width - text_width) // 2,
+            dy + layout.scale(2),
+            color=WHITE,
+            font=layout.small_font,
+            outline=True,
+        )
+    return sprite, dx, dy
+
+
+# Status effect class name -> (GameAssets attribute, text colour)
+EFFECT_ICONS = {
+    "Bleed": ("bleed_icon", PURPLE),
+    "HealthRegain": ("health_regain_icon", PURPLE),
+    "EnergyBonus": ("energy_bonus_icon", PURPLE),
+    "PlayerBonus": ("attack_icon", PURPLE),
+    "Strength": ("strength_icon", PURPLE),
+    "Weakness": ("weakness_icon", RED),
+    "Bolster": ("bolster_icon", BLUE),
+    "Burn": ("burn_icon", RED),
+}
 
 
 def render_status_effects(
     screen: pygame.Surface, x: int, y: int, status_effects: List, assets: GameAssets
 ):
-    icon_spacing = scale(35)
-    effect_icons = {
-        "Bleed": (assets.bleed_icon, PURPLE),
-        "HealthRegain": (assets.health_regain_icon, PURPLE),
-        "EnergyBonus": (assets.energy_bonus_icon, PURPLE),
-        "PlayerBonus": (assets.attack_icon, PURPLE),
-        "Strength": (assets.strength_icon, PURPLE),
-        "Weakness": (assets.weakness_icon, RED),
-        "Bolster": (assets.bolster_icon, BLUE),
-        "Burn": (assets.burn_icon, RED),
-    }
-    for effect in status_effects:
-        effect_name = effect.__class__.__name__
-        if effect_name in effect_icons:
-            icon, color = effect_icons[effect_name]
-            screen.blit(icon, (x, y))
+    shown = tuple(
+        (effect.__class__.__name__, effect.value)
+        for effect in status_effects
+        if effect.__class__.__name__ in EFFECT_ICONS
+    )
+    if not shown:
+        return
+    sprite, dx, dy = sprite_cache.get(
+        ("status_effects", shown, assets), lambda: _status_strip(shown, assets)
+    )
+    get_renderer().blit(screen, sprite, (x - dx, y - dy))
+
+
+def _status_strip(
+    shown: Tuple[Tuple[str, int], ...], assets: GameAssets
+) -> Tuple[pygame.Surface, int, int]:
+    """Icons with their circled values, plus where the first icon sits inside the
+    strip (the circles stick out above and to the sides)."""
+    layout = get_layout()
+    dx = layout.icon_size // 2
+    dy = layout.icon_size
+    spacing = layout.scale(35)
+    width = 2 * dx + (len(shown) - 1) * spacing + layout.icon_size
+    with composing() as r:
+        sprite = r.surface((width, dy + layout.icon_size), pygame.SRCALPHA)
+        x = dx
+        for name, value in shown:
+            icon_name, color = EFFECT_ICONS[name]
+            r.blit(sprite, getattr(assets, icon_name), (x, dy))
             render_text(
-                screen,
-                str(effect.value),
-                x + round(ICON_SIZE / 2) - scale(3),
-                y - round(ICON_SIZE / 2) - scale(4),
+                sprite,
+                str(value),
+                x + round(layout.icon_size / 2) - layout.scale(3),
+                dy - round(layout.icon_size / 2) - layout.scale(4),
                 color=color,
-                font=FONT,
+                font=layout.font,
                 circle=True,
             )
-            x += icon_spacing
+            x += spacing
+    return sprite, dx, dy
 
 
 def render_player(
@@ -413,13 +578,19 @@ def render_player(
     monster_center_y: int,
     animation_progress: float = 1.0,
 ):
-    player_image = pygame.transform.scale(assets.player, (PLAYER_SIZE, PLAYER_SIZE))
+    r = get_renderer()
+    layout = get_layout()
+    size = layout.unit_size
+    player_image = render_cache.get(
+        ("sprite", "player", assets, size),
+        lambda: pygame.transform.scale(assets.player, (size, size)),
+    )
 
-    target_x = scale(120)
-    start_x = -PLAYER_SIZE
+    target_x = layout.player_x
+    start_x = -size
     current_x = start_x + (target_x - start_x) * animation_progress
 
-    y = monster_center_y - PLAYER_SIZE // 2
+    y = monster_center_y - size // 2
     offset = random.randint(-player.shake, player.shake)
 
     # Render status effects above the player
@@ -430,7 +601,9 @@ def render_player(
         status_effects.append(type("PlayerBonus", (), {"value": player.bonus_damage})())
     if player.strength > 0:
         status_effects.append(type("Strength", (), {"value": player.strength})())
-    render_status_effects(screen, int(current_x), y - scale(50), status_effects, assets)
+    render_status_effects(
+        screen, int(current_x), y - layout.player_status_rise, status_effects, assets
+    )
 
     # Render player image with death animation if applicable
     if player.is_dying:
@@ -442,15 +615,15 @@ def render_player(
             screen, player_image, int(current_x) + offset, y + offset, opacity
         )
     else:
-        screen.blit(player_image, (int(current_x) + offset, y + offset))
+        r.blit(screen, player_image, (int(current_x) + offset, y + offset))
 
     # Render health bar below the player
-    health_bar_width = PLAYER_SIZE
-    health_bar_height = scale(20)
+    health_bar_width = size
+    health_bar_height = layout.bar_height
     render_health_bar(
         screen,
         int(current_x),
-        y + PLAYER_SIZE + scale(10),
+        y + size + layout.bar_gap,
         health_bar_width,
         health_bar_height,
         player.health,
@@ -464,7 +637,7 @@ def render_player(
     render_health_bar(
         screen,
         int(current_x),
-        y + PLAYER_SIZE + scale(35),
+        y + size + layout.energy_bar_gap,
         health_bar_width,
         health_bar_height,
         player.energy,
@@ -502,147 +675,129 @@ def render_monsters(
     assets: GameAssets,
     animation_progress: float = 1.0,
 ):
-    num_monsters = len(monster_group.monsters)
-    monsters_per_row = 3
-    num_rows = (num_monsters + monsters_per_row - 1) // monsters_per_row
-
-    monster_size = PLAYER_SIZE
-    monster_spacing = scale(50)
-
-    total_height = num_rows * (monster_size + monster_spacing) - monster_spacing
-    start_y = (SCREEN_HEIGHT - total_height) // 2 - monster_size
-
-    for row in range(num_rows):
-        start_index = row * monsters_per_row
-        end_index = min((row + 1) * monsters_per_row, num_monsters)
-        monsters_in_row = end_index - start_index
-
-        row_width = (
-            monsters_in_row * monster_size + (monsters_in_row - 1) * monster_spacing
-        )
-        target_start_x = SCREEN_WIDTH - scale(120) - row_width
-        start_start_x = SCREEN_WIDTH
-        current_start_x = (
-            start_start_x + (target_start_x - start_start_x) * animation_progress
+    r = get_renderer()
+    layout = get_layout()
+    monster_size = layout.unit_size
+    grid = layout.monster_grid(len(monster_group.monsters))
+
+    for monster, slot in zip(monster_group.monsters, grid.slots):
+        monster_image = unit_sprite(monster.image_path, monster_size)
+        # Slide in from the right edge during the entrance animation
+        row_start = layout.width + (slot.row_start - layout.width) * animation_progress
+        x = int(row_start + slot.row_offset)
+        y = slot.y
+        offset = random.randint(-monster.shake, monster.shake)
+
+        # Render status effects above the monster
+        render_status_effects(
+            screen,
+            x,
+            y - layout.monster_status_rise,
+            monster.status_effects.effects,
+            assets,
         )
 
-        for i, monster in enumerate(monster_group.monsters[start_index:end_index]):
-            monster_image = pygame.transform.scale(
-                GameAssets.load_and_scale_ui(
-                    monster.image_path, (monster_size, monster_size)
-                ),
-                (monster_size, monster_size),
+        # Render monster image with death animation if applicable
+        if monster.is_dying:
+            death_progress = min(
+                1.0, (pygame.time.get_ticks() - monster.death_start_time) / 1000
             )
-            x = int(current_start_x + i * (monster_size + monster_spacing))
-            y = start_y + row * (monster_size + monster_spacing)
-            offset = random.randint(-monster.shake, monster.shake)
+            opacity = int(255 * (1 - death_progress))
+            render_with_opacity(screen, monster_image, x + offset, y + offset, opacity)
+        else:
+            r.blit(screen, monster_image, (x + offset, y + offset))
 
-            # Render status effects above the monster
-            render_status_effects(
-                screen, x, y - scale(30), monster.status_effects.effects, assets
-            )
+        # Render health bar below the monster
+        health_bar_width = monster_size
+        health_bar_height = layout.bar_height
+        render_health_bar(
+            screen,
+            x,
+            y + monster_size + layout.bar_gap,
+            health_bar_width,
+            health_bar_height,
+            monster.health,
+            monster.max_health,
+            RED,
+            assets,
+            monster.shields,
+        )
 
-            # Render monster image with death animation if applicable
-            if monster.is_dying:
-                death_progress = min(
-                    1.0, (pygame.time.get_ticks() - monster.death_start_time) / 1000
-                )
-                opacity = int(255 * (1 - death_progress))
-                render_with_opacity(
-                    screen, monster_image, x + offset, y + offset, opacity
+        try:
+            # Render yellow frame for selected monster
+            if monster.selected:
+                frame_padding = layout.frame_padding
+                r.rect(
+                    screen,
+                    YELLOW,
+                    (
+                        x - frame_padding,
+                        y - frame_padding,
+                        monster_size + 2 * frame_padding,
+                        monster_size + 2 * frame_padding,
+                    ),
+                    3,
                 )
-            else:
-                screen.blit(monster_image, (x + offset, y + offset))
 
-            # Render health bar below the monster
-            health_bar_width = monster_size
-            health_bar_height = scale(20)
-            render_health_bar(
+            # Render monster damage in top right corner of the frame
+            damage_x = x + layout.damage_badge_offset
+            damage_y = y + layout.damage_badge_offset
+            render_text(
                 screen,
-                x,
-                y + monster_size + scale(10),
-                health_bar_width,
-                health_bar_height,
-                monster.health,
-                monster.max_health,
-                RED,
-                assets,
-                monster.shields,
+                str(monster.damage),
+                damage_x,
+                damage_y,
+                color=BLACK,
+                font=layout.font,
+                circle=True,
+                outline_color=BLACK,
             )
 
-            try:
-                # Render yellow frame for selected monster
-                if monster.selected:
-                    frame_padding = scale(5)
-                    pygame.draw.rect(
-                        screen,
-                        YELLOW,
-                        (
-                            x - frame_padding,
-                            y - frame_padding,
-                            monster_size + 2 * frame_padding,
-                            monster_size + 2 * frame_padding,
-                        ),
-                        3,
-                    )
-
-                # Render monster damage in top right corner of the frame
-                damage_x = x + scale(12)
-                damage_y = y + scale(12)
-                render_text(
-                    screen,
-                    str(monster.damage),
-                    damage_x,
-                    damage_y,
-                    color=BLACK,
-                    font=FONT,
-                    circle=True,
-                    outline_color=BLACK,
-                )
-
-                # Render monster intention icons
-                intention_icons = get_intention_icons(
-                    monster.intention_icon_types, assets
-                )
-                icon_width = ICON_SIZE
-                total_width = len(intention_icons) * icon_width
-                icon_start_x = x + (monster_size - total_width) // 2
-                icon_y = y + monster_size - ICON_SIZE - scale(5)
-
-                for j, icon in enumerate(intention_icons):
-                    screen.blit(icon, (icon_start_x + j * icon_width, icon_y))
-
-                if monster.shake > 0:
-                    monster.shake -= 1
-            except AttributeError as e:
-                print(
-                    f"Error rendering monster intention icons, maybe game just loaded? {e}"
-                )
+            # Render monster intention icons
+            intention_icons = get_intention_icons(monster.intention_icon_types, assets)
+            icon_width = layout.icon_size
+            total_width = len(intention_icons) * icon_width
+            icon_start_x = x + (monster_size - total_width) // 2
+            icon_y = y + monster_size - layout.intention_rise
+
+            for j, icon in enumerate(intention_icons):
+                r.blit(screen, icon, (icon_start_x + j * icon_width, icon_y))
+
+            if monster.shake > 0:
+                monster.shake -= 1
+        except AttributeError as e:
+            print(
+                f"Error rendering monster intention icons, maybe game just loaded? {e}"
+            )
 
     # Return the center y-coordinate of the monster group
-    return start_y + total_height // 2
+    return grid.center_y
 
 
 def render_keybinds(screen: pygame.Surface, assets: GameAssets):
-    screen.blit(assets.background_image, (0, 0))
-    render_text(screen, "Keybinds", SCREEN_WIDTH // 2 - scale(50), scale(20))
+    r = get_renderer()
+    layout = get_layout()
+    r.blit(screen, assets.background_image, (0, 0))
+    render_text(
+        screen, "Keybinds", layout.width // 2 - layout.scale(50), layout.scale(20)
+    )
 
-    y_offset = scale(60)
+    y_offset = layout.scale(60)
     for category, binds in KEYBINDS.items():
-        render_text(screen, category, scale(20), y_offset, color=YELLOW)
-        y_offset += scale(30)
+        render_text(screen, category, layout.scale(20), y_offset, color=YELLOW)
+        y_offset += layout.scale(30)
         for keys, action in binds.items():
-            render_text(screen, f"{keys}: {action}", scale(40), y_offset)
-            y_offset += scale(25)
-        y_offset += scale(10)
+            render_text(screen, f"{keys}: {action}", layout.scale(40), y_offset)
+            y_offset += layout.scale(25)
+        y_offset += layout.scale(10)
 
     render_text(
         screen,
         "Press ESC to close",
-        SCREEN_WIDTH // 2 - scale(100),
-        SCREEN_HEIGHT - scale(30),
+        layout.width // 2 - layout.scale(100),
+        layout.height - layout.scale(30),
     )
-    pygame.display.flip()
+    r.present()
 
 
 def render_combat_state(
@@ -655,24 +810,25 @@ def render_combat_state(
     assets: GameAssets,
     played_cards: List[Card] = [],
     animation_progress: float = 1.0,
+    draw_odds: Optional[DrawOdds] = None,
 ):
-    screen.blit(assets.background_image, (0, 0))
-
-    # Render parchment texture at the top
-    header_height = scale(50)
-    parchment = pygame.transform.scale(
-        assets.parchment_texture, (SCREEN_WIDTH, header_height)
-    )
-    screen.blit(parchment, (0, 0))
+    r = get_renderer()
+    # Background, header parchment and hand panel in one cached layer
+    r.blit(screen, static_layer("combat", assets, _compose_combat), (0, 0))
 
+    layout = get_layout()
     # Render score in the top left
-    render_text(screen, f"Score: {score}", scale(10), scale(15), color=BLACK)
+    render_text(screen, f"Score: {score}", *layout.header_text, color=BLACK)
 
     # Render dungeon level in the top center
     level_text = f"Level: {dungeon_level}"
-    level_width = FONT.size(level_text)[0]
+    level_width = layout.font.size(level_text)[0]
     render_text(
-        screen, level_text, (SCREEN_WIDTH - level_width) // 2, scale(15), color=BLACK
+        screen,
+        level_text,
+        (layout.width - level_width) // 2,
+        layout.header_text_y,
+        color=BLACK,
     )
 
     monster_center_y = render_monsters(
@@ -680,22 +836,15 @@ def render_combat_state(
     )
     render_player(screen, player, assets, monster_center_y, animation_progress)
 
-    s = pygame.Surface((SCREEN_WIDTH, CARD_HEIGHT + scale(40)))
-    s.set_alpha(128)
-    s.fill((100, 100, 100))
-    screen.blit(s, (0, SCREEN_HEIGHT - CARD_HEIGHT - scale(40)))
-
-    card_start_x = (
-        SCREEN_WIDTH - (len(player.hand) * (CARD_WIDTH + CARD_SPACING) - CARD_SPACING)
-    ) // 2
     combat_keys = next(iter(KEYBINDS["Event"].keys()))
     num_keys = [pygame.key.key_code(k) for k in combat_keys.split(", ")]
-    for i, card in enumerate(player.hand):
+    slots = layout.card_slots(len(player.hand))
+    for i, (card, (x, y)) in enumerate(zip(player.hand, slots)):
         card.x, card.y = render_card(
             screen,
             card,
-            card_start_x + i * (CARD_WIDTH + CARD_SPACING),
-            SCREEN_HEIGHT - CARD_HEIGHT - scale(20),
+            x,
+            y,
             i == selected_card,
             assets,
             player.energy.value,
@@ -726,7 +875,40 @@ def render_combat_state(
                 if not card.is_animating:  # Check if the animation is complete
                     card.reset_animation()  # Reset animation properties for reuse
 
-    pygame.display.flip()
+    if draw_odds is not None:
+        render_draw_odds(screen, draw_odds)
+
+    r.present()
+
+
+def render_draw_odds(screen: pygame.Surface, odds: DrawOdds, max_cards: int = 8):
+    """Panel with the chance of drawing each card class and card, next turn or
+    from the selected card's draws."""
+    r = get_renderer()
+    layout = get_layout()
+    line_height = layout.scale(20)
+    lines = [
+        f"{odds.label}: {odds.draws} cards" + (" (reshuffle)" if odds.reshuffle else "")
+    ]
+    lines += [f"{name}: {p:.0%}" for name, p in odds.classes.items()]
+    lines.append("")
+    lines += [f"{name}: {p:.0%}" for name, p in list(odds.cards.items())[:max_cards]]
+
+    width = layout.scale(220)
+    x = layout.scale(10)
+    y = layout.scale(60)
+    panel = r.surface((width, len(lines) * line_height + layout.scale(10)))
+    panel.set_alpha(200)
+    panel.fill(BEIGE)
+    r.blit(screen, panel, (x, y))
+    for i, line in enumerate(lines):
+        render_text(
+            screen,
+            line,
+            x + layout.scale(8),
+            y + layout.scale(5) + i * line_height,
+            font=layout.small_font,
+        )
 
 
 def render_victory_state(
@@ -737,23 +919,25 @@ def render_victory_state(
     assets: GameAssets,
     player: Player,
 ):
-    screen.blit(assets.victory_image, (0, 0))
+    r = get_renderer()
+    layout = get_layout()
+    r.blit(screen, assets.victory_image, (0, 0))
     # screen.fill(BLACK)
-    header_height = scale(200)
-    s = pygame.Surface((SCREEN_WIDTH, header_height))
+    header_height = layout.scale(200)
+    s = r.surface((layout.width, header_height))
     s.set_alpha(128)
     s.fill(BEIGE)
-    screen.blit(s, (0, 0))
+    r.blit(screen, s, (0, 0))
 
-    render_text(screen, "Victory!", SCREEN_WIDTH // 2 - 50, 50)
-    render_text(screen, f"Score: {score}", SCREEN_WIDTH // 2 - 50, 100)
+    render_text(screen, "Victory!", layout.width // 2 - 50, 50)
+    render_text(screen, f"Score: {score}", layout.width // 2 - 50, 100)
     render_text(
-        screen, "Select a card to add to your deck:", SCREEN_WIDTH // 2 - 150, 150
+        screen, "Select a card to add to your deck:", layout.width // 2 - 150, 150
     )
     render_text(
         screen,
         "Press number keys to select a card, or #4 to skip and gain +5 max HP",
-        SCREEN_WIDTH // 2 - 250,
+        layout.width // 2 - 250,
         175,
     )
 
@@ -763,8 +947,8 @@ def render_victory_state(
         render_card(
             screen,
             card,
-            scale(250) + i * (CARD_WIDTH + CARD_SPACING),
-            scale(250),
+            layout.scale(250) + i * (layout.card_width + layout.card_spacing),
+            layout.scale(250),
             i == selected_card,
             assets,
             player.energy.value,
@@ -777,17 +961,17 @@ def render_victory_state(
     render_text(
         screen,
         f"{get_key_name(num_keys[-1])}: Skip",
-        scale(250) + 3 * (CARD_WIDTH + CARD_SPACING),
-        scale(250),
+        layout.scale(250) + 3 * (layout.card_width + layout.card_spacing),
+        layout.scale(250),
         color=WHITE,
     )
 
     render_health_bar(
         screen,
-        scale(50),
-        scale(50),
-        scale(200),
-        scale(20),
+        layout.scale(50),
+        layout.scale(50),
+        layout.scale(200),
+        layout.scale(20),
         player.health,
         player.max_health,
         GREEN,
@@ -796,10 +980,10 @@ def render_victory_state(
     )
     render_health_bar(
         screen,
-        scale(50),
-        scale(70),
-        scale(200),
-        scale(20),
+        layout.scale(50),
+        layout.scale(70),
+        layout.scale(200),
+        layout.scale(20),
         player.energy,
         player.max_energy,
         BLUE,
@@ -807,92 +991,83 @@ def render_victory_state(
         0,
     )
 
-    pygame.display.flip()
+    r.present()
 
 
 def render_start_screen(screen: pygame.Surface, assets: GameAssets):
-    screen.blit(assets.start_screen_image, (0, 0))
+    r = get_renderer()
+    layout = get_layout()
+    r.blit(screen, assets.start_screen_image, (0, 0))
     render_text(
-        screen, "Press any key to start", SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT - 50
+        screen, "Press any key to start", layout.width // 2 - 100, layout.height - 50
     )
-    pygame.display.flip()
+    r.present()
 
 
 def render_game_over_screen(screen: pygame.Surface, score: int, assets: GameAssets):
-    screen.blit(assets.game_over_image, (0, 0))
+    r = get_renderer()
+    layout = get_layout()
+    r.blit(screen, assets.game_over_image, (0, 0))
     render_text(
-        screen, f"Final Score: {score}", SCREEN_WIDTH // 2 - 60, SCREEN_HEIGHT - 100
+        screen, f"Final Score: {score}", layout.width // 2 - 60, layout.height - 100
     )
     render_text(
-        screen, "Press any key to continue", SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT - 50
+        screen, "Press any key to continue", layout.width // 2 - 100, layout.height - 50
     )
-    pygame.display.flip()
+    r.present()
 
 
 def render_menu(
     screen: pygame.Surface, options: List[str], selected: int, assets: GameAssets
 ):
-    screen.blit(assets.background_image, (0, 0))
+    r = get_renderer()
+    layout = get_layout()
+    r.blit(screen, assets.background_image, (0, 0))
 
-    menu_width = scale(300)
-    menu_height = scale(50) * len(options) + scale(20)
-    menu_x = (SCREEN_WIDTH - menu_width) // 2
-    menu_y = (SCREEN_HEIGHT - menu_height) // 2
-    pygame.draw.rect(screen, BEIGE, (menu_x, menu_y, menu_width, menu_height))
-    pygame.draw.rect(screen, BLACK, (menu_x, menu_y, menu_width, menu_height), 2)
+    menu_width = layout.scale(300)
+    menu_height = layout.scale(50) * len(options) + layout.scale(20)
+    menu_x = (layout.width - menu_width) // 2
+    menu_y = (layout.height - menu_height) // 2
+    r.rect(screen, BEIGE, (menu_x, menu_y, menu_width, menu_height))
+    r.rect(screen, BLACK, (menu_x, menu_y, menu_width, menu_height), 2)
 
     for i, option in enumerate(options):
         text_color = YELLOW if i == selected else BLACK
         render_text(
             screen,
             f"#{i + 1}: {option}",
-            menu_x + scale(20),
-            menu_y + scale(20) + i * scale(50),
+            menu_x + layout.scale(20),
+            menu_y + layout.scale(20) + i * layout.scale(50),
             color=text_color,
         )
 
-    pygame.display.flip()
+    r.present()
 
 
 def render_text_event(
     screen: pygame.Surface,
-    event_name: str,
+    event_key: str,
     event_description: str,
     options: List[str],
     assets: GameAssets,
     player: Player,
 ):
-    # Render event image
-    event_image = assets.load_event_image(event_name)
-    screen.blit(event_image, (0, 0))
-
-    # Render description parchment
-    description_parchment = pygame.transform.scale(
-        assets.parchment_texture,
-        (SCREEN_WIDTH // 2 - scale(20), SCREEN_HEIGHT // 3 - scale(20)),
-    )
-    screen.blit(description_parchment, (scale(10), SCREEN_HEIGHT * 2 // 3 + scale(10)))
-
-    # Render options parchment
-    options_parchment = pygame.transform.scale(
-        assets.parchment_texture,
-        (SCREEN_WIDTH // 2 - scale(20), SCREEN_HEIGHT // 3 - scale(20)),
-    )
-    screen.blit(
-        options_parchment,
-        (SCREEN_WIDTH // 2 + scale(10), SCREEN_HEIGHT * 2 // 3 + scale(10)),
-    )
+    r = get_renderer()
+    layout = get_layout()
+    # Event image and both parchment panels in one cached layer
+    layer = static_layer("event", assets, _compose_event, event_key)
+    r.blit(screen, layer, (0, 0))
 
     # Render event description
     render_text_with_background(
         screen,
         event_description,
-        scale(20),
-        SCREEN_HEIGHT * 2 // 3 + scale(20),
-        SMALL_FONT,
+        layout.scale(20),
+        layout.height * 2 // 3 + layout.scale(20),
+        layout.small_font,
         text_color=BLACK,
         background_color=None,
-        max_width=SCREEN_WIDTH // 2 - scale(40),
+        max_width=layout.width // 2 - layout.scale(40),
     )
 
     # Render options
@@ -902,19 +1077,19 @@ def render_text_event(
             render_text(
                 screen,
                 f"{key_mapping[i]}: {option}",
-                SCREEN_WIDTH // 2 + scale(20),
-                SCREEN_HEIGHT * 2 // 3 + scale(20) + i * scale(30),
+                layout.width // 2 + layout.scale(20),
+                layout.height * 2 // 3 + layout.scale(20) + i * layout.scale(30),
                 color=BLACK,
-                font=SMALL_FONT,
+                font=layout.small_font,
             )
 
     # Render player stats
     render_health_bar(
         screen,
-        scale(50),
-        scale(50),
-        scale(200),
-        scale(20),
+        layout.scale(50),
+        layout.scale(50),
+        layout.scale(200),
+        layout.scale(20),
         player.health,
         player.max_health,
         GREEN,
@@ -923,10 +1098,10 @@ def render_text_event(
     )
     render_health_bar(
         screen,
-        scale(50),
-        scale(70),
-        scale(200),
-        scale(20),
+        layout.scale(50),
+        layout.scale(70),
+        layout.scale(200),
+        layout.scale(20),
         player.energy,
         player.max_energy,
         BLUE,
@@ -934,36 +1109,46 @@ def render_text_event(
         0,
     )
 
-    pygame.display.flip()
+    r.present()
 
 
 def render_node_selection(
     screen: pygame.Surface, nodes: List["Node"], selected: int, assets: GameAssets
 ):
-    screen.blit(assets.background_image, (0, 0))
+    r = get_renderer()
+    layout = get_layout()
+    r.blit(screen, assets.background_image, (0, 0))
 
     render_text(
-        screen, "Choose your next path:", SCREEN_WIDTH // 2 - scale(100), scale(50)
+        screen,
+        "Choose your next path:",
+        layout.width // 2 - layout.scale(100),
+        layout.scale(50),
     )
 
-    node_width = scale(150)
-    node_height = scale(100)
-    node_spacing = scale(50)
+    node_width = layout.scale(150)
+    node_height = layout.scale(100)
+    node_spacing = layout.scale(50)
     total_width = len(nodes) * node_width + (len(nodes) - 1) * node_spacing
-    start_x = (SCREEN_WIDTH - total_width) // 2
+    start_x = (layout.width - total_width) // 2
 
     for i, node in enumerate(nodes):
         node_x = start_x + i * (node_width + node_spacing)
-        node_y = SCREEN_HEIGHT // 2 - node_height // 2
+        node_y = layout.height // 2 - node_height // 2
 
         color = YELLOW if i == selected else WHITE
-        pygame.draw.rect(screen, color, (node_x, node_y, node_width, node_height))
-        pygame.draw.rect(screen, BLACK, (node_x, node_y, node_width, node_height), 2)
+        r.rect(screen, color, (node_x, node_y, node_width, node_height))
+        r.rect(screen, BLACK, (node_x, node_y, node_width, node_height), 2)
 
         node_type_text = node.node_type.capitalize()
-        render_text(screen, node_type_text, node_x + scale(10), node_y + scale(10))
         render_text(
-            screen, f"Level {node.level}", node_x + scale(10), node_y + scale(50)
+            screen, node_type_text, node_x + layout.scale(10), node_y + layout.scale(10)
+        )
+        render_text(
+            screen,
+            f"Level {node.level}",
+            node_x + layout.scale(10),
+            node_y + layout.scale(50),
         )
         hotkey_list = [
             get_key_name(pygame.K_q),
@@ -978,17 +1163,20 @@ def render_node_selection(
             get_key_name(pygame.K_p),
         ]
         render_text(
-            screen, hotkey_list[i], node_x + scale(10), node_y + node_height - scale(30)
+            screen,
+            hotkey_list[i],
+            node_x + layout.scale(10),
+            node_y + node_height - layout.scale(30),
         )
 
     render_text(
         screen,
         "Press number keys to select a path",
-        SCREEN_WIDTH // 2 - scale(150),
-        SCREEN_HEIGHT - scale(50),
+        layout.width // 2 - layout.scale(150),
+        layout.height - layout.scale(50),
     )
 
-    pygame.display.flip()
+    r.present()
 
 
 def render_deck_view(
@@ -998,30 +1186,47 @@ def render_deck_view(
     total_pages: int,
     assets: GameAssets,
     player: Player,
+    stats: Optional[DeckStats] = None,
 ):
-    screen.blit(assets.background_image, (0, 0))
+    r = get_renderer()
+    layout = get_layout()
+    r.blit(screen, assets.background_image, (0, 0))
 
-    render_text(screen, "Full Deck View", SCREEN_WIDTH // 2 - scale(50), scale(20))
     render_text(
-        screen, f"Total Cards: {len(deck)}", SCREEN_WIDTH - scale(150), scale(20)
+        screen, "Full Deck View", layout.width // 2 - layout.scale(50), layout.scale(20)
     )
+    render_text(
+        screen,
+        f"Total Cards: {len(deck)}",
+        layout.width - layout.scale(150),
+        layout.scale(20),
+    )
+    if stats is not None:
+        curve = " ".join(f"{cost}:{n}" for cost, n in stats.mana_curve.items())
+        render_text(
+            screen,
+            f"Curve {curve} | Dmg/energy {stats.damage_per_energy:.1f}"
+            f" | Draw {stats.draw_density:.2f} | Curses {stats.curses}",
+            layout.scale(20),
+            layout.scale(50),
+        )
     render_text(
         screen,
         "Use Left/Right arrows to change pages, Esc to close",
-        SCREEN_WIDTH // 2 - scale(200),
-        SCREEN_HEIGHT - scale(30),
+        layout.width // 2 - layout.scale(200),
+        layout.height - layout.scale(30),
     )
 
     cards_per_row = 5
     cards_per_column = 3
     cards_per_page = cards_per_row * cards_per_column
-    card_spacing_x = scale(20)
-    card_spacing_y = scale(20)
+    card_spacing_x = layout.scale(20)
+    card_spacing_y = layout.scale(20)
     start_x = (
-        SCREEN_WIDTH
-        - (cards_per_row * CARD_WIDTH + (cards_per_row - 1) * card_spacing_x)
+        layout.width
+        - (cards_per_row * layout.card_width + (cards_per_row - 1) * card_spacing_x)
     ) // 2
-    start_y = scale(80)
+    start_y = layout.scale(80)
 
     current_page = max(0, min(current_page, total_pages - 1))
 
@@ -1031,8 +1236,8 @@ def render_deck_view(
     for i, card in enumerate(deck[start_index:end_index]):
         row = i // cards_per_row
         col = i % cards_per_row
-        x = start_x + col * (CARD_WIDTH + card_spacing_x)
-        y = start_y + row * (CARD_HEIGHT + card_spacing_y)
+        x = start_x + col * (layout.card_width + card_spacing_x)
+        y = start_y + row * (layout.card_height + card_spacing_y)
 
         render_card(
             screen,
@@ -1051,11 +1256,11 @@ def render_deck_view(
     render_text(
         screen,
         f"Page {current_page + 1} of {total_pages}",
-        SCREEN_WIDTH // 2 - scale(50),
-        SCREEN_HEIGHT - scale(60),
+        layout.width // 2 - layout.scale(50),
+        layout.height - layout.scale(60),
     )
 
-    pygame.display.flip()
+    r.present()
 
     return current_page
 
@@ -1066,27 +1271,31 @@ def render_relic_selection(
     selected_relic: int,
     assets: GameAssets,
 ):
+    r = get_renderer()
+    layout = get_layout()
     screen.fill(BLACK)
-    header_height = scale(200)
-    s = pygame.Surface((SCREEN_WIDTH, header_height))
+    header_height = layout.scale(200)
+    s = r.surface((layout.width, header_height))
     s.set_alpha(128)
     s.fill(BEIGE)
-    screen.blit(s, (0, 0))
+    r.blit(screen, s, (0, 0))
 
-    render_text(screen, "Select a Relic", SCREEN_WIDTH // 2 - scale(50), scale(50))
+    render_text(
+        screen, "Select a Relic", layout.width // 2 - layout.scale(50), layout.scale(50)
+    )
     render_text(
         screen,
         "Press number keys to select a relic, or SPACE to skip",
-        SCREEN_WIDTH // 2 - scale(250),
-        scale(100),
+        layout.width // 2 - layout.scale(250),
+        layout.scale(100),
     )
 
-    relic_width = scale(200)
-    relic_height = scale(150)
-    relic_spacing = scale(50)
+    relic_width = layout.scale(200)
+    relic_height = layout.scale(150)
+    relic_spacing = layout.scale(50)
     total_width = len(new_relics) * relic_width + (len(new_relics) - 1) * relic_spacing
-    start_x = (SCREEN_WIDTH - total_width) // 2
-    start_y = scale(250)
+    start_x = (layout.width - total_width) // 2
+    start_y = layout.scale(250)
 
     relic_keys = next(iter(KEYBINDS["Relic Selection"].keys()))
     num_keys = [pygame.key.key_code(k) for k in relic_keys.split(", ")]
@@ -1095,17 +1304,15 @@ def render_relic_selection(
         relic_y = start_y
 
         color = YELLOW if i == selected_relic else WHITE
-        pygame.draw.rect(screen, color, (relic_x, relic_y, relic_width, relic_height))
-        pygame.draw.rect(
-            screen, BLACK, (relic_x, relic_y, relic_width, relic_height), 2
-        )
+        r.rect(screen, color, (relic_x, relic_y, relic_width, relic_height))
+        r.rect(screen, BLACK, (relic_x, relic_y, relic_width, relic_height), 2)
 
         render_text(
             screen,
             relic.name,
-            relic_x + scale(10),
-            relic_y + scale(10),
-            font=SMALL_FONT,
+            relic_x + layout.scale(10),
+            relic_y + layout.scale(10),
+            font=layout.small_font,
         )
 
         words = relic.description.split()
@@ -1113,7 +1320,7 @@ def render_relic_selection(
         current_line: List[str] = []
         for word in words:
             test_line = " ".join(current_line + [word])
-            if SMALL_FONT.size(test_line)[0] <= relic_width - scale(20):
+            if layout.small_font.size(test_line)[0] <= relic_width - layout.scale(20):
                 current_line.append(word)
             else:
                 lines.append(" ".join(current_line))
@@ -1124,17 +1331,17 @@ def render_relic_selection(
             render_text(
                 screen,
                 line,
-                relic_x + scale(10),
-                relic_y + scale(40) + j * scale(20),
-                font=SMALL_FONT,
+                relic_x + layout.scale(10),
+                relic_y + layout.scale(40) + j * layout.scale(20),
+                font=layout.small_font,
             )
 
         render_text(
             screen,
             f"{get_key_name(num_keys[i]) if i < len(num_keys) else ''}",
-            relic_x + relic_width - scale(30),
-            relic_y + relic_height - scale(30),
-            font=SMALL_FONT,
+            relic_x + relic_width - layout.scale(30),
+            relic_y + relic_height - layout.scale(30),
+            font=layout.small_font,
         )
 
     render_text(
@@ -1142,36 +1349,43 @@ def render_relic_selection(
         f"{get_key_name(num_keys[-1])}: Skip",
         start_x + 3 * (relic_width + relic_spacing),
         start_y,
-        font=SMALL_FONT,
+        font=layout.small_font,
     )
 
-    pygame.display.flip()
+    r.present()
 
 
 def render_relic_view(screen: pygame.Surface, relics: List[Relic], assets: GameAssets):
-    screen.blit(assets.background_image, (0, 0))
+    r = get_renderer()
+    layout = get_layout()
+    r.blit(screen, assets.background_image, (0, 0))
 
-    render_text(screen, "Relic View", SCREEN_WIDTH // 2 - scale(50), scale(20))
     render_text(
-        screen, f"Total Relics: {len(relics)}", SCREEN_WIDTH - scale(150), scale(20)
+        screen, "Relic View", layout.width // 2 - layout.scale(50), layout.scale(20)
+    )
+    render_text(
+        screen,
+        f"Total Relics: {len(relics)}",
+        layout.width - layout.scale(150),
+        layout.scale(20),
     )
     render_text(
         screen,
         "Press Esc or R to close",
-        SCREEN_WIDTH // 2 - scale(100),
-        SCREEN_HEIGHT - scale(30),
+        layout.width // 2 - layout.scale(100),
+        layout.height - layout.scale(30),
     )
 
-    relic_width = scale(200)
-    relic_height = scale(150)
-    relic_spacing_x = scale(20)
-    relic_spacing_y = scale(20)
+    relic_width = layout.scale(200)
+    relic_height = layout.scale(150)
+    relic_spacing_x = layout.scale(20)
+    relic_spacing_y = layout.scale(20)
     relics_per_row = 4
     start_x = (
-        SCREEN_WIDTH
+        layout.width
         - (relics_per_row * relic_width + (relics_per_row - 1) * relic_spacing_x)
     ) // 2
-    start_y = scale(80)
+    start_y = layout.scale(80)
 
     relic_counts = Counter(relic.name for relic in relics)
 
@@ -1183,12 +1397,22 @@ def render_relic_view(screen: pygame.Surface, relics: List[Relic], assets: GameA
 
         relic = next(relic for relic in relics if relic.name == relic_name)
 
-        pygame.draw.rect(screen, WHITE, (x, y, relic_width, relic_height))
-        pygame.draw.rect(screen, BLACK, (x, y, relic_width, relic_height), 2)
+        r.rect(screen, WHITE, (x, y, relic_width, relic_height))
+        r.rect(screen, BLACK, (x, y, relic_width, relic_height), 2)
 
-        render_text(screen, relic.name, x + scale(10), y + scale(10), font=SMALL_FONT)
         render_text(
-            screen, f"Count: {count}", x + scale(10), y + scale(30), font=SMALL_FONT
+            screen,
+            relic.name,
+            x + layout.scale(10),
+            y + layout.scale(10),
+            font=layout.small_font,
+        )
+        render_text(
+            screen,
+            f"Count: {count}",
+            x + layout.scale(10),
+            y + layout.scale(30),
+            font=layout.small_font,
         )
 
         words = relic.description.split()
@@ -1196,7 +1420,7 @@ def render_relic_view(screen: pygame.Surface, relics: List[Relic], assets: GameA
         current_line: List[str] = []
         for word in words:
             test_line = " ".join(current_line + [word])
-            if SMALL_FONT.size(test_line)[0] <= relic_width - scale(20):
+            if layout.small_font.size(test_line)[0] <= relic_width - layout.scale(20):
                 current_line.append(word)
             else:
                 lines.append(" ".join(current_line))
@@ -1207,42 +1431,12 @@ def render_relic_view(screen: pygame.Surface, relics: List[Relic], assets: GameA
             render_text(
                 screen,
                 line,
-                x + scale(10),
-                y + scale(50) + j * scale(20),
-                font=SMALL_FONT,
+                x + layout.scale(10),
+                y + layout.scale(50) + j * layout.scale(20),
+                font=layout.small_font,
             )
 
-    pygame.display.flip()
-
-
-def handle_card_selection(full_deck: List[Card], assets: GameAssets, player: Player):
-    selected_index = 0
-    clock = pygame.time.Clock()
-    screen = pygame.display.get_surface()
-
-    while True:
-        render_card_selection(
-            screen,
-            sorted(full_deck, key=lambda card: (card.energy_cost, card.name)),
-            selected_index,
-            assets,
-            player,
-        )
-
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                return None
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    return None
-                elif event.key == pygame.K_k:
-                    selected_index = max(0, selected_index - 1)
-                elif event.key == pygame.K_j:
-                    selected_index = min(len(full_deck) - 1, selected_index + 1)
-                elif event.key == pygame.K_SPACE:
-                    return selected_index
-
-        clock.tick(30)
+    r.present()
 
 
 def render_card_selection(
@@ -1252,32 +1446,26 @@ def render_card_selection(
     assets: GameAssets,
     player: Player,
 ):
-    screen.blit(assets.background_image, (0, 0))
-
-    # Render parchment texture at the top
-    header_height = scale(50)
-    parchment = pygame.transform.scale(
-        assets.parchment_texture, (SCREEN_WIDTH, header_height)
-    )
-    screen.blit(parchment, (0, 0))
+    r = get_renderer()
+    layout = get_layout()
+    r.blit(screen, static_layer("header", assets, _compose_header), (0, 0))
 
     render_text(
         screen,
         "Choose a card. (navigate with K & J and select with SPACE)",
-        scale(20),
-        scale(15),
+        layout.scale(20),
+        layout.scale(15),
         color=BLACK,
     )
 
-    card_list_width = scale(400)
-    card_list_height = SCREEN_HEIGHT - header_height - scale(60)
-    card_list_x = scale(20)
-    card_list_y = header_height + scale(20)
+    card_list_width = layout.scale(400)
+    header_height = get_layout().header_height
+    card_list_height = layout.height - header_height - layout.scale(60)
+    card_list_x = layout.scale(20)
+    card_list_y = header_height + layout.scale(20)
 
-    pygame.draw.rect(
-        screen, BEIGE, (card_list_x, card_list_y, card_list_width, card_list_height)
-    )
-    pygame.draw.rect(
+    r.rect(screen, BEIGE, (card_list_x, card_list_y, card_list_width, card_list_height))
+    r.rect(
         screen, BLACK, (card_list_x, card_list_y, card_list_width, card_list_height), 2
     )
 
@@ -1290,10 +1478,10 @@ def render_card_selection(
         render_text(
             screen,
             card_text,
-            card_list_x + scale(10),
-            card_list_y + scale(10) + i * scale(30),
+            card_list_x + layout.scale(10),
+            card_list_y + layout.scale(10) + i * layout.scale(30),
             color=color,
-            font=SMALL_FONT,
+            font=layout.small_font,
         )
 
     # Render selected card on the right
@@ -1302,8 +1490,8 @@ def render_card_selection(
         render_card(
             screen,
             selected_card,
-            SCREEN_WIDTH - CARD_WIDTH - scale(40),
-            header_height + scale(20),
+            layout.width - layout.card_width - layout.scale(40),
+            header_height + layout.scale(20),
             True,
             assets,
             player.energy.value,
@@ -1316,18 +1504,43 @@ def render_card_selection(
     render_text(
         screen,
         instructions,
-        scale(20),
-        SCREEN_HEIGHT - scale(30),
+        layout.scale(20),
+        layout.height - layout.scale(30),
         color=BLACK,
-        font=SMALL_FONT,
+        font=layout.small_font,
     )
-    pygame.display.flip()
+    r.present()
 
 
 def render_with_opacity(
     screen: pygame.Surface, image: pygame.Surface, x: int, y: int, opacity: int
 ):
-    temp = pygame.Surface(image.get_size(), pygame.SRCALPHA)
-    temp.blit(image, (0, 0))
-    temp.fill((255, 255, 255, opacity), None, pygame.BLEND_RGBA_MULT)
-    screen.blit(temp, (x, y))
+    get_renderer().blit(screen, faded(image, opacity), (x, y))
+
+
+FADE_LEVELS = 32
+
+
+def faded(image: pygame.Surface, opacity: int) -> pygame.Surface:
+    """``image`` with its alpha multiplied by ``opacity``, quantized to
+    FADE_LEVELS steps so each sprite's fade reuses a small cached ramp."""
+    level = round(max(0, min(255, opacity)) * (FADE_LEVELS - 1) / 255)
+    if level == FADE_LEVELS - 1:
+        return image
+
+    def build() -> pygame.Surface:
+        with composing() as r:
+            surface = r.surface(image.get_size(), pygame.SRCALPHA)
+            r.blit(surface, image, (0, 0))
+        alpha = level * 255 // (FADE_LEVELS - 1)
+        surface.fill((255, 255, 255, alpha), None, pygame.BLEND_RGBA_MULT)
+        return surface
+
+    return sprite_cache.get(("fade", image, level), build)
+
+
+def unit_sprite(path: str, size: int) -> pygame.Surface:
+    """A player or monster image loaded and scaled once per screen size."""
+    return render_cache.get(
+        ("sprite", path, size), lambda: GameAssets.load_and_scale_ui(path, (size, size))
+    )
@@ -0,0 +1,83 @@
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+from deckdeep.renderer import get_renderer
+
+
+class RenderCache:
+    """Keyed store for surfaces, fonts and other render artefacts.
+
+    Keys are tuples whose first element is a namespace (e.g. ``("font", 26)``),
+    so a whole family of entries can be dropped at once with ``invalidate``.
+    """
+
+    def __init__(self):
+        self._entries: Dict[Tuple[Hashable, ...], Any] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Tuple[Hashable, ...], factory: Callable[[], Any]) -> Any:
+        try:
+            value = self._entries[key]
+            self.hits += 1
+            return value
+        except KeyError:
+            self.misses += 1
+            get_renderer().cache_miss()
+            value = self._entries[key] = factory()
+            return value
+
+    def invalidate(self, *prefix: Hashable) -> int:
+        """Drop the entries whose key starts with ``prefix``, e.g. a namespace."""
+        stale = [key for key in self._entries if key[: len(prefix)] == prefix]
+        for key in stale:
+            del self._entries[key]
+        return len(stale)
+
+    def clear(self):
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Tuple[Hashable, ...]) -> bool:
+        return key in self._entries
+
+
+class SpriteCache:
+    """Least-recently-used store for sprites keyed on the state they show (health
+    values, status effect stacks, ...). Unlike RenderCache the keys change as the
+    game runs, so the store is bounded to ``capacity`` entries."""
+
+    def __init__(self, capacity: int = 256):
+        self.capacity = capacity
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        try:
+            value = self._entries[key]
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+        except KeyError:
+            self.misses += 1
+            get_renderer().cache_miss()
+            value = self._entries[key] = factory()
+            if len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+            return value
+
+    def clear(self):
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Shared by every screen so a resolution change can drop all cached artefacts in one place.
+render_cache = RenderCache()
+sprite_cache = SpriteCache()
+# Card faces are large, so they get a smaller store of their own
+card_face_cache = SpriteCache(capacity=96)
@@ -0,0 +1,254 @@
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import ContextManager, Iterator, List, Optional, Sequence, Tuple
+
+import pygame
+
+Size = Tuple[float, float]
+
+
+class Renderer(ABC):
+    """Drawing backend used by every function in deckdeep.render.
+
+    Covers the operations the screens use: blits, text rendering, surface
+    allocation (new, scaled or copied surfaces), primitive shapes and presenting
+    the finished frame.
+    """
+
+    @abstractmethod
+    def blit(self, target: pygame.Surface, source: pygame.Surface, dest, *args, **kw):
+        pass
+
+    @abstractmethod
+    def blits(self, target: pygame.Surface, sequence: Sequence):
+        """Blit many (source, dest) pairs in one call."""
+
+    @abstractmethod
+    def text(self, font, text: str, antialias: bool, color) -> pygame.Surface:
+        pass
+
+    @abstractmethod
+    def surface(self, size: Size, flags: int = 0) -> pygame.Surface:
+        pass
+
+    @abstractmethod
+    def scale(self, source: pygame.Surface, size: Size) -> pygame.Surface:
+        pass
+
+    @abstractmethod
+    def copy(self, source: pygame.Surface) -> pygame.Surface:
+        pass
+
+    @abstractmethod
+    def rect(self, target: pygame.Surface, color, rect, *args, **kw):
+        pass
+
+    @abstractmethod
+    def line(self, target: pygame.Surface, color, start, end, width: int = 1):
+        pass
+
+    @abstractmethod
+    def circle(self, target: pygame.Surface, color, center, radius):
+        pass
+
+    @abstractmethod
+    def present(self):
+        """Show the finished frame."""
+
+    def composer(self) -> "Renderer":
+        """Renderer for drawing cached sprites and layers, which must be drawn
+        for real whatever the frame itself is drawn with."""
+        return self
+
+    def cache_miss(self):
+        """Called when a render cache has to build an entry."""
+
+
+class PygameRenderer(Renderer):
+    """Draws with pygame and flips the real display."""
+
+    def blit(self, target, source, dest, *args, **kw):
+        return target.blit(source, dest, *args, **kw)
+
+    def blits(self, target, sequence):
+        return target.blits(sequence, doreturn=False)
+
+    def text(self, font, text, antialias, color):
+        return font.render(text, antialias, color)
+
+    def surface(self, size, flags=0):
+        return pygame.Surface(size, flags)
+
+    def scale(self, source, size):
+        return pygame.transform.scale(source, size)
+
+    def copy(self, source):
+        return source.copy()
+
+    def rect(self, target, color, rect, *args, **kw):
+        return pygame.draw.rect(target, color, rect, *args, **kw)
+
+    def line(self, target, color, start, end, width=1):
+        return pygame.draw.line(target, color, start, end, width)
+
+    def circle(self, target, color, center, radius):
+        return pygame.draw.circle(target, color, center, radius)
+
+    def present(self):
+        pygame.display.flip()
+
+
+class NullRenderer(Renderer):
+    """Draws nothing, for simulations and headless runs.
+
+    Allocating calls hand back one shared 1x1 surface, so layout code that asks
+    for sizes keeps working without any real surfaces being created.
+    """
+
+    def __init__(self):
+        self._surface = pygame.Surface((1, 1), pygame.SRCALPHA)
+        self._composer = PygameRenderer()
+
+    def blit(self, target, source, dest, *args, **kw):
+        return None
+
+    def blits(self, target, sequence):
+        return None
+
+    def text(self, font, text, antialias, color):
+        return self._surface
+
+    def surface(self, size, flags=0):
+        return self._surface
+
+    def scale(self, source, size):
+        return self._surface
+
+    def copy(self, source):
+        return self._surface
+
+    def rect(self, target, color, rect, *args, **kw):
+        return None
+
+    def line(self, target, color, start, end, width=1):
+        return None
+
+    def circle(self, target, color, center, radius):
+        return None
+
+    def present(self):
+        pass
+
+    def composer(self) -> Renderer:
+        return self._composer
+
+
+@dataclass
+class FrameStats:
+    blits: int = 0
+    texts: int = 0
+    surfaces: int = 0  # new, scaled and copied surfaces
+    shapes: int = 0
+    presents: int = 0
+    misses: int = 0  # render cache entries built during the frame
+
+    @property
+    def allocations(self) -> int:
+        return self.texts + self.surfaces
+
+
+class RecordingRenderer(Renderer):
+    """Counts draw calls and allocations per frame, delegating the drawing to
+    ``inner`` (a NullRenderer by default). A frame ends at each ``present``.
+
+    Cache misses and whatever their builders draw count towards the frame too.
+    """
+
+    def __init__(self, inner: Optional[Renderer] = None):
+        self.inner = inner if inner is not None else NullRenderer()
+        self.current = FrameStats()
+        self.frames: List[FrameStats] = []
+
+    def blit(self, target, source, dest, *args, **kw):
+        self.current.blits += 1
+        return self.inner.blit(target, source, dest, *args, **kw)
+
+    def blits(self, target, sequence):
+        self.current.blits += len(sequence)
+        return self.inner.blits(target, sequence)
+
+    def text(self, font, text, antialias, color):
+        self.current.texts += 1
+        return self.inner.text(font, text, antialias, color)
+
+    def surface(self, size, flags=0):
+        self.current.surfaces += 1
+        return self.inner.surface(size, flags)
+
+    def scale(self, source, size):
+        self.current.surfaces += 1
+        return self.inner.scale(source, size)
+
+    def copy(self, source):
+        self.current.surfaces += 1
+        return self.inner.copy(source)
+
+    def rect(self, target, color, rect, *args, **kw):
+        self.current.shapes += 1
+        return self.inner.rect(target, color, rect, *args, **kw)
+
+    def line(self, target, color, start, end, width=1):
+        self.current.shapes += 1
+        return self.inner.line(target, color, start, end, width)
+
+    def circle(self, target, color, center, radius):
+        self.current.shapes += 1
+        return self.inner.circle(target, color, center, radius)
+
+    def present(self):
+        self.current.presents += 1
+        self.frames.append(self.current)
+        self.current = FrameStats()
+        self.inner.present()
+
+    def composer(self) -> "RecordingRenderer":
+        # Draws through the inner composer, counting into this frame
+        composer = RecordingRenderer(self.inner.composer())
+        composer.current = self.current
+        return composer
+
+    def cache_miss(self):
+        self.current.misses += 1
+
+    def reset(self):
+        self.current = FrameStats()
+        self.frames.clear()
+
+
+_active: Renderer = PygameRenderer()
+
+
+def get_renderer() -> Renderer:
+    return _active
+
+
+def set_renderer(renderer: Renderer) -> Renderer:
+    """Make ``renderer`` the active backend and return the previous one."""
+    global _active
+    previous, _active = _active, renderer
+    return previous
+
+
+@contextmanager
+def use_renderer(renderer: Renderer) -> Iterator[Renderer]:
+    previous = set_renderer(renderer)
+    try:
+        yield renderer
+    finally:
+        set_renderer(previous)
+
+
+def composing() -> ContextManager[Renderer]:
+    """Activate the active renderer's composer, to build a cached artefact."""
+    return use_renderer(_active.composer())
@@ -0,0 +1,398 @@
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Callable, Iterator, List, Optional
+
+import pygame
+
+from deckdeep.card import Card
+from deckdeep.config import KEYBINDS
+from deckdeep.layout import get_layout
+from deckdeep.relic import Relic
+from deckdeep.render import (
+    render_card_selection,
+    render_keybinds,
+    render_node_selection,
+    render_relic_selection,
+    render_victory_state,
+)
+from deckdeep.render_cache import RenderCache, render_cache
+from deckdeep.renderer import get_renderer
+
+if TYPE_CHECKING:
+    from deckdeep.game import Game, VictorySequence
+
+
+class FrameScheduler:
+    """Paces frames for every screen. ``fps=None`` runs unthrottled (headless)."""
+
+    def __init__(self, fps: Optional[int] = 60):
+        self.fps = fps
+        self.clock = pygame.time.Clock()
+        self.frame_count = 0
+
+    def tick(self) -> int:
+        self.frame_count += 1
+        if self.fps is None:
+            return self.clock.tick()
+        return self.clock.tick(self.fps)
+
+    def now(self) -> int:
+        return pygame.time.get_ticks()
+
+
+# Called once per frame with the active screen name and the frame's work time in ms.
+InstrumentationHook = Callable[[str, float], None]
+
+
+class Screen:
+    """A non-blocking modal state. Screens never pump events or flip on their own
+    schedule; the ScreenManager feeds them one event/update/render step at a time."""
+
+    name = "screen"
+
+    def __init__(self, game: "Game"):
+        self.game = game
+        self.manager: Optional["ScreenManager"] = None
+
+    @property
+    def cache(self) -> RenderCache:
+        return self.manager.cache if self.manager else render_cache
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        pass
+
+    def update(self) -> None:
+        pass
+
+    def render(self, surface: pygame.Surface) -> None:
+        pass
+
+    def close(self) -> None:
+        if self.manager is not None:
+            self.manager.pop(self)
+
+
+class ScreenManager:
+    def __init__(
+        self,
+        scheduler: Optional[FrameScheduler] = None,
+        cache: Optional[RenderCache] = None,
+        instrumentation: Optional[InstrumentationHook] = None,
+    ):
+        self.stack: List[Screen] = []
+        self.scheduler = scheduler or FrameScheduler()
+        self.cache = cache if cache is not None else render_cache
+        self.instrumentation = instrumentation
+
+    def __bool__(self) -> bool:
+        return bool(self.stack)
+
+    def __len__(self) -> int:
+        return len(self.stack)
+
+    @property
+    def top(self) -> Optional[Screen]:
+        return self.stack[-1] if self.stack else None
+
+    def push(self, screen: Screen) -> Screen:
+        screen.manager = self
+        self.stack.append(screen)
+        return screen
+
+    def pop(self, screen: Optional[Screen] = None) -> Optional[Screen]:
+        if not self.stack:
+            return None
+        if screen is None:
+            screen = self.stack[-1]
+        if screen in self.stack:
+            self.stack.remove(screen)
+            screen.manager = None
+        return screen
+
+    def clear(self):
+        for screen in self.stack:
+            screen.manager = None
+        self.stack.clear()
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        if self.stack:
+            self.stack[-1].handle_event(event)
+
+    def update(self) -> None:
+        if self.stack:
+            self.stack[-1].update()
+
+    def render(self, surface: pygame.Surface) -> None:
+        if self.stack:
+            self.stack[-1].render(surface)
+
+    @contextmanager
+    def frame(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        yield
+        if self.instrumentation is not None:
+            self.instrumentation(name, (time.perf_counter() - start) * 1000)
+        self.scheduler.tick()
+
+
+def _selection_index(key: int, category: str) -> Optional[int]:
+    key_name = pygame.key.name(key).upper()
+    for keys in KEYBINDS[category]:
+        key_list = keys.split(", ")
+        if key_name in key_list:
+            return key_list.index(key_name)
+    return None
+
+
+class CombatIntroScreen(Screen):
+    name = "combat_intro"
+
+    def __init__(self, game: "Game", duration: int = 1000):
+        super().__init__(game)
+        self.duration = duration
+        self.start_time: Optional[int] = None
+        self.progress = 0.0
+
+    def update(self) -> None:
+        if self.manager is None:
+            return
+        now = self.manager.scheduler.now()
+        if self.start_time is None:
+            self.start_time = now
+        self.progress = min((now - self.start_time) / self.duration, 1.0)
+        if self.progress >= 1.0:
+            self.close()
+
+    def render(self, surface: pygame.Surface) -> None:
+        self.game.render_combat_with_animation(self.progress)
+
+
+class VictorySequenceScreen(Screen):
+    name = "victory_sequence"
+
+    def __init__(
+        self, game: "Game", sequence: "VictorySequence", on_done: Callable[[], None]
+    ):
+        super().__init__(game)
+        self.sequence = sequence
+        self.on_done = on_done
+        self.sequence.start()
+
+    def finish(self):
+        self.close()
+        self.on_done()
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        if event.type == pygame.KEYDOWN:
+            self.finish()
+
+    def update(self) -> None:
+        if self.manager is not None and not self.sequence.update():
+            self.finish()
+
+    def render(self, surface: pygame.Surface) -> None:
+        self.game.render()
+        self.sequence.render()
+        get_renderer().present()
+
+
+class CardRewardScreen(Screen):
+    name = "card_reward"
+
+    def __init__(
+        self,
+        game: "Game",
+        new_cards: List[Card],
+        on_done: Callable[[Optional[Card]], None],
+    ):
+        super().__init__(game)
+        self.new_cards = new_cards
+        self.on_done = on_done
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        if event.type != pygame.KEYDOWN:
+            return
+        index = _selection_index(event.key, "Victory Screen")
+        if index is None:
+            return
+        player = self.game.player
+        if index < len(self.new_cards):
+            chosen: Optional[Card] = self.new_cards[index]
+            self.game.logger.info(
+                f"Selected victory card: {self.new_cards[index].name}",
+                category="PLAYER",
+            )
+        else:
+            chosen = None
+            player.increase_max_health(player.health_gain_on_skip)
+            self.game.logger.info(
+                f"Skipped card selection, increased max health by {player.health_gain_on_skip}",
+                category="PLAYER",
+            )
+        self.close()
+        self.on_done(chosen)
+
+    def render(self, surface: pygame.Surface) -> None:
+        render_victory_state(
+            surface,
+            self.game.score,
+            self.new_cards,
+            -1,
+            self.game.assets,
+            player=self.game.player,
+        )
+
+
+class RelicSelectionScreen(Screen):
+    name = "relic_selection"
+
+    def __init__(
+        self,
+        game: "Game",
+        new_relics: List[Relic],
+        on_done: Callable[[Optional[Relic]], None],
+    ):
+        super().__init__(game)
+        self.new_relics = new_relics
+        self.on_done = on_done
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        if event.type != pygame.KEYDOWN:
+            return
+        index = _selection_index(event.key, "Relic Selection")
+        if index is None or index > len(self.new_relics):
+            return
+        player = self.game.player
+        if index < len(self.new_relics):
+            chosen: Optional[Relic] = self.new_relics[index]
+            self.game.logger.info(
+                f"Selected relic: {self.new_relics[index].name}", category="PLAYER"
+            )
+        else:
+            chosen = None
+            player.increase_max_health(player.health_gain_on_skip)
+            self.game.logger.info(
+                f"Skipped relic selection, increased max health by {player.health_gain_on_skip}",
+                category="PLAYER",
+            )
+        self.close()
+        self.on_done(chosen)
+
+    def render(self, surface: pygame.Surface) -> None:
+        render_relic_selection(surface, self.new_relics, -1, self.game.assets)
+
+
+class NodeSelectionScreen(Screen):
+    name = "node_selection"
+
+    def __init__(self, game: "Game", on_done: Callable[[int], None]):
+        super().__init__(game)
+        self.on_done = on_done
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        if event.type != pygame.KEYDOWN or self.game.current_node is None:
+            return
+        index = _selection_index(event.key, "Node Selection")
+        if index is not None and index < len(self.game.current_node.children):
+            self.game.logger.info(f"Selected node {index}", category="PLAYER")
+            self.close()
+            self.on_done(index)
+
+    def render(self, surface: pygame.Surface) -> None:
+        if self.game.current_node is not None:
+            render_node_selection(
+                surface, self.game.current_node.children, -1, self.game.assets
+            )
+
+
+class CardSelectionScreen(Screen):
+    """Pick one card from ``cards``; ``on_done`` receives its index in ``cards`` or None."""
+
+    name = "card_selection"
+
+    def __init__(
+        self,
+        game: "Game",
+        cards: List[Card],
+        on_done: Callable[[Optional[int]], None],
+    ):
+        super().__init__(game)
+        # Displayed sorted by cost then name; keep the mapping back to the caller's order
+        self.order = sorted(
+            range(len(cards)),
+            key=lambda i: (cards[i].energy_cost.value, cards[i].name),
+        )
+        self.display_cards = [cards[i] for i in self.order]
+        self.selected_index = 0
+        self.on_done = on_done
+
+    def finish(self, display_index: Optional[int]):
+        self.close()
+        self.on_done(None if display_index is None else self.order[display_index])
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        if event.type != pygame.KEYDOWN:
+            return
+        if event.key == pygame.K_ESCAPE:
+            self.finish(None)
+        elif event.key == pygame.K_k:
+            self.selected_index = max(0, self.selected_index - 1)
+        elif event.key == pygame.K_j:
+            self.selected_index = min(
+                len(self.display_cards) - 1, self.selected_index + 1
+            )
+        elif event.key == pygame.K_SPACE and self.display_cards:
+            self.finish(self.selected_index)
+
+    def render(self, surface: pygame.Surface) -> None:
+        render_card_selection(
+            surface,
+            self.display_cards,
+            self.selected_index,
+            self.game.assets,
+            self.game.player,
+        )
+
+
+class KeybindsScreen(Screen):
+    name = "keybinds"
+
+    def __init__(self, game: "Game"):
+        super().__init__(game)
+        self.drawn_mode: Optional[int] = None
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            self.close()
+
+    def render(self, surface: pygame.Surface) -> None:
+        # Static content: draw once and leave it on the display until closed,
+        # or until a display mode switch clears the window
+        mode = len(self.game.display.switch_times)
+        if self.drawn_mode != mode:
+            render_keybinds(surface, self.game.assets)
+            self.drawn_mode = mode
+
+
+class GameOverScreen(Screen):
+    name = "game_over"
+
+    def __init__(self, game: "Game", on_done: Callable[[], None]):
+        super().__init__(game)
+        self.on_done = on_done
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN:
+            self.close()
+            self.on_done()
+
+    def render(self, surface: pygame.Surface) -> None:
+        r = get_renderer()
+        layout = get_layout()
+        size = (layout.width, layout.height)
+        image = self.cache.get(
+            ("game_over", *size),
+            lambda: pygame.transform.scale(self.game.assets.game_over_image, size),
+        )
+        r.blit(surface, image, (0, 0))
+        r.present()
@@ -0,0 +1,180 @@
+import contextlib
+import io
+import random
+from typing import Callable, Iterator, List, NamedTuple, Optional
+
+from deckdeep.card import Card
+from deckdeep.monster import Monster
+from deckdeep.monster_group import MonsterGroup
+from deckdeep.player import Player
+from deckdeep.relic import TriggerWhen
+from deckdeep.status_effect import TriggerType
+
+# Picks the next card to play (and may retarget the group), or None to end the turn
+Policy = Callable[[Player, MonsterGroup], Optional[Card]]
+
+MAX_TURNS = 30
+MAX_PLAYS_PER_TURN = 30
+
+
+class CombatResult(NamedTuple):
+    won: bool
+    turns: int
+    damage_taken: int
+    damage_dealt: int
+    player_health: int
+    monster_health: int
+
+
+@contextlib.contextmanager
+def seeded(seed: int) -> Iterator[None]:
+    """Run with the global ``random`` module seeded, restoring its state afterwards."""
+    state = random.getstate()
+    random.seed(seed)
+    try:
+        yield
+    finally:
+        random.setstate(state)
+
+
+@contextlib.contextmanager
+def quiet() -> Iterator[None]:
+    """Swallow the DEBUG prints combat code emits on every action."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        yield
+
+
+def card_value(card: Card, player: Player) -> float:
+    """Rough per-energy value of playing ``card`` now."""
+    value = (
+        card.calculate_total_damage(player.bonus_damage, player.strength)
+        + card.shield
+        + min(card.healing, player.max_health.value - player.health.value)
+        + 2 * (card.bleed + card.burn + card.weakness)
+        + 3 * (card.card_draw + card.energy_bonus)
+        + card.bonus_damage
+        + card.bolster
+        + card.health_regain
+        - card.health_cost
+    )
+    return value / max(card.energy_cost.value, 0.5)
+
+
+def greedy_policy(player: Player, monster_group: MonsterGroup) -> Optional[Card]:
+    """Focus the weakest monster and play the best-value affordable card."""
+    alive = monster_group.alive_monsters
+    if not alive:
+        return None
+    weakest = min(alive, key=lambda m: m.health.value + m.shields)
+    monster_group.selected_index = alive.index(weakest)
+    playable = [card for card in player.hand if player.can_play_card(card)]
+    if not playable:
+        return None
+    best = max(playable, key=lambda card: card_value(card, player))
+    return best if card_value(best, player) > 0 else None
+
+
+def reference_player(level: int) -> Player:
+    """A player with the rewards a run would typically have collected by ``level``."""
+    player = Player.create("Hero", 100, "@")
+    for lvl in range(1, level):
+        player.increase_max_energy(1, lvl)
+        player.add_card_to_deck(Card.generate_card_pool(1)[0])
+    player.energy = player.max_energy
+    return player
+
+
+def _monsters_alive(monster_group: MonsterGroup) -> bool:
+    monster_group.remove_dead_monsters()
+    return bool(monster_group.monsters)
+
+
+def simulate_combat(
+    player: Player,
+    monster_group: MonsterGroup,
+    policy: Policy = greedy_policy,
+    max_turns: int = MAX_TURNS,
+    start_of_combat: bool = True,
+) -> CombatResult:
+    """Fight ``monster_group`` to the end without rendering or animations.
+
+    Follows the same turn order as Game.update_combat. Player and monsters are
+    mutated in place. Pass ``start_of_combat=False`` to continue a combat already
+    in progress (e.g. a fork of a snapshot) from the player's turn.
+    """
+    start_health = player.health.value
+    start_monster_health = sum(m.health.value for m in monster_group.monsters)
+
+    with quiet():
+        if start_of_combat:
+            player.apply_relic_effects(TriggerWhen.START_OF_COMBAT)
+            player.reset_hand()
+            monster_group.decide_action(player)
+
+        turns = 0
+        won = False
+        while turns < max_turns:
+            turns += 1
+            for _ in range(MAX_PLAYS_PER_TURN):
+                card = policy(player, monster_group)
+                if card is None:
+                    break
+                player.play_card(card, monster_group)
+            if not _monsters_alive(monster_group):
+                won = True
+                break
+
+            player.apply_relic_effects(TriggerWhen.END_OF_TURN)
+            for monster in monster_group.monsters:
+                monster.status_effects.trigger_effects(TriggerType.TURN_START, monster)
+            if not _monsters_alive(monster_group):
+                won = True
+                break
+            for monster in monster_group.monsters:
+                monster.execute_action(player)
+            monster_group.decide_action(player)
+
+            player.apply_relic_effects(TriggerWhen.ON_DAMAGE_TAKEN)
+            player.end_turn()
+            player.status_effects.trigger_effects(TriggerType.TURN_START, player)
+            player.apply_relic_effects(TriggerWhen.START_OF_TURN)
+
+            if player.health.value <= 0:
+                player.apply_relic_effects(TriggerWhen.ON_DEATH)
+                if player.health.value <= 0:
+                    break
+
+    remaining = sum(max(m.health.value, 0) for m in monster_group.monsters)
+    return CombatResult(
+        won=won,
+        turns=turns,
+        damage_taken=max(start_health - player.health.value, 0),
+        damage_dealt=start_monster_health - remaining,
+        player_health=player.health.value,
+        monster_health=start_monster_health,
+    )
+
+
+def simulate_encounters(
+    level: int,
+    runs: int,
+    seed: int = 0,
+    monsters: Optional[Callable[[int], List[Monster]]] = None,
+    policy: Policy = greedy_policy,
+) -> List[CombatResult]:
+    """Fight ``runs`` fresh encounters at ``level`` against a reference player.
+
+    ``monsters`` builds the opponents for a level; by default a regular
+    MonsterGroup is generated. Every run is seeded from ``seed`` so results are
+    reproducible.
+    """
+    results = []
+    for run in range(runs):
+        with seeded(hash((seed, level, run))), quiet():
+            player = reference_player(level)
+            if monsters is None:
+                group, _, _ = MonsterGroup.generate(level)
+            else:
+                group = MonsterGroup(monsters(level))
+            results.append(simulate_combat(player, group, policy))
+    return results
@@ -0,0 +1,331 @@
+import copy
+import hashlib
+from array import array
+from collections import deque
+from dataclasses import dataclass, field
+from typing import (
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+from deckdeep.card import Card
+from deckdeep.custom_types import Energy, Health
+from deckdeep.deck_index import DeckIndex
+from deckdeep.monster import Monster
+from deckdeep.monster_group import MonsterGroup
+from deckdeep.player import Player
+from deckdeep.status_effect import (
+    EFFECT_TYPES,
+    StatusEffect,
+    StatusEffectManager,
+    create_effect,
+)
+
+# Effects are stored as (index into EFFECT_NAMES, value) pairs
+EFFECT_NAMES: Tuple[str, ...] = tuple(EFFECT_TYPES)
+_EFFECT_INDEX: Dict[str, int] = {name: i for i, name in enumerate(EFFECT_NAMES)}
+
+Effects = Tuple[Tuple[int, int], ...]
+
+
+def _pack_effects(manager: StatusEffectManager) -> Effects:
+    return tuple((_EFFECT_INDEX[e.name], e.value) for e in manager.effects)
+
+
+def _unpack_effects(effects: Effects) -> List[StatusEffect]:
+    return [create_effect(EFFECT_NAMES[index], value) for index, value in effects]
+
+
+T = TypeVar("T")
+
+
+def _share(value: T, previous: Optional[T]) -> T:
+    # Reuse the previous snapshot's object when nothing changed, so a history of
+    # snapshots only pays for the parts that actually differ
+    return previous if previous is not None and previous == value else value
+
+
+def _pile(
+    cards: Iterable[Card], previous: Optional[Tuple[int, ...]]
+) -> Tuple[int, ...]:
+    return _share(tuple(card.definition_id for card in cards), previous)
+
+
+@dataclass(frozen=True)
+class PlayerSnapshot:
+    health: int
+    max_health: int
+    shield: int
+    bonus_damage: int
+    energy: int
+    max_energy: int
+    bonus_energy: int
+    strength: int
+    phoenix_feather_active: bool
+    is_dying: bool
+    deck: Tuple[int, ...]
+    hand: Tuple[int, ...]
+    discard_pile: Tuple[int, ...]
+    effects: Effects
+
+
+@dataclass(frozen=True)
+class MonsterSnapshot:
+    health: int
+    max_health: int
+    damage: int
+    spell_power: int
+    shields: int
+    is_dying: bool
+    intention: int  # index into monster_type.abilities, -1 for none
+    effects: Effects
+
+
+@dataclass(frozen=True)
+class CombatSnapshot:
+    """Immutable copy of everything combat can change, made of ints and tuples.
+
+    Cards are stored as definition ids and effects as (type, value) pairs, so a
+    snapshot is cheap to create, compare and hash. The Monster objects it was taken
+    from are kept by reference (outside equality and hashing) so ``restore`` can
+    bring the same instances back.
+    """
+
+    player: PlayerSnapshot
+    monsters: Tuple[MonsterSnapshot, ...]
+    selected_index: int
+    monster_refs: Tuple[Monster, ...] = field(compare=False, repr=False)
+
+    @classmethod
+    def capture(
+        cls,
+        player: Player,
+        monster_group: MonsterGroup,
+        previous: Optional["CombatSnapshot"] = None,
+    ) -> "CombatSnapshot":
+        """Snapshot the combat. Parts equal to ``previous`` are shared with it."""
+        before = previous.player if previous is not None else None
+        player_snapshot = PlayerSnapshot(
+            player.health.value,
+            player.max_health.value,
+            player.shield,
+            player.bonus_damage,
+            player.energy.value,
+            player.max_energy.value,
+            player.bonus_energy,
+            player.strength,
+            player.phoenix_feather_active,
+            player.is_dying,
+            _pile(player.deck, before.deck if before else None),
+            _pile(player.hand, before.hand if before else None),
+            _pile(player.discard_pile, before.discard_pile if before else None),
+            _share(
+                _pack_effects(player.status_effects),
+                before.effects if before else None,
+            ),
+        )
+        monsters_before: Sequence[Optional[MonsterSnapshot]] = (
+            previous.monsters if previous is not None else ()
+        )
+        monsters = tuple(
+            _share(
+                _capture_monster(m),
+                monsters_before[i] if i < len(monsters_before) else None,
+            )
+            for i, m in enumerate(monster_group.monsters)
+        )
+        return cls(
+            _share(player_snapshot, before),
+            _share(monsters, previous.monsters if previous is not None else None),
+            monster_group.selected_index,
+            tuple(monster_group.monsters),
+        )
+
+    def digest(self) -> str:
+        """Hash that is stable across processes, e.g. for on-disk caches."""
+        values = array("q")
+        p = self.player
+        values.extend(
+            (
+                p.health,
+                p.max_health,
+                p.shield,
+                p.bonus_damage,
+                p.energy,
+                p.max_energy,
+                p.bonus_energy,
+                p.strength,
+                p.phoenix_feather_active,
+                p.is_dying,
+                self.selected_index,
+            )
+        )
+        for pile in (p.deck, p.hand, p.discard_pile):
+            values.append(len(pile))
+            values.extend(pile)
+        sections = [p.effects] + [m.effects for m in self.monsters]
+        for m in self.monsters:
+            values.extend(
+                (
+                    m.health,
+                    m.max_health,
+                    m.damage,
+                    m.spell_power,
+                    m.shields,
+                    m.is_dying,
+                    m.intention,
+                )
+            )
+        for effects in sections:
+            values.append(len(effects))
+            for index, value in effects:
+                values.extend((index, value))
+        return hashlib.blake2b(values.tobytes(), digest_size=16).hexdigest()
+
+    def restore(self, player: Player, monster_group: MonsterGroup):
+        """Put ``player`` and ``monster_group`` back into this snapshot's state.
+
+        Existing Card objects are redistributed between the piles by definition, so
+        cards keep their identity; a card that left the deck since is recreated.
+        """
+        self._restore(player, monster_group, self.monster_refs)
+
+    def fork(self, player: Player) -> Tuple[Player, MonsterGroup]:
+        """Independent copies of the player and monsters in this snapshot's state.
+
+        ``player`` supplies everything the snapshot does not cover (relics, hand
+        limit, dodge chance, ...). The live objects are left untouched.
+        """
+        clone = copy.copy(player)
+        clone.deck, clone.hand, clone.discard_pile = [], [], []
+        clone.relics = list(player.relics)
+        clone._deck_index = DeckIndex()
+        clone.applied_permanent_effects = {
+            name: set(relic_ids)
+            for name, relic_ids in player.applied_permanent_effects.items()
+        }
+        clone.status_effects = StatusEffectManager()
+        monsters = []
+        for ref in self.monster_refs:
+            monster = copy.copy(ref)
+            monster.status_effects = StatusEffectManager()
+            monsters.append(monster)
+        group = MonsterGroup()
+        self._restore(clone, group, monsters)
+        return clone, group
+
+    def _restore(
+        self, player: Player, monster_group: MonsterGroup, monsters: Sequence[Monster]
+    ):
+        p = self.player
+        player.health = Health(p.health)
+        player.max_health = Health(p.max_health)
+        player.shield = p.shield
+        player.bonus_damage = p.bonus_damage
+        player.energy = Energy(p.energy)
+        player.max_energy = Energy(p.max_energy)
+        player.bonus_energy = p.bonus_energy
+        player.strength = p.strength
+        player.phoenix_feather_active = p.phoenix_feather_active
+        player.is_dying = p.is_dying
+        player.status_effects.effects = _unpack_effects(p.effects)
+
+        by_definition: Dict[int, List[Card]] = {}
+        for card in player.deck + player.hand + player.discard_pile:
+            by_definition.setdefault(card.definition_id, []).append(card)
+
+        def take(definition_id: int) -> Card:
+            cards = by_definition.get(definition_id)
+            return cards.pop() if cards else Card.from_definition(definition_id)
+
+        player.deck = [take(d) for d in p.deck]
+        player.hand = [take(d) for d in p.hand]
+        player.discard_pile = [take(d) for d in p.discard_pile]
+
+        for monster, m in zip(monsters, self.monsters):
+            _restore_monster(monster, m)
+        monster_group.monsters = list(monsters)
+        monster_group.selected_index = self.selected_index
+
+
+class Checkpoint(NamedTuple):
+    label: str
+    combat: CombatSnapshot
+    score: int
+
+
+class RewindBuffer:
+    """Bounded ring buffer of combat checkpoints; the oldest drop off once full.
+
+    Consecutive snapshots share unchanged piles, monsters and effect stacks, so
+    the buffer's memory stays bounded by ``capacity`` times the size of a change.
+    """
+
+    def __init__(self, capacity: int = 64):
+        self.entries: Deque[Checkpoint] = deque(maxlen=capacity)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    @property
+    def latest(self) -> Optional[Checkpoint]:
+        return self.entries[-1] if self.entries else None
+
+    def record(
+        self, label: str, player: Player, monster_group: MonsterGroup, score: int
+    ) -> Checkpoint:
+        latest = self.latest
+        checkpoint = Checkpoint(
+            label,
+            CombatSnapshot.capture(
+                player, monster_group, latest.combat if latest else None
+            ),
+            score,
+        )
+        self.entries.append(checkpoint)
+        return checkpoint
+
+    def pop(self) -> Optional[Checkpoint]:
+        return self.entries.pop() if self.entries else None
+
+    def clear(self):
+        self.entries.clear()
+
+
+def _capture_monster(monster: Monster) -> MonsterSnapshot:
+    intention = -1
+    if monster.intention is not None and monster.monster_type is not None:
+        intention = monster.monster_type.abilities.index(monster.intention)
+    return MonsterSnapshot(
+        monster.health.value,
+        monster.max_health.value,
+        monster.damage,
+        monster.spell_power,
+        monster.shields,
+        monster.is_dying,
+        intention,
+        _pack_effects(monster.status_effects),
+    )
+
+
+def _restore_monster(monster: Monster, m: MonsterSnapshot):
+    monster.health = Health(m.health)
+    monster.max_health = Health(m.max_health)
+    monster.damage = m.damage
+    monster.spell_power = m.spell_power
+    monster.shields = m.shields
+    monster.is_dying = m.is_dying
+    if m.intention >= 0 and monster.monster_type is not None:
+        monster.intention = monster.monster_type.abilities[m.intention]
+        monster.intention_icon_types = monster.intention.icon_types
+    else:
+        monster.intention = None
+        monster.intention_icon_types = []
+    monster.status_effects.effects = _unpack_effects(m.effects)
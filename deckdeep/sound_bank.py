@@ -0,0 +1,143 @@
+import os
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+import numpy as np
+import pygame
+
+from deckdeep.music_manager import MUSIC_CHANNELS
+
+SOUND_EXTENSIONS = (".ogg", ".wav")
+
+
+class Effect(NamedTuple):
+    priority: int  # a busy pool drops a voice of lower or equal priority
+    throttle_ms: int  # repeats within this window are dropped
+    volume: float = 1.0
+
+
+# Effects the game triggers. Each is loaded from <name>.ogg/.wav in the sound
+# directory, or synthesized when there is no such file.
+EFFECTS: Dict[str, Effect] = {
+    "card": Effect(priority=1, throttle_ms=40, volume=0.4),
+    "hit": Effect(priority=2, throttle_ms=80, volume=0.6),
+    "block": Effect(priority=2, throttle_ms=80, volume=0.5),
+    "heal": Effect(priority=3, throttle_ms=150, volume=0.5),
+}
+
+
+def _envelope(seconds: float, rate: int, decay: float) -> np.ndarray:
+    t = np.arange(int(seconds * rate)) / rate
+    return np.exp(-t * decay)
+
+
+def _noise(seconds: float, rate: int, decay: float) -> np.ndarray:
+    rng = np.random.default_rng(0)
+    return rng.uniform(-1, 1, int(seconds * rate)) * _envelope(seconds, rate, decay)
+
+
+def _tone(seconds: float, rate: int, start_hz: float, end_hz: float) -> np.ndarray:
+    t = np.arange(int(seconds * rate)) / rate
+    hz = np.linspace(start_hz, end_hz, len(t))
+    phase = 2 * np.pi * np.cumsum(hz) / rate
+    return np.sin(phase) * _envelope(seconds, rate, 8)
+
+
+SYNTHESIZERS: Dict[str, Callable[[int], np.ndarray]] = {
+    "card": lambda rate: _noise(0.06, rate, 60) * 0.5,
+    "hit": lambda rate: _noise(0.12, rate, 30),
+    "block": lambda rate: np.sign(_tone(0.15, rate, 220, 180))
+    * _envelope(0.15, rate, 25),
+    "heal": lambda rate: _tone(0.3, rate, 440, 880),
+}
+
+
+def synthesize(name: str) -> Optional[pygame.mixer.Sound]:
+    """A built-in placeholder for ``name`` in the mixer's sample format, or None
+    if there is none or the format is not signed 16-bit."""
+    rate, size, channels = pygame.mixer.get_init()
+    if name not in SYNTHESIZERS or size != -16:
+        return None
+    wave = (SYNTHESIZERS[name](rate) * 32767).astype(np.int16)
+    samples = np.repeat(wave[:, None], channels, axis=1) if channels > 1 else wave
+    return pygame.sndarray.make_sound(np.ascontiguousarray(samples))
+
+
+class SoundBank:
+    """Short sound effects, decoded once and mixed through a fixed channel pool.
+
+    Every effect in EFFECTS is loaded (or synthesized) when the bank is built,
+    so ``play`` never touches the disk or allocates a sound. The pool is
+    ``channels`` mixer channels after the ones reserved for music. When all of
+    them are busy, the lowest-priority voice (the oldest among equals) is
+    stolen if it does not outrank the new effect; otherwise the new effect is
+    dropped. An effect retriggered within its throttle window is dropped too, so
+    an AOE or multi-hit card plays one hit rather than a stack of them.
+
+    Without an initialized mixer the bank is empty and ``play`` does nothing.
+    """
+
+    def __init__(self, sound_directory: str, channels: int = 8):
+        self.sounds: Dict[str, pygame.mixer.Sound] = {}
+        self.channels: List[pygame.mixer.Channel] = []
+        if not pygame.mixer.get_init():
+            return
+        for name, effect in EFFECTS.items():
+            sound = self._load(sound_directory, name)
+            if sound is not None:
+                sound.set_volume(effect.volume)
+                self.sounds[name] = sound
+
+        first = MUSIC_CHANNELS
+        if pygame.mixer.get_num_channels() < first + channels:
+            pygame.mixer.set_num_channels(first + channels)
+        self.channels = [pygame.mixer.Channel(first + i) for i in range(channels)]
+        self._priorities = [0] * channels  # of the voice on each channel
+        self._started = [0] * channels  # pygame ticks
+        self._last_played = dict.fromkeys(EFFECTS, -(2**31))
+
+    @staticmethod
+    def _load(sound_directory: str, name: str) -> Optional[pygame.mixer.Sound]:
+        for extension in SOUND_EXTENSIONS:
+            path = os.path.join(sound_directory, name + extension)
+            if os.path.exists(path):
+                try:
+                    return pygame.mixer.Sound(path)
+                except pygame.error:
+                    print(f"Unable to load sound: {path}")
+        return synthesize(name)
+
+    def play(self, name: str) -> bool:
+        """Start effect ``name``; False if it was throttled, dropped or unknown."""
+        sound = self.sounds.get(name)
+        if sound is None:
+            return False
+        effect = EFFECTS[name]
+        now = pygame.time.get_ticks()
+        if now - self._last_played[name] < effect.throttle_ms:
+            return False
+
+        index = -1
+        for i, channel in enumerate(self.channels):
+            if not channel.get_busy():
+                index = i
+                break
+            priority = self._priorities[i]
+            if (
+                index < 0
+                or priority < self._priorities[index]
+                or (
+                    priority == self._priorities[index]
+                    and self._started[i] < self._started[index]
+                )
+            ):
+                index = i
+        if self.channels[index].get_busy():
+            if self._priorities[index] > effect.priority:
+                return False
+            self.channels[index].stop()
+
+        self.channels[index].play(sound)
+        self._priorities[index] = effect.priority
+        self._started[index] = now
+        self._last_played[name] = now
+        return True
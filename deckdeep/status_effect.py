@@ -1,4 +1,4 @@
-from typing import Dict, Any, List
+from typing import Callable, Dict, Any, List
 from enum import Enum
 
 
@@ -116,6 +116,20 @@ class Burn(StatusEffect):
                 self.diminish()
 
 
+# Concrete effect classes by StatusEffect.name, for rebuilding effects from saved data
+EFFECT_TYPES: Dict[str, Callable[[int], StatusEffect]] = {
+    effect_type.__name__: effect_type
+    for effect_type in (Bleed, HealthRegain, EnergyBonus, Weakness, Bolster, Burn)
+}
+
+
+def create_effect(name: str, value: int) -> StatusEffect:
+    effect_type = EFFECT_TYPES.get(name)
+    if effect_type is None:
+        raise ValueError(f"Unknown status effect: {name}")
+    return effect_type(value)
+
+
 class StatusEffectManager:
     def __init__(self):
         self.effects: List[StatusEffect] = []
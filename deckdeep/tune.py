@@ -1,5 +1,29 @@
+import hashlib
+import json
 import math
-import plotly.graph_objects as go
+import os
+import sys
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from deckdeep.monster import Monster, MonsterType, level_baseline
+from deckdeep.monster_group import MonsterGroup, encounter_composer
+from deckdeep.simulation import CombatResult, simulate_encounters
+
+# Bump when simulation rules change so cached results are not reused
+SIM_VERSION = 2
+CACHE_PATH = "tune_cache.json"
+
+TUNE_LEVELS = (3, 10, 25)
+RUNS = 24
+MULT_FIELDS = ("health_mult", "damage_mult", "spell_power_mult")
+
+# Every type, fought alone, should last this many player turns...
+DUEL_TURNS = 3.0
+# ...and deal its share of an encounter of this many monsters
+EXPECTED_GROUP_SIZE = 2.5
 
 
 def calculate_baseline_monster_power(level):
@@ -23,11 +47,33 @@ def calculate_baseline_monster_power(level):
     return base_survivability * ability_power
 
 
+def sample_monster_type_power(
+    monster_type: MonsterType, levels, samples: int = 1000, seed: int = 0
+) -> np.ndarray:
+    """Mean power rating of ``samples`` stat rolls per level, scored in one batch."""
+    rng = np.random.default_rng(seed)
+    base = np.array([level_baseline(level) for level in levels])  # (levels, 3)
+    mults = np.array(
+        [
+            monster_type.health_mult,
+            monster_type.damage_mult,
+            monster_type.spell_power_mult,
+        ]
+    )
+    rolls = np.rint(
+        base[:, None, :] * mults * rng.uniform(0.9, 1.1, (len(levels), samples, 3))
+    )
+    powers = monster_type.power_rating(rolls[..., 0], rolls[..., 1], rolls[..., 2])
+    return powers.mean(axis=1)
+
+
 def calculate_monster_group_power_limit(level):
     return math.log(level + 1, 3) * 100
 
 
 def plot_monster_power_scaling():
+    import plotly.graph_objects as go
+
     levels = list(range(1, 51))  # Plot for levels 1 to 50
 
     baseline_powers = [calculate_baseline_monster_power(level) for level in levels]
@@ -51,6 +97,17 @@ def plot_monster_power_scaling():
         )
     )
 
+    for monster_type in Monster.monster_types:
+        fig.add_trace(
+            go.Scatter(
+                x=levels,
+                y=sample_monster_type_power(monster_type, levels),
+                mode="lines",
+                line=dict(dash="dot"),
+                name=monster_type.name,
+            )
+        )
+
     fig.update_layout(
         title="Monster Power Scaling",
         xaxis_title="Level",
@@ -62,6 +119,282 @@ def plot_monster_power_scaling():
     fig.write_html("monster_power_scaling.html")
 
 
+def target_difficulty(level: int) -> float:
+    """Fraction of the reference player's health a regular encounter should cost."""
+    return min(0.15 + 0.04 * math.log2(level + 1), 0.5)
+
+
+def duel_targets(level: int) -> Tuple[float, float]:
+    """(turns to kill, player health lost per turn) for a 1v1 fight at ``level``."""
+    health_lost = target_difficulty(level) * 100 / EXPECTED_GROUP_SIZE
+    return DUEL_TURNS, health_lost / DUEL_TURNS
+
+
+class ResultCache:
+    """Simulation metrics on disk, keyed by a hash of everything that affects them,
+    so a rerun only resimulates monster types whose parameters changed."""
+
+    def __init__(self, path: str = CACHE_PATH):
+        self.path = path
+        self.entries: Dict[str, List[float]] = {}
+        self.misses = 0
+        if os.path.exists(path):
+            with open(path) as f:
+                self.entries = json.load(f)
+
+    @staticmethod
+    def key(*parts) -> str:
+        blob = json.dumps([SIM_VERSION, *parts], sort_keys=True, default=str)
+        return hashlib.sha1(blob.encode()).hexdigest()
+
+    def get(self, key: str, compute: Callable[[], List[float]]) -> List[float]:
+        if key not in self.entries:
+            self.misses += 1
+            self.entries[key] = compute()
+        return self.entries[key]
+
+    def save(self):
+        with open(self.path, "w") as f:
+            json.dump(self.entries, f)
+
+
+def type_params(monster_type: MonsterType) -> List:
+    return [
+        monster_type.name,
+        [round(getattr(monster_type, field), 4) for field in MULT_FIELDS],
+        [
+            (type(a).__name__, a.probability, a.num_attacks)
+            for a in monster_type.abilities
+        ],
+    ]
+
+
+@contextmanager
+def restored(monster_types: Sequence[MonsterType]) -> Iterator[None]:
+    """Undo any multiplier or group scaling changes made while fitting."""
+    saved = [[getattr(mt, field) for field in MULT_FIELDS] for mt in monster_types]
+    base_power = MonsterGroup.base_power
+    try:
+        yield
+    finally:
+        for mt, values in zip(monster_types, saved):
+            for field, value in zip(MULT_FIELDS, values):
+                setattr(mt, field, value)
+        MonsterGroup.base_power = base_power
+        encounter_composer.clear()
+
+
+def duel_metrics(results: List[CombatResult]) -> List[float]:
+    """[turns to kill, player health lost per turn] over a batch of 1v1 fights."""
+    turns = sum(r.turns for r in results)
+    # Extrapolate fights the player lost to the turn the monster would have died
+    kill_turns = [r.turns * r.monster_health / max(r.damage_dealt, 1) for r in results]
+    return [
+        sum(kill_turns) / len(kill_turns),
+        sum(r.damage_taken for r in results) / max(turns, 1),
+    ]
+
+
+def measure_type(
+    monster_type: MonsterType, level: int, runs: int, seed: int, cache: ResultCache
+) -> List[float]:
+    def compute():
+        return duel_metrics(
+            simulate_encounters(
+                level,
+                runs,
+                seed,
+                monsters=lambda lvl: [Monster.generate(lvl, monster_type=monster_type)],
+            )
+        )
+
+    return cache.get(
+        ResultCache.key("duel", type_params(monster_type), level, runs, seed), compute
+    )
+
+
+def _step(ratio: float, damping: float) -> float:
+    # Clamp so one noisy batch cannot swing a multiplier wildly
+    return min(max(ratio, 0.5), 2.0) ** damping
+
+
+def fit_monster_types(
+    monster_types: Sequence[MonsterType],
+    levels: Sequence[int] = TUNE_LEVELS,
+    runs: int = RUNS,
+    seed: int = 0,
+    iterations: int = 8,
+    tolerance: float = 0.1,
+    damping: float = 0.7,
+    cache: Optional[ResultCache] = None,
+) -> List[Dict]:
+    """Fit health/damage/spell power multipliers so every type meets the duel targets.
+
+    Health scales turns-to-kill; damage and spell power move together to keep each
+    type's damage/magic balance. Types are updated in place; returns per-iteration
+    convergence metrics.
+    """
+    cache = cache if cache is not None else ResultCache()
+    history = []
+    for iteration in range(1, iterations + 1):
+        misses = cache.misses
+        errors = []
+        for mt in monster_types:
+            health_ratios, damage_ratios = [], []
+            for level in levels:
+                kill_turns, damage_per_turn = measure_type(mt, level, runs, seed, cache)
+                target_turns, target_damage = duel_targets(level)
+                health_ratios.append(target_turns / max(kill_turns, 1e-6))
+                damage_ratios.append(target_damage / max(damage_per_turn, 1e-6))
+            health_ratio = math.exp(np.mean(np.log(health_ratios)))
+            damage_ratio = math.exp(np.mean(np.log(damage_ratios)))
+            error = max(abs(health_ratio - 1), abs(damage_ratio - 1))
+            errors.append(error)
+            if error > tolerance:
+                mt.health_mult *= _step(health_ratio, damping)
+                mt.damage_mult *= _step(damage_ratio, damping)
+                mt.spell_power_mult *= _step(damage_ratio, damping)
+        history.append(
+            {
+                "iteration": iteration,
+                "max_error": max(errors),
+                "mean_error": sum(errors) / len(errors),
+                "converged": sum(e <= tolerance for e in errors),
+                "resimulated": cache.misses - misses,
+            }
+        )
+        cache.save()
+        if max(errors) <= tolerance:
+            break
+    return history
+
+
+def measure_groups(
+    levels: Sequence[int], runs: int, seed: int, cache: ResultCache
+) -> List[float]:
+    """Mean fraction of the reference player's health lost per encounter, per level."""
+    key_types = [type_params(mt) for mt in Monster.monster_types]
+
+    def compute(level):
+        results = simulate_encounters(level, runs, seed)
+        return [sum(r.damage_taken for r in results) / (100 * len(results))]
+
+    return [
+        cache.get(
+            ResultCache.key(
+                "group", key_types, MonsterGroup.base_power, level, runs, seed
+            ),
+            lambda: compute(level),
+        )[0]
+        for level in levels
+    ]
+
+
+def fit_group_scaling(
+    levels: Sequence[int] = TUNE_LEVELS,
+    runs: int = RUNS,
+    seed: int = 0,
+    iterations: int = 8,
+    tolerance: float = 0.1,
+    damping: float = 0.7,
+    cache: Optional[ResultCache] = None,
+) -> List[Dict]:
+    """Fit MonsterGroup.base_power so encounters track ``target_difficulty``."""
+    cache = cache if cache is not None else ResultCache()
+    history = []
+    harder_than: Optional[float] = None
+    easier_than: Optional[float] = None
+    for iteration in range(1, iterations + 1):
+        misses = cache.misses
+        encounter_composer.clear()
+        measured = measure_groups(levels, runs, seed, cache)
+        ratios = [
+            target_difficulty(level) / max(m, 1e-6)
+            for level, m in zip(levels, measured)
+        ]
+        ratio = math.exp(np.mean(np.log(ratios)))
+        history.append(
+            {
+                "iteration": iteration,
+                "max_error": max(abs(r - 1) for r in ratios),
+                "mean_error": abs(ratio - 1),
+                "converged": int(abs(ratio - 1) <= tolerance),
+                "resimulated": cache.misses - misses,
+            }
+        )
+        cache.save()
+        if abs(ratio - 1) <= tolerance:
+            break
+        # Health lost grows steeply with group size, so once the target has been
+        # bracketed bisect (in log space) instead of stepping past it again
+        if ratio > 1:
+            harder_than = MonsterGroup.base_power
+        else:
+            easier_than = MonsterGroup.base_power
+        if harder_than is not None and easier_than is not None:
+            MonsterGroup.base_power = math.sqrt(harder_than * easier_than)
+        else:
+            MonsterGroup.base_power *= _step(ratio, damping)
+    return history
+
+
+def format_patch_table(rows: List[Tuple[str, str, float, float]]) -> str:
+    lines = [f"{'target':<16}{'field':<18}{'current':>9}{'suggested':>11}{'change':>9}"]
+    for target, field, current, suggested in rows:
+        change = (suggested / current - 1) * 100 if current else 0.0
+        lines.append(
+            f"{target:<16}{field:<18}{current:>9.2f}{suggested:>11.2f}{change:>+8.1f}%"
+        )
+    return "\n".join(lines)
+
+
+def format_history(title: str, history: List[Dict]) -> str:
+    lines = [title, "iter  max_err  mean_err  converged  resimulated"]
+    for h in history:
+        lines.append(
+            f"{h['iteration']:>4}  {h['max_error']:>7.3f}  {h['mean_error']:>8.3f}"
+            f"  {h['converged']:>9}  {h['resimulated']:>11}"
+        )
+    return "\n".join(lines)
+
+
+def tune(
+    levels: Sequence[int] = TUNE_LEVELS, runs: int = RUNS, seed: int = 0
+) -> Tuple[str, str]:
+    """Fit monster multipliers, then group scaling. Returns (patch table, metrics);
+    the live MonsterType/MonsterGroup values are left untouched."""
+    cache = ResultCache()
+    monster_types = Monster.monster_types
+    current = {mt.name: [getattr(mt, f) for f in MULT_FIELDS] for mt in monster_types}
+    current_base_power = MonsterGroup.base_power
+
+    with restored(monster_types):
+        type_history = fit_monster_types(monster_types, levels, runs, seed, cache=cache)
+        group_history = fit_group_scaling(levels, runs, seed, cache=cache)
+        rows = [
+            (mt.name, field, value, getattr(mt, field))
+            for mt in monster_types
+            for field, value in zip(MULT_FIELDS, current[mt.name])
+        ]
+        rows.append(
+            ("MonsterGroup", "base_power", current_base_power, MonsterGroup.base_power)
+        )
+
+    metrics = "\n\n".join(
+        [
+            format_history("Monster types", type_history),
+            format_history("Group scaling", group_history),
+        ]
+    )
+    return format_patch_table(rows), metrics
+
+
 if __name__ == "__main__":
-    plot_monster_power_scaling()
-    print("Plot saved as 'monster_power_scaling.html'")
+    if sys.argv[1:] == ["fit"]:
+        patch, metrics = tune()
+        print(patch)
+        print()
+        print(metrics)
+    else:
+        plot_monster_power_scaling()
+        print("Plot saved as 'monster_power_scaling.html'")
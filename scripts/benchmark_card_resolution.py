@@ -0,0 +1,62 @@
+"""Measure Player.play_card throughput with multi-hit cards against 5-monster groups.
+
+Usage: python scripts/benchmark_card_resolution.py [plays]
+"""
+
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from deckdeep.card import Card, Rarity  # noqa: E402
+from deckdeep.custom_types import Energy, Health  # noqa: E402
+from deckdeep.monster import Monster  # noqa: E402
+from deckdeep.monster_group import MonsterGroup  # noqa: E402
+from deckdeep.player import Player  # noqa: E402
+from deckdeep.simulation import quiet  # noqa: E402
+
+CARDS = [
+    Card(
+        "Blade Storm",
+        0,
+        Rarity.RARE,
+        damage=2,
+        num_attacks=4,
+        targets_all=True,
+        bleed=1,
+        burn=1,
+        bolster=1,
+    ),
+    Card("Flurry of Blows", 0, Rarity.COMMON, damage=2, num_attacks=3, weakness=1),
+    Card("Fireball", 0, Rarity.RARE, damage=12, burn=3, targets_all=True),
+]
+
+
+def benchmark(plays: int) -> None:
+    with quiet():
+        monsters = [Monster.generate(20, monster_type="goblin_1") for _ in range(5)]
+    for monster in monsters:
+        monster.max_health = monster.health = Health(10**9)
+    group = MonsterGroup(monsters)
+    player = Player.create("Hero", 100, "@")
+    player.energy = Energy(10**9)
+
+    for card in CARDS:
+        player.hand, player.discard_pile = [card], []
+        start = time.perf_counter()
+        for _ in range(plays):
+            player.play_card(card, group)
+            player.discard_pile.remove(card)
+            player.hand.append(card)
+        elapsed = time.perf_counter() - start
+        print(
+            f"{card.name:16} x{card.num_attacks} "
+            f"{'all' if card.targets_all else 'one'}: "
+            f"{elapsed / plays * 1e6:6.1f} us/play"
+        )
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    benchmark(int(args[0]) if args else 20_000)
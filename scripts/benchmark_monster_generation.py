@@ -0,0 +1,38 @@
+"""Measure MonsterGroup.generate throughput across levels 1-100.
+
+Usage: python scripts/benchmark_monster_generation.py [groups_per_level]
+"""
+
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from deckdeep.monster_group import MonsterGroup  # noqa: E402
+
+LEVELS = range(1, 101)
+
+
+def benchmark(groups_per_level: int) -> None:
+    total_groups = 0
+    total_monsters = 0
+    start = time.perf_counter()
+    for level in LEVELS:
+        level_start = time.perf_counter()
+        for _ in range(groups_per_level):
+            group, _, _ = MonsterGroup.generate(level)
+            total_monsters += len(group.monsters)
+        total_groups += groups_per_level
+        if level in (1, 10, 25, 50, 75, 100):
+            per_group = (time.perf_counter() - level_start) / groups_per_level
+            print(f"level {level:>3}: {per_group * 1e6:8.1f} us/group")
+    elapsed = time.perf_counter() - start
+    print(
+        f"{total_groups} groups ({total_monsters} monsters) in {elapsed:.2f}s: "
+        f"{total_groups / elapsed:,.0f} groups/s"
+    )
+
+
+if __name__ == "__main__":
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
@@ -0,0 +1,52 @@
+"""Measure ParticleSystem throughput (particles/ms) for update and render.
+
+Usage: python scripts/benchmark_particles.py [particles] [frames]
+"""
+
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import numpy as np  # noqa: E402
+import pygame  # noqa: E402
+from deckdeep.config import SCREEN_HEIGHT, SCREEN_WIDTH  # noqa: E402
+from deckdeep.particles import ParticleSystem  # noqa: E402
+
+
+def benchmark(count: int, frames: int) -> None:
+    np.random.seed(0)
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    particles = ParticleSystem(capacity=count)
+    colors = ((255, 215, 0), (255, 255, 255), (255, 165, 0))
+    particles.emit(
+        count, 0, 0, SCREEN_WIDTH, SCREEN_HEIGHT, lifetime=1e9, colors=colors
+    )
+    particles.render(screen)  # warm up the sprite cache
+
+    update = render = 0.0
+    for _ in range(frames):
+        start = time.perf_counter()
+        particles.update(1 / 60)
+        update += time.perf_counter() - start
+        start = time.perf_counter()
+        particles.render(screen)
+        render += time.perf_counter() - start
+
+    total = count * frames
+    print(f"{count} particles, {frames} frames")
+    print(f"  update: {total / (update * 1000):,.0f} particles/ms")
+    print(f"  render: {total / (render * 1000):,.0f} particles/ms")
+    print(f"  frame:  {(update + render) / frames * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    benchmark(
+        int(args[0]) if len(args) > 0 else 5000,
+        int(args[1]) if len(args) > 1 else 120,
+    )
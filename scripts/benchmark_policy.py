@@ -0,0 +1,55 @@
+"""Measure BeamSearchPolicy search throughput (nodes/s) on random hands.
+
+Usage: python scripts/benchmark_policy.py [decisions] [beam_width] [budget_ms]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from deckdeep.card import Card  # noqa: E402
+from deckdeep.custom_types import Energy  # noqa: E402
+from deckdeep.monster_group import MonsterGroup  # noqa: E402
+from deckdeep.player import Player  # noqa: E402
+from deckdeep.policy import BeamSearchPolicy  # noqa: E402
+from deckdeep.simulation import quiet  # noqa: E402
+
+
+def benchmark(decisions: int, beam_width: int, budget_ms: float) -> None:
+    random.seed(0)
+    policy = BeamSearchPolicy(beam_width=beam_width, time_budget=budget_ms / 1000)
+    nodes = 0
+    truncated = 0
+    elapsed = 0.0
+    with quiet():
+        for _ in range(decisions):
+            player = Player.create("Hero", 100, "@")
+            player.hand = Card.generate_card_pool(7)
+            player.energy = Energy(random.randint(3, 6))
+            group, _, _ = MonsterGroup.generate(random.randint(1, 50))
+            start = time.perf_counter()
+            result = policy.search(player, group.monsters)
+            elapsed += time.perf_counter() - start
+            nodes += result.nodes
+            truncated += not result.complete
+
+    print(f"{decisions} decisions, beam {beam_width}, budget {budget_ms:.1f} ms")
+    print(f"  {nodes / elapsed:,.0f} nodes/s, {nodes / decisions:.0f} nodes/decision")
+    print(f"  {elapsed / decisions * 1000:.2f} ms/decision, {truncated} hit the budget")
+    table = policy.table
+    print(
+        f"  transposition table: {len(table)}/{table.capacity} entries, "
+        f"{table.hits} hits, {table.misses} misses"
+    )
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    benchmark(
+        int(args[0]) if len(args) > 0 else 500,
+        int(args[1]) if len(args) > 1 else 8,
+        float(args[2]) if len(args) > 2 else 20.0,
+    )
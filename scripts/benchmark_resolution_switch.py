@@ -0,0 +1,63 @@
+"""Measure how long a runtime resolution switch takes: the mode change, layout
+and cache rebuild and asset rescale, then the first combat frame at the new size
+(which redraws every cached layer, card face and sprite).
+
+Usage: python scripts/benchmark_resolution_switch.py [rounds]
+"""
+
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame  # noqa: E402
+from deckdeep.assets import GameAssets  # noqa: E402
+from deckdeep.display import RESOLUTIONS, DisplayManager  # noqa: E402
+from deckdeep.monster import Monster  # noqa: E402
+from deckdeep.monster_group import MonsterGroup  # noqa: E402
+from deckdeep.player import Player  # noqa: E402
+from deckdeep.render import render_combat_state  # noqa: E402
+from deckdeep.simulation import quiet  # noqa: E402
+
+
+def benchmark(rounds: int) -> None:
+    random.seed(0)
+    pygame.init()
+    display = DisplayManager()
+    screen = display.set_mode()
+    display.assets = assets = GameAssets()
+    with quiet():
+        player = Player.create("Hero", 100, "@")
+        player.reset_hand()
+        group = MonsterGroup(
+            [Monster.generate(5, monster_type="goblin_1") for _ in range(5)]
+        )
+        group.decide_action(player)
+
+    def frame():
+        render_combat_state(screen, player, group, "1:1", 0, 0, assets)
+
+    frame()
+    display.switch_times.clear()
+    first_frames = []
+    for _ in range(rounds):
+        for _ in RESOLUTIONS:
+            screen = display.cycle_resolution()
+            start = time.perf_counter()
+            frame()
+            first_frames.append(time.perf_counter() - start)
+
+    switches = display.switch_times
+    print(f"{len(switches)} switches across {len(RESOLUTIONS)} resolutions")
+    print(f"  switch:      {statistics.median(switches) * 1000:.2f} ms median")
+    print(f"  first frame: {statistics.median(first_frames) * 1000:.2f} ms median")
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    benchmark(int(args[0]) if args else 5)
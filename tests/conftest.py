@@ -0,0 +1,10 @@
+import wave
+
+
+def write_silence(path, seconds: float = 1.0, rate: int = 22050):
+    """Write a mono 16-bit WAV file of silence to ``path``."""
+    with wave.open(str(path), "wb") as sound:
+        sound.setnchannels(1)
+        sound.setsampwidth(2)
+        sound.setframerate(rate)
+        sound.writeframes(b"\0\0" * int(seconds * rate))
@@ -0,0 +1,51 @@
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest  # noqa: E402
+from deckdeep.card import Card, Rarity  # noqa: E402
+from deckdeep.card_pile import CardPile  # noqa: E402
+from deckdeep.player import Player  # noqa: E402
+
+
+def make_cards(n):
+    return [Card(f"Card {i}", 1, Rarity.COMMON, damage=i) for i in range(n)]
+
+
+def test_pile_keeps_order_and_identity():
+    a, b, c = make_cards(3)
+    pile = CardPile([a, b, c])
+    assert list(pile) == [a, b, c]
+    assert pile[1] is b and pile[-1] is c
+    assert b in pile and make_cards(1)[0] not in pile
+
+    version = pile.version
+    pile.remove(b)
+    assert pile == [a, c]
+    assert pile.version > version
+    assert pile.pop() is c
+    with pytest.raises(ValueError):
+        pile.append(a)
+    with pytest.raises(ValueError):
+        pile.remove(b)
+
+
+def test_player_piles_accept_lists_and_find_cards():
+    player = Player.create("Hero", 100, "@")
+    cards = make_cards(4)
+    player.deck = cards[:2]
+    player.hand = cards[2:]
+    player.discard_pile = []
+    assert isinstance(player.hand, CardPile)
+    assert player.pile_of(cards[3]) is player.hand
+    assert player.pile_of(cards[0]) is player.deck
+
+    player.discard_pile.append(player.hand.pop(0))
+    assert player.pile_of(cards[2]) is player.discard_pile
+    assert player.deck + player.hand == [cards[0], cards[1], cards[3]]
+
+
+def test_card_pool_never_repeats_a_card_object():
+    pool = Card.generate_card_pool(200)
+    assert len({card.id for card in pool}) == 200
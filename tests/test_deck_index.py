@@ -0,0 +1,68 @@
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from deckdeep.card import Card, Rarity  # noqa: E402
+from deckdeep.monster import Monster  # noqa: E402
+from deckdeep.monster_group import MonsterGroup  # noqa: E402
+from deckdeep.player import Player  # noqa: E402
+
+
+def sort_key(card):
+    return card.energy_cost.value, card.name
+
+
+def test_index_tracks_the_full_deck_across_piles():
+    player = Player.create("Hero", 100, "@")
+    player.reset_hand()
+    full = player.deck + player.hand + player.discard_pile
+    view = player.get_sorted_full_deck()
+    assert sorted(map(id, view)) == sorted(map(id, full))
+    assert view == sorted(view, key=sort_key)
+
+    group = MonsterGroup([Monster.generate(1, monster_type="goblin_1")])
+    player.play_card(player.hand[0], group)
+    player.end_turn()
+    # Cards only moved between piles
+    assert player.get_sorted_full_deck() == view
+
+    removed = player.remove_card_from_deck(0)
+    assert removed is view[0]
+    assert len(player.deck_index) == len(full) - 1
+    assert removed not in player.deck + player.hand + player.discard_pile
+
+
+def test_stats_update_incrementally():
+    player = Player.create("Hero", 100, "@")
+    player.deck, player.hand, player.discard_pile = [], [], []
+    strike = Card("Strike", 1, Rarity.COMMON, damage=6)
+    player.add_card_to_deck(strike)
+    player.add_card_to_deck(Card("Insight", 0, Rarity.COMMON, card_draw=2))
+    player.add_card_to_deck(Card("Cursed Coin", 99, Rarity.UNCOMMON, health_cost=5))
+
+    stats = player.deck_index.stats()
+    assert stats.size == 3
+    assert stats.mana_curve == {0: 1, 1: 1}
+    assert stats.damage_per_energy == 6
+    assert stats.draw_density == 1
+    assert stats.curses == 1
+
+    player.remove_curses()
+    assert player.deck_index.stats().curses == 0
+    assert [card.name for card in player.deck_index.cards] == ["Insight", "Strike"]
+
+
+def test_reassigning_a_pile_rebuilds_the_index():
+    player = Player.create("Hero", 100, "@")
+    assert len(player.deck_index) == len(player.deck)
+    # Same number of cards, different cards
+    player.hand = [Card("Insight", 0, Rarity.COMMON, card_draw=2)]
+    player.deck = list(player.deck)[1:]
+    assert "Insight" in [card.name for card in player.deck_index.cards]
+    assert sorted(map(id, player.deck_index.cards)) == sorted(
+        map(id, player.deck + player.hand + player.discard_pile)
+    )
+
+    player.add_card_to_deck(Card("Strike", 1, Rarity.COMMON, damage=6))
+    assert len(player.deck_index) == len(player.deck) + 1
@@ -0,0 +1,49 @@
+import sys
+import os
+import pygame
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from deckdeep.assets import GameAssets  # noqa: E402
+from deckdeep.config import SCREEN_HEIGHT, SCREEN_WIDTH  # noqa: E402
+from deckdeep.display import RESOLUTIONS, DisplayManager  # noqa: E402
+from deckdeep.layout import get_layout  # noqa: E402
+from deckdeep.player import Player  # noqa: E402
+from deckdeep.render import render_card  # noqa: E402
+from deckdeep.render_cache import card_face_cache  # noqa: E402
+
+
+def test_resolution_switch_rescales_from_memory_and_drops_caches(monkeypatch):
+    pygame.init()
+    display = DisplayManager()
+    screen = display.set_mode()
+    assets = GameAssets()
+    display.assets = assets
+    card = Player.create("Hero", 100, "@").get_sorted_full_deck()[0]
+    render_card(screen, card, 0, 0, False, assets, 3, 3, 0, 0)
+    assert len(card_face_cache)
+
+    loads = []
+
+    def load(path):
+        loads.append(path)
+        raise pygame.error(f"{path} read from disk")
+
+    monkeypatch.setattr(pygame.image, "load", load)
+    try:
+        screen = display.set_mode((1200, 800))
+        layout = get_layout()
+        assert screen.get_size() == (layout.width, layout.height) == (1200, 800)
+        assert len(card_face_cache) == 0
+        assert assets.background_image.get_size() == (1200, 800)
+        assert assets.attack_icon.get_size() == (layout.icon_size,) * 2
+        assert assets.player.get_size() == (layout.unit_size,) * 2
+        # Only files that failed to load (and got a placeholder) are retried
+        assert not set(loads) & set(GameAssets._sources)
+
+        display.cycle_resolution()
+        assert display.size == RESOLUTIONS[1]
+        assert len(display.switch_times) == 3
+    finally:
+        display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    assert assets.background_image.get_size() == (SCREEN_WIDTH, SCREEN_HEIGHT)
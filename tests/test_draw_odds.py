@@ -0,0 +1,69 @@
+import sys
+import os
+import random
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from deckdeep.card import Card, Rarity  # noqa: E402
+from deckdeep.draw_odds import (  # noqa: E402
+    DrawOddsCache,
+    card_draw_odds,
+    next_turn_odds,
+)
+from deckdeep.player import Player  # noqa: E402
+from deckdeep.simulation import quiet  # noqa: E402
+
+
+def setup_player():
+    player = Player.create("Hero", 100, "@")
+    player.deck = [Card(name, 1, Rarity.COMMON, damage=1) for name in "ABC"]
+    player.hand = [Card("A", 1, Rarity.COMMON, damage=1), Card("D", 1, Rarity.COMMON)]
+    player.discard_pile = [Card("E", 1, Rarity.COMMON, shield=1)]
+    return player
+
+
+def test_next_turn_odds_include_the_reshuffle():
+    odds = next_turn_odds(setup_player())
+    assert odds.draws == 5 and odds.reshuffle
+    # The whole deck is drawn, then 2 of the 3 reshuffled cards
+    assert odds.cards["A"] == 1.0
+    assert abs(odds.cards["D"] - 2 / 3) < 1e-12
+    assert abs(odds.cards["E"] - 2 / 3) < 1e-12
+    assert abs(odds.classes["Defense"] - 2 / 3) < 1e-12
+
+
+def test_odds_match_the_real_draw():
+    random.seed(3)
+    hits = 0
+    runs = 3000
+    with quiet():
+        for _ in range(runs):
+            player = setup_player()
+            player.end_turn()
+            hits += any(card.name == "D" for card in player.hand)
+    assert abs(hits / runs - 2 / 3) < 0.03
+
+
+def test_card_draw_odds_for_the_selected_card():
+    player = setup_player()
+    player.hand_limit = 4
+    # Two draws would fit but the hand fills after one; nothing is reshuffled
+    scry = Card("Scry", 1, Rarity.COMMON, card_draw=3)
+    player.hand.append(scry)
+    odds = card_draw_odds(player, scry)
+    assert (odds.label, odds.draws, odds.reshuffle) == ("Scry", 1, False)
+    assert abs(odds.cards["B"] - 1 / 3) < 1e-12
+    assert odds.cards["E"] == 0.0
+
+    cache = DrawOddsCache()
+    assert cache.card_draw(player, scry) == odds
+    assert cache.card_draw(player, player.hand[0]).label == "Next turn"
+
+
+def test_cache_is_invalidated_by_pile_changes():
+    player = setup_player()
+    cache = DrawOddsCache()
+    first = cache.next_turn(player)
+    assert cache.next_turn(player) is first
+    player.discard_pile.append(player.hand.pop())
+    assert cache.next_turn(player) is not first
@@ -0,0 +1,60 @@
+import sys
+import os
+import random
+from collections import Counter
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest  # noqa: E402
+from deckdeep.encounter import EncounterComposer  # noqa: E402
+from deckdeep.monster import Monster  # noqa: E402
+from deckdeep.monster_group import MonsterGroup  # noqa: E402
+
+
+@pytest.fixture
+def composer():
+    return EncounterComposer(Monster.monster_types, max_monsters=5)
+
+
+@pytest.mark.parametrize("level", [1, 25, 100])
+def test_composition_fits_band(composer, level):
+    rng = random.Random(level)
+    target = 15 * (1 + level.bit_length())
+    for _ in range(50):
+        types = composer.compose(
+            level, target, target * 1.2, band_top=target * 1.5, rng=rng
+        )
+        assert 1 <= len(types) <= 5
+        power = sum(composer.expected_power(level, mt) for mt in types)
+        table = composer.table(level, target * 1.5)
+        # Each type's power is rounded to one bucket, so allow that much slack
+        slack = table.step * len(types) / 2
+        assert target - slack <= power <= target * 1.2 + slack
+
+
+def test_unreachable_band_falls_back_to_closest(composer):
+    weakest = min(Monster.monster_types, key=lambda mt: composer.expected_power(1, mt))
+    types = composer.compose(1, 0.001, 0.002, rng=random.Random(0))
+    assert types == [weakest]
+
+
+def test_generate_high_level_groups():
+    for level in (90, 100):
+        group, target_power, _ = MonsterGroup.generate(level)
+        assert 1 <= len(group.monsters) <= 5
+        assert target_power > 0
+
+
+def test_unweighted_compositions_are_uniform():
+    monster_types = Monster.monster_types[:2]
+    composer = EncounterComposer(monster_types, max_monsters=2, weighted=False)
+    top = 2 * max(composer.expected_power(1, mt) for mt in monster_types)
+    rng = random.Random(0)
+    seen = Counter(
+        tuple(sorted(mt.name for mt in composer.compose(1, 0, top, rng=rng)))
+        for _ in range(5000)
+    )
+    # {A}, {B}, {A, A}, {A, B}, {B, B}: each multiset counts once
+    assert len(seen) == 5
+    for count in seen.values():
+        assert count == pytest.approx(1000, rel=0.1)
@@ -0,0 +1,60 @@
+import sys
+import os
+import random
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest  # noqa: E402
+from deckdeep.events import (  # noqa: E402
+    EVENT_REGISTRY,
+    Medic,
+    create_event,
+    random_event_key,
+)
+from deckdeep.game import Node  # noqa: E402
+from deckdeep.relic import ALL_RELICS  # noqa: E402
+
+
+def test_registry_metadata_matches_the_events():
+    assert len(EVENT_REGISTRY) == 11
+    for key, info in EVENT_REGISTRY.items():
+        assert info.key == key == info.event_class.__name__
+        assert set(info.relics) <= set(ALL_RELICS)
+        image = f"./assets/images/events/{info.image}.png"
+        assert os.path.exists(image), image
+    assert EVENT_REGISTRY["Medic"].relics == ("Hair of the Dog",)
+
+
+def test_events_read_their_relics_from_the_registry():
+    for key, info in EVENT_REGISTRY.items():
+        event = create_event(key)
+        assert event.info is info and event.name == info.name
+        if info.relics:
+            assert event.relic().name == info.relics[0]
+
+
+def test_weighted_pick_follows_cumulative_weights(monkeypatch):
+    keys = list(EVENT_REGISTRY)
+    total = sum(info.weight for info in EVENT_REGISTRY.values())
+    monkeypatch.setattr(random, "random", lambda: 0.0)
+    assert random_event_key() == keys[0]
+    monkeypatch.setattr(random, "random", lambda: 1 - 1e-9)
+    assert random_event_key() == keys[-1]
+    # Just past the first event's share of the total weight
+    first = EVENT_REGISTRY[keys[0]].weight
+    monkeypatch.setattr(random, "random", lambda: first / total + 1e-9)
+    assert random_event_key() == keys[1]
+
+
+def test_event_nodes_construct_their_event_on_first_access():
+    node = Node("event", 1, 2, 2, {"event": "Medic"})
+    restored = Node.from_dict(node.to_dict())
+    assert restored.content["event"] == "Medic"  # still just the key
+
+    event = restored.get_event()
+    assert isinstance(event, Medic)
+    assert restored.get_event() is event
+    assert restored.to_dict()["content"]["event"] == "Medic"
+
+    with pytest.raises(KeyError):
+        Node.from_dict({**node.to_dict(), "content": {"event": "Nope"}})
@@ -1,5 +1,6 @@
 import sys
 import os
+import numpy as np
 import pygame
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -8,6 +9,8 @@ import pytest  # noqa: E402
 from unittest.mock import Mock, patch  # noqa: E402
 from deckdeep.game import Game  # noqa: E402
 from deckdeep.player import Player  # noqa: E402
+from deckdeep.card import Card, Rarity  # noqa: E402
+from deckdeep.monster import Monster  # noqa: E402
 from deckdeep.monster_group import MonsterGroup  # noqa: E402
 from deckdeep.logger import GameLogger  # noqa: E402
 from deckdeep.custom_types import Health, Energy  # noqa: E402
@@ -47,6 +50,7 @@ def game(mock_screen, mock_logger):
         game.player.max_health.value = 100
         game.player.shield = 0
         game.player.relics = []
+        game.player.relics_for.return_value = []
         game.player.hp_regain_per_level = 10
         game.player.is_dying = False
         game.player.shake = 0
@@ -92,6 +96,7 @@ def test_new_game(game):
     ), patch("deckdeep.game.Player.create") as mock_create:
         mock_player = Mock(spec=Player)
         mock_player.relics = []
+        mock_player.relics_for.return_value = []
         mock_player.is_dying = False
         mock_create.return_value = mock_player
         mock_generate.return_value = Mock()
@@ -173,6 +178,78 @@ def test_monster_group_attack(game):
     mock_monster2.attack.assert_called_once_with(game.player)
 
 
+# Ratings from the per-ability formulas before power_rating was precomputed,
+# for stat rolls (max_health, damage, spell_power) where the floors and
+# rounding of those formulas matter
+LEGACY_POWER_RATINGS = {
+    "Zombie_1": {(55, 18, 13): 75.16666666666666, (7, 3, 2): 1.8666666666666667},
+    "witch_1": {(55, 18, 13): 165.0, (7, 3, 2): 3.3833333333333333},
+    "Guardian_2": {(55, 18, 13): 110.91666666666666, (7, 3, 2): 1.8666666666666667},
+    "troll_king": {(113, 17, 21): 331.4666666666667, (7, 3, 2): 3.441666666666667},
+    "corrupted_paladin": {
+        (18, 10, 7): 21.900000000000002,
+        (7, 3, 2): 2.916666666666667,
+    },
+}
+
+
+def test_monster_power_ratings_match_the_legacy_formulas():
+    monster_types = {mt.name: mt for mt in Monster.monster_types + Monster.boss_types}
+    for name, ratings in LEGACY_POWER_RATINGS.items():
+        monster_type = monster_types[name]
+        for (max_health, damage, spell_power), rating in ratings.items():
+            monster = Monster.generate(1, monster_type=monster_type)
+            monster.max_health = Health(max_health)
+            monster.damage, monster.spell_power = damage, spell_power
+            assert monster.calculate_power_rating() == rating
+
+        # The batch path gives the same ratings
+        rolls = np.array(list(ratings), dtype=float)
+        batch = monster_type.power_rating(rolls[:, 0], rolls[:, 1], rolls[:, 2])
+        assert list(batch) == pytest.approx(list(ratings.values()), rel=1e-12)
+
+
+def test_multi_hit_card_stacks_effects_per_hit():
+    player = Player.create("Hero", 100, "@")
+    group = MonsterGroup(
+        [Monster.generate(5, monster_type="goblin_1") for _ in range(3)]
+    )
+    group.monsters[0].health = Health(1)
+    card = Card("Storm", 1, Rarity.RARE, damage=1, num_attacks=2, bleed=2, bolster=1)
+    player.hand = [card]
+    player.play_card(card, group)
+
+    # The first hit kills the selected goblin, the second moves on to the next
+    bleeds = [
+        sum(e.value for e in m.status_effects.effects if e.name == "Bleed")
+        for m in group.monsters
+    ]
+    assert bleeds == [2, 2, 0]
+    assert [(e.name, e.value) for e in player.status_effects.effects] == [
+        ("Bolster", 2)
+    ]
+
+
+def test_alive_index_follows_deaths():
+    group = MonsterGroup(
+        [Monster.generate(5, monster_type="goblin_1") for _ in range(3)]
+    )
+    first, second, third = group.monsters
+    group.select_next()
+    assert group.get_selected_monster() is second
+
+    second.receive_damage(10_000)
+    assert group.alive_monsters == [first, third]
+    # The index stays put, so the selection moves on to the next monster
+    assert group.get_selected_monster() is third
+    assert third.selected and not second.selected
+
+    third.is_dying = True
+    assert group.alive_monsters == [first]
+    second.health = Health(5)
+    assert group.alive_monsters == [first, second]
+
+
 def test_apply_relic_effects(game):
     mock_relic = Mock()
     mock_relic.trigger_when = "ON_TURN_START"
@@ -318,6 +395,25 @@ def test_initialize_combat(game):
     mock_monster_group.decide_action.assert_called_once_with(game.player)
 
 
+def test_only_card_plays_that_happen_are_checkpointed(game):
+    card = Card("Strike", 5, Rarity.COMMON, damage=6)
+    game.player.hand = [card]
+    game.player.play_card.return_value = 0
+    game.monster_group.get_selected_monster.return_value = Mock(is_dying=False)
+    game.checkpoint = Mock()
+    game.update_combat = Mock()
+
+    game.player.can_play_card.return_value = False
+    game.selected_card = 0
+    game.play_card()
+    game.checkpoint.assert_not_called()
+
+    game.player.can_play_card.return_value = True
+    game.selected_card = 0
+    game.play_card()
+    game.checkpoint.assert_called_once_with("play Strike")
+
+
 def test_monster_intentions(game):
     mock_monster = Mock()
     game.monster_group.monsters = [mock_monster]
@@ -0,0 +1,41 @@
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from deckdeep.config import SCREEN_HEIGHT, SCREEN_WIDTH  # noqa: E402
+from deckdeep.layout import Layout, get_layout, set_resolution  # noqa: E402
+from deckdeep.render_cache import render_cache  # noqa: E402
+
+
+def test_slots_are_computed_once_per_count():
+    layout = Layout.for_resolution(1200, 800)
+    slots = layout.card_slots(5)
+    assert layout.card_slots(5) is slots
+    xs = [x for x, _ in slots]
+    # Centred, evenly spaced and all on the same row
+    assert xs[0] == 1200 - (xs[-1] + layout.card_width)
+    assert len({b - a for a, b in zip(xs, xs[1:])}) == 1
+    assert {y for _, y in slots} == {layout.hand_y}
+
+    grid = layout.monster_grid(5)
+    assert [slot.y for slot in grid.slots] == [grid.slots[0].y] * 3 + [
+        grid.slots[3].y
+    ] * 2
+    # Each row is right-aligned against the same margin
+    assert grid.slots[2].x + layout.unit_size == 1200 - layout.monster_margin
+    assert grid.slots[4].x + layout.unit_size == 1200 - layout.monster_margin
+
+
+def test_set_resolution_rebuilds_layout_and_drops_caches():
+    default = get_layout()
+    assert (default.width, default.height) == (SCREEN_WIDTH, SCREEN_HEIGHT)
+    render_cache.get(("layer", "test"), lambda: object())
+    try:
+        small = set_resolution(800, 600)
+        assert get_layout() is small
+        assert small.card_width < default.card_width
+        assert ("layer", "test") not in render_cache
+    finally:
+        set_resolution(SCREEN_WIDTH, SCREEN_HEIGHT)
+    assert get_layout() == default
@@ -0,0 +1,61 @@
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame  # noqa: E402
+import pytest  # noqa: E402
+from conftest import write_silence  # noqa: E402
+from deckdeep.music_manager import BackgroundMusicManager, scan_music  # noqa: E402
+
+
+@pytest.fixture
+def music_directory(tmp_path):
+    for name in ("a.wav", "b.wav", "c.wav"):
+        write_silence(tmp_path / name)
+    (tmp_path / "notes.txt").write_text("not music")
+    pygame.mixer.init()
+    yield str(tmp_path)
+    pygame.mixer.quit()
+
+
+def test_directory_is_scanned_once(music_directory):
+    files = scan_music(music_directory)
+    assert len(files) == 3
+    assert scan_music(music_directory) is files
+    assert sorted(BackgroundMusicManager(music_directory).music_files) == list(files)
+
+
+def test_decodes_the_next_track_only_near_the_end(music_directory):
+    manager = BackgroundMusicManager(
+        music_directory, crossfade_ms=200, decode_margin_ms=300
+    )
+    with manager:
+        first = manager._current
+        assert first is not None and manager._channels[manager._active].get_busy()
+        manager.update()
+        assert manager._current is first and manager._next is None
+
+        # Within the decode margin: decode, but keep playing the current track
+        manager._started_at -= 600
+        manager.update()
+        assert manager._current is first and manager._next is not None
+        manager._next.result()  # let the worker finish decoding
+
+        manager._started_at -= manager._length_ms
+        previous_channel = manager._active
+        manager.update()
+        assert manager._current is not first
+        assert manager._active != previous_channel
+        assert manager._next is None
+
+        # A track decoded before the run ends is kept for the next run
+        manager._started_at -= 600
+        manager.update()
+        assert manager._next is not None
+        ready = manager._next.result()
+
+    with manager:
+        assert manager._current is ready
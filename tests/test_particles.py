@@ -0,0 +1,34 @@
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+from deckdeep.particles import ParticleSystem  # noqa: E402
+
+
+def test_particles_move_shrink_and_expire():
+    particles = ParticleSystem(gravity=100)
+    particles.emit(10, 50, 50, speed=0, sizes=(10, 10), lifetime=1.0)
+    particles.emit(5, 0, 0, speed=0, sizes=(4, 4), lifetime=0.25)
+    assert len(particles) == 15
+
+    particles.update(0.5)
+    # The short-lived batch is culled, the rest has fallen and halved in size
+    assert len(particles) == 10
+    assert np.allclose(particles.positions, [50, 75])
+    assert (particles.sizes() == 5).all()
+
+    particles.update(0.5)
+    assert len(particles) == 0
+
+
+def test_emission_respects_capacity_and_palette():
+    particles = ParticleSystem(capacity=8)
+    red, blue = (255, 0, 0), (0, 0, 255)
+    particles.emit(6, 0, 0, 100, 100, colors=(red, blue))
+    particles.emit(6, 0, 0, colors=(blue,))
+    assert len(particles) == 8
+    assert particles.palette == [red, blue]
+    assert set(particles.colors[6:].tolist()) == {1}
+    assert ((particles.positions >= 0) & (particles.positions <= 100)).all()
@@ -0,0 +1,96 @@
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from deckdeep.card import Card, Rarity  # noqa: E402
+from deckdeep.custom_types import Energy, Health  # noqa: E402
+from deckdeep.monster import Monster  # noqa: E402
+from deckdeep.monster_group import MonsterGroup  # noqa: E402
+from deckdeep.player import Player  # noqa: E402
+from deckdeep.policy import (  # noqa: E402
+    BeamSearchPolicy,
+    TranspositionTable,
+    capture,
+    card_model,
+    play,
+)
+
+
+def make_monster(health: int, damage: int = 5) -> Monster:
+    monster = Monster.generate(1, monster_type="goblin_1")
+    monster.health = monster.max_health = Health(health)
+    monster.damage = damage
+    return monster
+
+
+def test_play_matches_player_play_card():
+    player = Player.create("Hero", 100, "@")
+    boon = Card("Boon", 0, Rarity.COMMON, bonus_damage=2)
+    cleave = Card("Cleave", 2, Rarity.UNCOMMON, damage=6, targets_all=True, bleed=1)
+    player.hand = [boon, cleave]
+    monsters = [make_monster(20), make_monster(5)]
+    monsters[0].shields = 3
+    group = MonsterGroup(list(monsters))
+
+    state, context = capture(player, monsters)
+    for card in (boon, cleave):
+        definition_id, model = card_model(card)
+        next_state = play(state, definition_id, model, 0, context)
+        assert next_state is not None
+        state = next_state
+        player.play_card(card, group)
+
+    assert [m.health for m in state.monsters] == [m.health.value for m in monsters]
+    assert [m.shields for m in state.monsters] == [m.shields for m in monsters]
+    assert [m.bleed for m in state.monsters] == [1, 1]
+    assert state.energy == player.energy.value
+    assert state.hand == ()
+
+
+def test_multi_hit_follows_the_games_retargeting():
+    player = Player.create("Hero", 100, "@")
+    flurry = Card("Flurry", 1, Rarity.COMMON, damage=3, num_attacks=4)
+    player.hand = [flurry]
+    monsters = [make_monster(30), make_monster(3), make_monster(30)]
+    group = MonsterGroup(list(monsters))
+    group.selected_index = 1
+
+    state, context = capture(player, monsters)
+    definition_id, model = card_model(flurry)
+    next_state = play(state, definition_id, model, 1, context)
+    player.play_card(flurry, group)
+
+    assert next_state is not None
+    # The middle monster dies on the first hit and the rest land on its right
+    assert [m.health for m in next_state.monsters] == [30, 0, 21]
+    assert [m.health for m in next_state.monsters] == [m.health.value for m in monsters]
+
+
+def test_search_prefers_lethal_over_block():
+    player = Player.create("Hero", 100, "@")
+    strike = Card("Power Strike", 2, Rarity.COMMON, damage=15)
+    shield = Card("Shield", 2, Rarity.COMMON, shield=6)
+    player.hand = [shield, strike]
+    player.energy = Energy(2)
+    group = MonsterGroup([make_monster(15, damage=6)])
+
+    assert BeamSearchPolicy()(player, group) is strike
+
+
+def test_search_stops_at_time_budget():
+    player = Player.create("Hero", 100, "@")
+    player.hand = [Card("Jab", 0, Rarity.COMMON, damage=1) for _ in range(7)]
+    policy = BeamSearchPolicy(beam_width=64, time_budget=0)
+    result = policy.search(player, [make_monster(50) for _ in range(5)])
+    assert not result.complete
+    assert result.nodes <= 5
+
+
+def test_transposition_table_is_bounded():
+    table = TranspositionTable(capacity=2)
+    for key in "abc":
+        table.put(key, 1.0)
+    assert len(table) == 2
+    assert table.get("a") is None
+    assert table.get("c") == 1.0
@@ -0,0 +1,49 @@
+import sys
+import os
+import pickle
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from deckdeep.player import Player  # noqa: E402
+from deckdeep.relic import (  # noqa: E402
+    ALL_RELICS,
+    RELIC_EFFECTS,
+    Relic,
+    TriggerWhen,
+    get_relic_by_name,
+)
+
+
+def test_relics_are_dispatched_by_trigger():
+    player = Player.create("Hero", 100, "@")
+    for name in ("Shield Rune", "Healing Charm", "Cursed Dagger"):
+        player.add_relic(get_relic_by_name(name))
+    assert [r.name for r in player.relics_for(TriggerWhen.START_OF_TURN)] == [
+        "Shield Rune",
+        "Cursed Dagger",
+    ]
+    assert player.relics_for(TriggerWhen.ON_DEATH) == []
+
+    # Appending directly still reaches the dispatch lists
+    player.relics.append(get_relic_by_name("Energy Crystal"))
+    assert len(player.relics_for(TriggerWhen.START_OF_COMBAT)) == 2
+
+    player.shield = 0
+    player.apply_relic_effects(TriggerWhen.START_OF_TURN)
+    assert player.shield == 3
+
+
+def test_players_with_every_relic_pickle():
+    player = Player.create("Hero", 100, "@")
+    for name in ALL_RELICS:
+        player.add_relic(get_relic_by_name(name))
+    clone = pickle.loads(pickle.dumps(player))
+
+    assert [r.name for r in clone.relics] == list(ALL_RELICS)
+    assert clone.strength == player.strength
+    clone.shield = 0
+    clone.apply_relic_effects(TriggerWhen.START_OF_TURN)
+    assert clone.shield == 3
+
+    saved = Relic.from_dict(player.relics[0].to_dict())
+    assert saved.effect is RELIC_EFFECTS["gain_max_health"]
@@ -0,0 +1,205 @@
+"""Render-cost benchmarks for the full screens in deckdeep.render.
+
+Each screen is drawn under SDL's dummy video driver through a RecordingRenderer
+wrapping the real pygame backend, against a representative state: a full hand,
+five monsters with four status effects each and a 60-card deck. Per-screen
+allocations are compared against tests/render_baseline.json and must not grow.
+Frame times are reported, and only checked against the baseline when
+RENDER_BENCHMARK_STRICT is set since they depend on the machine.
+
+Set RENDER_BENCHMARK_UPDATE=1 to rewrite the baseline from the current tree.
+"""
+
+import sys
+import os
+import json
+import random
+import statistics
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame  # noqa: E402
+import pytest  # noqa: E402
+from deckdeep.assets import GameAssets  # noqa: E402
+from deckdeep.card import Card  # noqa: E402
+from deckdeep.config import SCREEN_HEIGHT, SCREEN_WIDTH  # noqa: E402
+from deckdeep.game import Node  # noqa: E402
+from deckdeep.monster import Monster  # noqa: E402
+from deckdeep.monster_group import MonsterGroup  # noqa: E402
+from deckdeep.player import Player  # noqa: E402
+from deckdeep.relic import ALL_RELICS, get_relic_by_name  # noqa: E402
+from deckdeep.render import (  # noqa: E402
+    render_card_selection,
+    render_combat_state,
+    render_deck_view,
+    render_node_selection,
+    render_relic_selection,
+    render_text_event,
+    render_victory_state,
+)
+from deckdeep.renderer import (  # noqa: E402
+    PygameRenderer,
+    RecordingRenderer,
+    use_renderer,
+)
+from deckdeep.simulation import quiet  # noqa: E402
+from deckdeep.status_effect import Bleed, Bolster, Burn, Weakness  # noqa: E402
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "render_baseline.json")
+ROUNDS = int(os.environ.get("RENDER_BENCHMARK_ROUNDS", "10"))
+UPDATE = bool(os.environ.get("RENDER_BENCHMARK_UPDATE"))
+STRICT = bool(os.environ.get("RENDER_BENCHMARK_STRICT"))
+TIME_TOLERANCE = 1.5
+
+DECK_SIZE = 60
+MONSTERS = 5
+
+
+@pytest.fixture(scope="module")
+def screen():
+    pygame.init()
+    # No pygame.quit() here: render.py's module-level fonts must stay valid
+    return pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+
+@pytest.fixture(scope="module")
+def assets(screen):
+    return GameAssets()
+
+
+@pytest.fixture(scope="module")
+def state():
+    random.seed(0)
+    with quiet():
+        player = Player.create("Hero", 100, "@")
+        while len(player.deck_index) < DECK_SIZE:
+            player.add_card_to_deck(Card.generate_card_pool(1)[0])
+        player.shuffle_deck()
+        while len(player.hand) < player.hand_limit:
+            player.draw_card()
+        group = MonsterGroup(
+            [Monster.generate(5, monster_type="goblin_1") for _ in range(MONSTERS)]
+        )
+        for monster in group.monsters:
+            for effect in (Bleed(3), Burn(2), Weakness(1), Bolster(2)):
+                monster.status_effects.add_effect(effect)
+        group.decide_action(player)
+    nodes = [Node(kind, 1, 2, 2) for kind in ("combat", "event", "rest", "elite")]
+    relics = [get_relic_by_name(name) for name in list(ALL_RELICS)[:3]]
+    return player, group, nodes, relics
+
+
+def screens(screen, assets, state):
+    player, group, nodes, relics = state
+    deck = player.get_sorted_full_deck()
+    played = list(player.hand)[:2]
+    return {
+        "combat_state": lambda: render_combat_state(
+            screen, player, group, "1:1", 0, 0, assets, played
+        ),
+        "deck_view": lambda: render_deck_view(
+            screen, deck, 0, 4, assets, player, player.deck_index.stats()
+        ),
+        "node_selection": lambda: render_node_selection(screen, nodes, 0, assets),
+        "relic_selection": lambda: render_relic_selection(screen, relics, 0, assets),
+        "text_event": lambda: render_text_event(
+            screen,
+            "AncientLibrary",
+            "Dusty shelves hold forgotten knowledge.",
+            ["Read a tome", "Take a scroll", "Leave"],
+            assets,
+            player,
+        ),
+        "card_selection": lambda: render_card_selection(
+            screen, deck, 0, assets, player
+        ),
+        "victory_state": lambda: render_victory_state(
+            screen, 100, deck[:3], 0, assets, player
+        ),
+    }
+
+
+SCREENS = [
+    "combat_state",
+    "deck_view",
+    "node_selection",
+    "relic_selection",
+    "text_event",
+    "card_selection",
+    "victory_state",
+]
+
+
+@pytest.fixture(scope="module")
+def results(request):
+    results: dict = {}
+    yield results
+    if UPDATE and results:
+        with open(BASELINE_PATH, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+            f.write("\n")
+    plugins = request.config.pluginmanager
+    reporter = plugins.get_plugin("terminalreporter")
+    capture = plugins.get_plugin("capturemanager")
+    if reporter is None or capture is None or not results:
+        return
+    with capture.global_and_fixture_disabled():
+        reporter.write_line("")
+        reporter.write_line(f"{'screen':<18}{'frame ms':>10}{'allocs':>8}{'blits':>8}")
+        for name, result in results.items():
+            reporter.write_line(
+                f"{name:<18}{result['frame_ms']:>10.2f}"
+                f"{result['allocations']:>8}{result['blits']:>8}"
+            )
+
+
+def load_baseline() -> dict:
+    if not os.path.exists(BASELINE_PATH):
+        return {}
+    with open(BASELINE_PATH) as f:
+        return json.load(f)
+
+
+@pytest.mark.parametrize("name", SCREENS)
+def test_render_cost(name, screen, assets, state, results):
+    render = screens(screen, assets, state)[name]
+    recorder = RecordingRenderer(PygameRenderer())
+    times = []
+    with use_renderer(recorder):
+        render()  # warm up fonts and lazily loaded images
+        recorder.reset()
+        for _ in range(ROUNDS):
+            start = time.perf_counter()
+            render()
+            times.append(time.perf_counter() - start)
+
+    frames = recorder.frames
+    assert len(frames) == ROUNDS
+    assert len({frame.allocations for frame in frames}) == 1, "unstable frame"
+    misses = sum(frame.misses for frame in frames)
+    assert misses == 0, f"{name} missed the render caches {misses} times"
+    result = {
+        "frame_ms": round(statistics.median(times) * 1000, 3),
+        "allocations": frames[0].allocations,
+        "blits": frames[0].blits,
+    }
+    results[name] = result
+    if UPDATE:
+        return
+
+    baseline = load_baseline().get(name)
+    if baseline is None:
+        pytest.skip(f"no baseline for {name}; run with RENDER_BENCHMARK_UPDATE=1")
+    assert result["allocations"] <= baseline["allocations"], (
+        f"{name} allocates {result['allocations']} surfaces per frame, "
+        f"baseline {baseline['allocations']}"
+    )
+    if STRICT:
+        assert result["frame_ms"] <= baseline["frame_ms"] * TIME_TOLERANCE, (
+            f"{name} takes {result['frame_ms']:.2f} ms per frame, "
+            f"baseline {baseline['frame_ms']:.2f} ms"
+        )
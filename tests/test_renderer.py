@@ -0,0 +1,141 @@
+import sys
+import os
+import pygame
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest  # noqa: E402
+from deckdeep.assets import GameAssets  # noqa: E402
+from deckdeep.config import SCREEN_HEIGHT, SCREEN_WIDTH  # noqa: E402
+from deckdeep.game import VictorySequence  # noqa: E402
+from deckdeep.monster import Monster  # noqa: E402
+from deckdeep.monster_group import MonsterGroup  # noqa: E402
+from deckdeep.player import Player  # noqa: E402
+from deckdeep.relic import get_relic_by_name  # noqa: E402
+from deckdeep.render import (  # noqa: E402
+    FADE_LEVELS,
+    faded,
+    render_card_selection,
+    render_combat_state,
+    render_deck_view,
+    render_game_over_screen,
+    render_health_bar,
+    render_keybinds,
+    render_menu,
+    render_relic_view,
+    render_start_screen,
+    render_text_event,
+)
+from deckdeep.render_cache import render_cache, sprite_cache  # noqa: E402
+from deckdeep.renderer import (  # noqa: E402
+    NullRenderer,
+    RecordingRenderer,
+    get_renderer,
+    use_renderer,
+)
+
+
+@pytest.fixture(scope="module")
+def screen():
+    pygame.init()
+    # No pygame.quit() here: render.py's module-level fonts must stay valid
+    return pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+
+@pytest.fixture(scope="module")
+def assets(screen):
+    return GameAssets()
+
+
+@pytest.fixture
+def combat():
+    player = Player.create("Hero", 100, "@")
+    player.reset_hand()
+    group = MonsterGroup(
+        [Monster.generate(5, monster_type="goblin_1") for _ in range(3)]
+    )
+    group.decide_action(player)
+    return player, group
+
+
+def test_every_screen_records_one_frame(screen, assets, combat):
+    player, group = combat
+    deck = player.get_sorted_full_deck()
+    screens = [
+        lambda: render_combat_state(screen, player, group, "1:1", 0, 0, assets),
+        lambda: render_deck_view(screen, deck, 0, 1, assets, player),
+        lambda: render_card_selection(screen, deck, 0, assets, player),
+        lambda: render_keybinds(screen, assets),
+        lambda: render_start_screen(screen, assets),
+        lambda: render_game_over_screen(screen, 10, assets),
+        lambda: render_menu(screen, ["New Game", "Quit"], 0, assets),
+        lambda: render_relic_view(screen, [get_relic_by_name("Time Warp")], assets),
+    ]
+    recorder = RecordingRenderer()
+    with use_renderer(recorder):
+        for render in screens:
+            render()
+    assert len(recorder.frames) == len(screens)
+    assert all(frame.presents == 1 and frame.blits for frame in recorder.frames)
+
+    combat_frame = recorder.frames[0]
+    # Every card in hand is a cached face plus its border
+    assert combat_frame.blits >= len(player.hand)
+    assert combat_frame.shapes >= len(player.hand)
+
+
+def test_null_renderer_leaves_the_screen_untouched(screen, assets, combat):
+    player, group = combat
+    previous = get_renderer()
+    screen.fill((1, 2, 3))
+    with use_renderer(NullRenderer()):
+        render_combat_state(screen, player, group, "1:1", 0, 0, assets)
+    assert get_renderer() is previous
+    assert screen.get_at((SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))[:3] == (1, 2, 3)
+
+
+def test_health_bar_is_redrawn_only_when_its_values_change(screen, assets):
+    recorder = RecordingRenderer()
+    misses = sprite_cache.misses
+    with use_renderer(recorder):
+        for health in (40, 40, 40, 39):
+            render_health_bar(screen, 10, 10, 100, 20, health, 50, (255, 0, 0), assets)
+            recorder.present()
+    frames = recorder.frames
+    # Drawing a new bar counts towards the frame that needed it
+    assert [f.misses for f in frames] == [1, 0, 0, 1]
+    assert frames[0].allocations > 0 and frames[3].allocations > 0
+    # A cached bar is one blit and no allocations
+    assert [(f.blits, f.allocations) for f in frames[1:3]] == [(1, 0)] * 2
+    assert sprite_cache.misses - misses == 2
+
+
+def test_only_the_current_event_backdrop_is_kept(screen, assets, combat):
+    player, _ = combat
+    with use_renderer(NullRenderer()):
+        for key in ("Medic", "Priest", "Medic"):
+            render_text_event(screen, key, "", ["Leave"], assets, player)
+    layers = [
+        key for key in list(render_cache._entries) if key[:2] == ("layer", "event")
+    ]
+    assert len(layers) == 1 and "Medic" in layers[0]
+
+
+def test_fades_reuse_quantized_alpha_ramps(screen):
+    image = pygame.Surface((8, 8), pygame.SRCALPHA)
+    image.fill((200, 100, 50, 255))
+    assert faded(image, 255) is image
+    half = faded(image, 128)
+    assert faded(image, 130) is half
+    assert abs(half.get_at((0, 0)).a - 128) <= 255 // FADE_LEVELS
+    assert faded(image, 0).get_at((0, 0)).a == 0
+
+
+def test_victory_sequence_draws_particles_in_one_batch(screen, assets):
+    sequence = VictorySequence(screen, assets)
+    sequence.start()
+    recorder = RecordingRenderer()
+    with use_renderer(recorder):
+        sequence.render()
+    visible = (sequence.particles.sizes() > 0).sum()
+    assert recorder.current.blits == 1 + visible
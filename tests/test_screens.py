@@ -0,0 +1,92 @@
+import sys
+import os
+import pygame
+from typing import List, Optional
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest  # noqa: E402
+from unittest.mock import Mock, patch  # noqa: E402
+from deckdeep.card import Card, Rarity  # noqa: E402
+from deckdeep.screens import (  # noqa: E402
+    CardSelectionScreen,
+    FrameScheduler,
+    KeybindsScreen,
+    NodeSelectionScreen,
+    Screen,
+    ScreenManager,
+)
+
+
+@pytest.fixture
+def manager():
+    return ScreenManager(FrameScheduler(fps=None))
+
+
+def key_event(key):
+    return pygame.event.Event(pygame.KEYDOWN, key=key)
+
+
+def test_push_pop_only_feeds_top_screen(manager):
+    bottom, top = Mock(spec=Screen), Mock(spec=Screen)
+    manager.push(bottom)
+    manager.push(top)
+    manager.handle_event(key_event(pygame.K_q))
+    manager.update()
+    top.handle_event.assert_called_once()
+    top.update.assert_called_once()
+    bottom.handle_event.assert_not_called()
+    assert manager.pop() is top
+    assert manager.top is bottom
+
+
+def test_card_selection_returns_index_in_callers_order(manager):
+    cards = [
+        Card("Zap", 2, Rarity.COMMON),
+        Card("Bash", 1, Rarity.COMMON),
+        Card("Aim", 1, Rarity.COMMON),
+    ]
+    chosen: List[Optional[int]] = []
+    manager.push(CardSelectionScreen(Mock(), cards, chosen.append))
+    # Displayed order is (cost, name): Aim, Bash, Zap
+    manager.handle_event(key_event(pygame.K_j))
+    manager.handle_event(key_event(pygame.K_SPACE))
+    assert chosen == [1]
+    assert not manager
+
+
+def test_node_selection_is_non_blocking(manager):
+    game = Mock()
+    game.current_node.children = [Mock(), Mock()]
+    chosen: List[int] = []
+    manager.push(NodeSelectionScreen(game, chosen.append))
+    for _ in range(3):
+        with manager.frame("node_selection"):
+            manager.update()
+    assert chosen == []
+    manager.handle_event(key_event(pygame.K_w))
+    assert chosen == [1]
+    assert manager.top is None
+
+
+def test_frame_reports_to_instrumentation_hook():
+    hook = Mock()
+    manager = ScreenManager(FrameScheduler(fps=None), instrumentation=hook)
+    with manager.frame("run"):
+        pass
+    name, elapsed = hook.call_args[0]
+    assert name == "run"
+    assert elapsed >= 0
+    assert manager.scheduler.frame_count == 1
+
+
+def test_keybinds_are_redrawn_after_a_display_switch(manager):
+    game = Mock()
+    game.display.switch_times = []
+    screen = manager.push(KeybindsScreen(game))
+    with patch("deckdeep.screens.render_keybinds") as render_keybinds:
+        screen.render(Mock())
+        screen.render(Mock())
+        game.display.switch_times.append(0.1)
+        screen.render(Mock())
+    assert render_keybinds.call_count == 2
@@ -0,0 +1,43 @@
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from deckdeep.custom_types import Health  # noqa: E402
+from deckdeep.monster import Monster  # noqa: E402
+from deckdeep.monster_group import MonsterGroup  # noqa: E402
+from deckdeep.player import Player  # noqa: E402
+from deckdeep.simulation import simulate_combat, simulate_encounters  # noqa: E402
+from deckdeep.tune import ResultCache, measure_type  # noqa: E402
+
+
+def test_simulated_combat_against_weak_monster_is_won():
+    monster = Monster.generate(1, monster_type="goblin_1")
+    monster.health = monster.max_health = Health(5)
+    result = simulate_combat(Player.create("Hero", 100, "@"), MonsterGroup([monster]))
+    assert result.won
+    assert result.turns == 1
+    assert result.damage_dealt == 5
+
+
+def test_simulated_encounters_are_reproducible():
+    first = simulate_encounters(5, runs=3, seed=7)
+    second = simulate_encounters(5, runs=3, seed=7)
+    assert first == second
+
+
+def test_result_cache_only_resimulates_changed_types(tmp_path):
+    cache = ResultCache(str(tmp_path / "cache.json"))
+    goblin = Monster.generate(1, monster_type="goblin_1").monster_type
+    assert goblin is not None
+    measure_type(goblin, 3, 2, 0, cache)
+    measure_type(goblin, 3, 2, 0, cache)
+    assert cache.misses == 1
+
+    original = goblin.health_mult
+    try:
+        goblin.health_mult *= 1.5
+        measure_type(goblin, 3, 2, 0, cache)
+    finally:
+        goblin.health_mult = original
+    assert cache.misses == 2
@@ -0,0 +1,81 @@
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest  # noqa: E402
+from deckdeep.monster import Monster  # noqa: E402
+from deckdeep.monster_group import MonsterGroup  # noqa: E402
+from deckdeep.player import Player  # noqa: E402
+from deckdeep.simulation import quiet, simulate_combat  # noqa: E402
+from deckdeep.snapshot import CombatSnapshot, RewindBuffer  # noqa: E402
+from deckdeep.status_effect import Bleed  # noqa: E402
+
+
+@pytest.fixture
+def combat():
+    player = Player.create("Hero", 100, "@")
+    player.reset_hand()
+    group = MonsterGroup(
+        [Monster.generate(5, monster_type="goblin_1") for _ in range(2)]
+    )
+    group.decide_action(player)
+    return player, group
+
+
+def test_restore_undoes_a_card_play(combat):
+    player, group = combat
+    cards = player.deck + player.hand + player.discard_pile
+    before = CombatSnapshot.capture(player, group)
+
+    card = next(c for c in player.hand if player.can_play_card(c))
+    player.play_card(card, group)
+    player.status_effects.add_effect(Bleed(3))
+    group.monsters[0].receive_damage(1000)
+    group.remove_dead_monsters()
+    assert CombatSnapshot.capture(player, group) != before
+
+    before.restore(player, group)
+    after = CombatSnapshot.capture(player, group)
+    assert after == before
+    assert hash(after) == hash(before)
+    assert after.digest() == before.digest()
+    assert len(group.monsters) == 2
+    # Same Card objects, just moved back between piles
+    restored = player.deck + player.hand + player.discard_pile
+    assert sorted(map(id, restored)) == sorted(map(id, cards))
+
+
+def test_digest_tracks_state(combat):
+    player, group = combat
+    first = CombatSnapshot.capture(player, group)
+    player.shield += 1
+    second = CombatSnapshot.capture(player, group)
+    assert first.digest() != second.digest()
+    assert len(first.digest()) == 32
+
+
+def test_rewind_buffer_is_bounded_and_shares_unchanged_parts(combat):
+    player, group = combat
+    buffer = RewindBuffer(capacity=3)
+    first = buffer.record("start", player, group, 0)
+    player.shield += 5
+    second = buffer.record("shield", player, group, 0)
+    # Only the player's scalars changed
+    assert second.combat.player.hand is first.combat.player.hand
+    assert second.combat.monsters is first.combat.monsters
+
+    for i in range(5):
+        buffer.record(f"turn {i}", player, group, i)
+    assert len(buffer) == 3
+    newest = buffer.pop()
+    assert newest is not None and newest.label == "turn 4"
+
+
+def test_fork_leaves_the_live_combat_untouched(combat):
+    player, group = combat
+    snapshot = CombatSnapshot.capture(player, group)
+    fork_player, fork_group = snapshot.fork(player)
+    with quiet():
+        simulate_combat(fork_player, fork_group, start_of_combat=False)
+    assert CombatSnapshot.capture(player, group) == snapshot
@@ -0,0 +1,40 @@
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame  # noqa: E402
+import pytest  # noqa: E402
+from conftest import write_silence  # noqa: E402
+from deckdeep.sound_bank import EFFECTS, SoundBank  # noqa: E402
+
+
+@pytest.fixture
+def bank(tmp_path):
+    for name in ("card", "hit", "heal"):
+        write_silence(tmp_path / f"{name}.wav")
+    pygame.mixer.init()
+    yield SoundBank(str(tmp_path), channels=2)
+    pygame.mixer.quit()
+
+
+def test_effects_are_loaded_or_synthesized_up_front(bank):
+    assert set(bank.sounds) == set(EFFECTS)
+    assert bank.sounds["hit"].get_length() == pytest.approx(1, abs=0.01)
+    assert 0 < bank.sounds["block"].get_length() < 0.5  # no file: synthesized
+
+
+def test_repeats_are_throttled_and_busy_voices_stolen_by_priority(bank, monkeypatch):
+    now = [1000]
+    monkeypatch.setattr(pygame.time, "get_ticks", lambda: now[0])
+    assert bank.play("hit")
+    assert not bank.play("hit")  # the rest of an AOE volley
+    now[0] += EFFECTS["hit"].throttle_ms
+    assert bank.play("hit")
+
+    now[0] += 10
+    assert not bank.play("card")  # both channels busy with higher priority
+    assert bank.play("heal")  # steals the older hit
+    assert bank._priorities == [EFFECTS["heal"].priority, EFFECTS["hit"].priority]